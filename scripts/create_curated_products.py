@@ -409,8 +409,7 @@ def main():
     # 投稿済み商品履歴をクリア（オプション）
     clear_history = input("\n投稿済み商品履歴をクリアしますか？ (y/n): ").lower()
     if clear_history == 'y':
-        product_manager.posted_asins = []
-        product_manager.save_posted_asins()
+        product_manager.clear_posted_asins()
         print("✓ 投稿済み商品履歴をクリアしました")
 
     print("\n" + "=" * 60)
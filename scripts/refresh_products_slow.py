@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """
 PA-APIレート制限を考慮した商品データ更新スクリプト
-12秒間隔でリクエストを送信し、安全に100個の商品を取得
-（PA-API 5.0の制限: 10秒に1リクエスト + 安全マージン2秒）
+クライアントのレートリミッターでリクエスト間隔を調整し、安全に100個の商品を取得
+（PA-API 5.0の制限: 10秒に1リクエスト。429エラー時は間隔を自動で広げる）
+
+1リクエストごとに進捗を data/refresh_checkpoint.json に保存し、中断後に再実行すると続きから再開する
+（商品データは最後にまとめて置き換える）
+
+--known-asins を指定すると、登録済み商品の価格・画像などだけをGetItems（10件ずつ）で更新する
 """
 import os
 import sys
@@ -15,14 +20,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from amazon_paapi_client import AmazonPAAPIClient
 from amazon_scraper import AmazonProductManager
+from refresh_checkpoint import RefreshCheckpoint
 
 
 def main():
     """メイン処理"""
     print("=" * 70)
     print("PA-APIから現在販売中の商品を100個取得します")
-    print("レート制限を考慮し、12秒間隔でリクエストを送信します")
-    print("（PA-API 5.0の制限: 10秒に1リクエスト + 安全マージン2秒）")
+    print("レート制限を考慮し、レートリミッターでリクエスト間隔を調整します")
+    print("（PA-API 5.0の制限: 10秒に1リクエスト）")
     print("=" * 70)
 
     # 環境変数チェック
@@ -38,6 +44,15 @@ def main():
 
     print("✓ PA-API認証情報が設定されています\n")
 
+    # --known-asins: 商品リストは置き換えず、登録済み商品の価格・画像などだけをGetItemsで更新
+    if '--known-asins' in sys.argv[1:]:
+        products_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'products.json')
+        product_manager = AmazonProductManager(products_file)
+        start_time = time.time()
+        summary = product_manager.refresh_known_asins(AmazonPAAPIClient())
+        print(f"所要時間: {time.time() - start_time:.1f}秒（対象: {summary['requested']}件、更新: {summary['updated']}件）")
+        return 0
+
     try:
         # PA-APIクライアント初期化
         print("PA-APIクライアントを初期化中...")
@@ -45,62 +60,75 @@ def main():
         print("✓ PA-APIクライアントの初期化に成功しました\n")
 
         # 商品を取得（レート制限を考慮）
-        print("商品検索を開始します（12秒間隔）...")
+        print(f"商品検索を開始します（{paapi_client.rate_limiter.interval:.0f}秒間隔、"
+              f"マーケットプレイス: {', '.join(paapi_client.marketplaces)}）...")
         print("推定所要時間: 約20-25分\n")
 
-        new_products = []
+        # 前回中断した更新があれば続きから再開
+        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+        checkpoint = RefreshCheckpoint(os.path.join(data_dir, 'refresh_checkpoint.json'))
+        if checkpoint.load():
+            print(f"✓ 前回の更新を再開します（開始: {checkpoint.started_at}、"
+                  f"検索済み: {len(checkpoint.completed)}件、取得済み: {len(checkpoint.products)}個）")
+            if checkpoint.limiter_state:
+                paapi_client.restore_limiter_state(checkpoint.limiter_state)
+
         categories = list(paapi_client.SEARCH_KEYWORDS.keys())
-        total_requests = 0
-        start_time = time.time()
+        start_time = time.time() - checkpoint.elapsed_seconds
 
         for category_idx, category in enumerate(categories):
             keywords = paapi_client.SEARCH_KEYWORDS[category]
             print(f"\n[{category_idx + 1}/{len(categories)}] カテゴリー: {category}")
 
             for keyword_idx, keyword in enumerate(keywords):
-                if len(new_products) >= 100:
+                if len(checkpoint.products) >= 100:
                     print(f"\n✓ 目標の100個に到達しました")
                     break
 
-                # リクエスト前に待機（最初のリクエストは待機不要）
-                if total_requests > 0:
-                    wait_time = 12.0  # PA-API 5.0の制限: 10秒 + 安全マージン2秒
-                    elapsed = time.time() - start_time
-                    expected_time = total_requests * wait_time
-                    if elapsed < expected_time:
-                        sleep_time = expected_time - elapsed
-                        print(f"  ⏳ {sleep_time:.1f}秒待機中...", end='\r')
-                        time.sleep(sleep_time)
-
-                # 商品検索実行
+                if checkpoint.is_done(category, keyword):
+                    continue
+
+                # 商品検索実行（リクエスト間隔はクライアントのレートリミッターが管理）
                 print(f"  [{keyword_idx + 1:2d}/{len(keywords):2d}] '{keyword}' を検索中...", end=' ')
+                # キャッシュから返した検索はリクエスト数に含めない
+                api_calls_before = paapi_client.api_calls
 
                 try:
-                    products = paapi_client.search_products(
+                    # 複数のマーケットプレイスを設定している場合は並行して検索し、ASINごとにマージ
+                    products = paapi_client.search_all_marketplaces(
                         keyword=keyword,
                         category=category,
                         max_results=5  # 各キーワードから5個まで取得
                     )
-                    total_requests += 1
 
-                    if products:
-                        # 重複チェックしながら追加
-                        existing_asins = {p.asin for p in new_products}
-                        unique_new = [p for p in products if p.asin not in existing_asins]
-                        new_products.extend(unique_new)
+                    # 応答を得られた場合のみ検索済みとして進捗を保存（重複は除いて追加）
+                    # 取得に失敗した場合は PAAPISearchError になり、検索済みにしない
+                    added = checkpoint.record(
+                        category,
+                        keyword,
+                        products,
+                        elapsed_seconds=time.time() - start_time,
+                        limiter_state=paapi_client.limiter_state(),
+                        api_calls=paapi_client.api_calls - api_calls_before
+                    )
 
-                        print(f"✓ {len(unique_new)}個取得 (合計: {len(new_products)}個)")
+                    if products:
+                        print(f"✓ {added}個取得 (合計: {len(checkpoint.products)}個)")
                     else:
                         print("商品なし")
 
                 except Exception as e:
                     print(f"✗ エラー: {str(e)[:50]}")
-                    # エラー後も続行
+                    # 失敗した検索も実際に呼び出した分はリクエスト数に含める（次の記録で保存される）
+                    checkpoint.total_requests += paapi_client.api_calls - api_calls_before
+                    # エラー後も続行（このキーワードは再開時に再検索する）
                     continue
 
-            if len(new_products) >= 100:
+            if len(checkpoint.products) >= 100:
                 break
 
+        new_products = checkpoint.get_products()
+        total_requests = checkpoint.total_requests
         elapsed_time = time.time() - start_time
         print(f"\n" + "=" * 70)
         print(f"検索完了: {total_requests}回のリクエスト、{elapsed_time:.1f}秒経過")
@@ -131,10 +159,10 @@ def main():
             shutil.copy(products_file, backup_file)
             print(f"✓ 既存データをバックアップしました: {backup_file}")
 
-        # 新しい商品データを保存
-        product_manager.products = final_products
-        product_manager.save_products()
+        # 既存の商品データに差分マージして保存（投稿済み状態は維持）
+        summary = product_manager.merge_products(final_products)
         print(f"✓ 商品データを保存しました: {products_file}")
+        print(f"  {summary.describe()}")
 
         # メタデータを更新
         metadata = {
@@ -142,15 +170,14 @@ def main():
             'refresh_count': product_manager.load_metadata().get('refresh_count', 0) + 1,
             'auto_refresh': True,
             'total_requests': total_requests,
-            'elapsed_seconds': int(elapsed_time)
+            'elapsed_seconds': int(elapsed_time),
+            'merge_summary': summary.to_dict()
         }
         product_manager.save_metadata(metadata)
         print("✓ メタデータを更新しました")
 
-        # 投稿済み商品履歴をクリア
-        product_manager.posted_asins = []
-        product_manager.save_posted_asins()
-        print("✓ 投稿済み商品履歴をクリアしました")
+        # 更新の完了を記録（次回は最初から実行する）
+        checkpoint.finish()
 
         print("\n" + "=" * 70)
         print("商品データの更新が完了しました！")
@@ -170,13 +197,24 @@ def main():
         print(f"\n統計情報:")
         print(f"  総リクエスト数: {total_requests}回")
         print(f"  所要時間: {elapsed_time:.1f}秒 ({elapsed_time/60:.1f}分)")
-        print(f"  平均間隔: {elapsed_time/total_requests:.2f}秒/リクエスト")
+        if total_requests:
+            print(f"  平均間隔: {elapsed_time/total_requests:.2f}秒/リクエスト")
+        print(f"  レート制限による待機: {paapi_client.total_wait:.1f}秒")
+
+        # PA-APIのレスポンスに含まれていなかった項目
+        field_stats = paapi_client.field_stats()
+        if field_stats['misses']:
+            print(f"\n欠損した項目（{field_stats['items']}件中）:")
+            for field, count in sorted(field_stats['misses'].items(), key=lambda x: -x[1]):
+                print(f"  {field}: {count}件")
+        if field_stats['failures']:
+            print(f"処理中のエラーでスキップした商品: {field_stats['failures']}件")
 
         return 0
 
     except KeyboardInterrupt:
         print("\n\n中断されました。")
-        print("部分的に取得した商品データは保存されていません。")
+        print("取得済みの商品はチェックポイントに保存されています。再実行すると続きから再開します。")
         sys.exit(1)
 
     except Exception as e:
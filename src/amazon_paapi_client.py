@@ -4,8 +4,10 @@ Amazon PA-API クライアント
 """
 import os
 import random
-import time
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
 
 try:
     from amazon_paapi import AmazonApi
@@ -14,6 +16,16 @@ except ImportError:
     from amazon.paapi import AmazonAPI as AmazonApi
 
 from amazon_scraper import GadgetProduct
+from brand_matcher import BrandMatcher
+from name_normalizer import normalize_product_name
+from paapi_fields import FieldExtractor
+from paapi_cache import PAAPICache
+from paapi_marketplace import Marketplace, load_marketplaces, region_for_url
+from product_scheduler import KeywordScheduler
+
+
+class PAAPISearchError(Exception):
+    """PA-APIの検索に失敗した（レート制限のリトライ切れ・APIエラーなどで応答を得られなかった）"""
 
 
 class AmazonPAAPIClient:
@@ -21,7 +33,7 @@ class AmazonPAAPIClient:
 
     # 大手メーカーリスト
     MAJOR_BRANDS = [
-        "Logitech", "ロジクール",
+        "Logitech", "Logicool", "ロジクール",
         "Microsoft", "マイクロソフト",
         "Samsung", "サムスン",
         "Crucial", "クルーシャル",
@@ -56,6 +68,9 @@ class AmazonPAAPIClient:
         "Thermaltake", "サーマルテイク",
     ]
 
+    # 大手メーカーの照合器（クラス定義時に1回だけ構築）
+    MAJOR_BRAND_MATCHER = BrandMatcher(MAJOR_BRANDS)
+
     # 検索キーワードリスト（カテゴリー別）
     SEARCH_KEYWORDS = {
         "PC周辺機器": [
@@ -94,50 +109,91 @@ class AmazonPAAPIClient:
         ],
     }
 
-    def __init__(self):
-        """初期化"""
-        print("PA-API クライアントを初期化中...")
+    # 商品（Item）から取り出す項目のパス（SDKの属性名。生のJSONではパスカルケースのキーとして読む）
+    ITEM_FIELD_PATHS = {
+        'asin': 'asin',
+        'title': 'item_info.title.display_value',
+        'brand': 'item_info.by_line_info.brand.display_value',
+        'price': 'offers.listings[0].price.display_amount',
+        'image_url': 'images.primary.large.url',
+        # display_valuesは既に文字列のリストなので、先頭5件をそのまま使用
+        'features': ('item_info.features.display_values', lambda values: list(values[:5])),
+    }
+
+    # 検索結果キャッシュの有効期間（秒）
+    SEARCH_CACHE_TTL = 7 * 24 * 3600
 
-        # 環境変数からPA-APIの認証情報を取得
-        self.access_key = os.getenv('AMAZON_ACCESS_KEY')
-        self.secret_key = os.getenv('AMAZON_SECRET_KEY')
-        self.associate_tag = os.getenv('AMAZON_ASSOCIATE_TAG')
-        self.region = os.getenv('AMAZON_REGION', 'jp')  # デフォルトは日本
+    def __init__(self, cache_file: Optional[str] = None, offline: Optional[bool] = None):
+        """
+        初期化
 
-        print(f"リージョン: {self.region}")
-        print(f"Access Key設定: {'有' if self.access_key else '無'}")
-        print(f"Secret Key設定: {'有' if self.secret_key else '無'}")
-        print(f"Associate Tag設定: {'有' if self.associate_tag else '無'}")
+        Args:
+            cache_file: レスポンスキャッシュのファイルパス（省略時は環境変数 PAAPI_CACHE_FILE、既定は data/paapi_cache.json）
+            offline: Trueの場合はAPIを呼ばずキャッシュ済みのレスポンスだけを使う（省略時は環境変数 PAAPI_OFFLINE）
+        """
+        print("PA-API クライアントを初期化中...")
 
-        if not all([self.access_key, self.secret_key, self.associate_tag]):
+        # 環境変数からマーケットプレイス（地域ごとの認証情報・タグ・レート制限）を読み込む
+        self.marketplaces: Dict[str, Marketplace] = {
+            marketplace.region: marketplace for marketplace in load_marketplaces()
+        }
+        primary = next(iter(self.marketplaces.values()))
+        self.region = primary.region  # 主のマーケットプレイス
+        self.associate_tag = primary.associate_tag
+
+        for marketplace in self.marketplaces.values():
+            print(f"リージョン: {marketplace.region}（国コード: {marketplace.country}）")
+            print(f"  Access Key設定: {'有' if marketplace.access_key else '無'}")
+            print(f"  Secret Key設定: {'有' if marketplace.secret_key else '無'}")
+            print(f"  Associate Tag設定: {'有' if marketplace.associate_tag else '無'}")
+
+        # レスポンスキャッシュ（オフライン時は記録済みのレスポンスを再生する）
+        if offline is None:
+            offline = os.getenv('PAAPI_OFFLINE', 'false').lower() == 'true'
+        if cache_file is None:
+            cache_file = os.getenv('PAAPI_CACHE_FILE') or os.path.join(
+                os.path.dirname(__file__), '..', 'data', 'paapi_cache.json'
+            )
+        self.cache = PAAPICache(cache_file, default_ttl=self.SEARCH_CACHE_TTL, offline=offline)
+        self.offline = offline
+        self.api_calls = 0  # 実際にPA-APIを呼び出した回数（キャッシュヒットは含まない）
+        # api_calls はマーケットプレイスの並行検索・キャッシュのバックグラウンド再取得からも更新される
+        self._lock = threading.Lock()
+        self.item_fields = FieldExtractor(self.ITEM_FIELD_PATHS)
+
+        # 主のマーケットプレイスのレートリミッター（PAAPI_RATE_STATE_FILE を指定すると同じホストのプロセス間で共有）
+        self.rate_limiter = primary.rate_limiter
+
+        # 検索キーワードの使用履歴（最後に使ってから最も時間が経ったキーワードから検索する）
+        self.keyword_scheduler = KeywordScheduler(
+            os.path.join(os.path.dirname(cache_file), 'keyword_schedule.json'),
+            seed=os.getenv('SCHEDULER_SEED')
+        )
+
+        if offline:
+            print(f"✓ オフラインモード: キャッシュ済みのレスポンスのみ使用します（{len(self.cache.entries)}件）")
+            self.api = None
+            return
+
+        missing = [marketplace.region for marketplace in self.marketplaces.values() if not marketplace.has_credentials]
+        if missing:
             raise ValueError(
                 "Amazon PA-API credentials are required. "
-                "Set AMAZON_ACCESS_KEY, AMAZON_SECRET_KEY, and AMAZON_ASSOCIATE_TAG environment variables."
+                "Set AMAZON_ACCESS_KEY, AMAZON_SECRET_KEY, and AMAZON_ASSOCIATE_TAG environment variables "
+                f"(or AMAZON_ACCESS_KEY_<REGION> etc. per region). Missing: {', '.join(missing)}"
             )
 
-        # 地域コードマッピング
-        country_map = {
-            'jp': 'JP',
-            'us': 'US',
-            'uk': 'UK',
-            'de': 'DE',
-            'fr': 'FR',
-            'ca': 'CA',
-            'it': 'IT',
-            'es': 'ES'
-        }
-        country = country_map.get(self.region.lower(), 'JP')
-        print(f"使用する国コード: {country}")
-
-        # PA-API クライアント初期化
+        # PA-API クライアント初期化（マーケットプレイスごと）
         try:
             print("AmazonApiクラスをインスタンス化中...")
-            self.api = AmazonApi(
-                self.access_key,
-                self.secret_key,
-                self.associate_tag,
-                country
-            )
+            for marketplace in self.marketplaces.values():
+                marketplace.api = AmazonApi(
+                    marketplace.access_key,
+                    marketplace.secret_key,
+                    marketplace.associate_tag,
+                    marketplace.country
+                )
+            self.api = primary.api
             print("✓ PA-API クライアントの初期化に成功しました")
         except Exception as e:
             print(f"✗ PA-API クライアントの初期化に失敗: {e}")
@@ -156,45 +212,182 @@ class AmazonPAAPIClient:
         Returns:
             大手メーカーの場合True
         """
-        # ブランド名で判定
-        if brand:
-            for major_brand in self.MAJOR_BRANDS:
-                if major_brand.lower() in brand.lower():
-                    return True
-
-        # タイトルで判定
-        for major_brand in self.MAJOR_BRANDS:
-            if major_brand.lower() in product_title.lower():
-                return True
+        # ブランド名とタイトルを1回の走査で判定
+        return self.MAJOR_BRAND_MATCHER.matches(brand, product_title)
+
+    def _marketplace(self, region: Optional[str] = None) -> Marketplace:
+        """地域コードのマーケットプレイス（省略時は主のマーケットプレイス）"""
+        if region is None:
+            region = self.region
+        if region not in self.marketplaces:
+            raise ValueError(f"設定されていない地域コードです: {region}")
+        return self.marketplaces[region]
+
+    def _acquire_request_slot(self, marketplace: Marketplace):
+        """マーケットプレイスのレートリミッターの許可を待ってからPA-APIを呼び出す"""
+        waited = marketplace.rate_limiter.acquire()
+        if waited > 0:
+            print(f"⏳ PA-APIレート制限のため{waited:.1f}秒待機しました（{marketplace.region}）")
+        with self._lock:
+            self.api_calls += 1
+
+    def limiter_state(self) -> Dict[str, Dict]:
+        """マーケットプレイスごとのレートリミッターの状態（チェックポイントへの保存用）"""
+        return {region: marketplace.rate_limiter.snapshot() for region, marketplace in self.marketplaces.items()}
+
+    def restore_limiter_state(self, state: Dict):
+        """
+        保存したレートリミッターの状態を復元
 
-        return False
+        Args:
+            state: limiter_state() の値（地域コードのない古い形式は主のマーケットプレイスに適用）
+        """
+        if 'rate' in state:
+            state = {self.region: state}
+        for region, snapshot in state.items():
+            if region in self.marketplaces:
+                self.marketplaces[region].rate_limiter.restore(snapshot)
+
+    @property
+    def total_wait(self) -> float:
+        """全マーケットプレイスのレート制限による待機時間の合計（秒）"""
+        return sum(marketplace.rate_limiter.total_wait for marketplace in self.marketplaces.values())
+
+    @staticmethod
+    def _is_throttled(error: Exception) -> bool:
+        """PA-APIのレート制限エラー（429）かどうか"""
+        error_message = str(error)
+        return '429' in error_message or 'Too Many Requests' in error_message or 'TooManyRequests' in error_message
+
+    def _extract_item_fields(self, item) -> Dict:
+        """
+        PA-APIの商品（Item）から必要な項目を取り出す（SDKのオブジェクト・生のJSONの両方に対応）
 
-    def search_products(self, keyword: str, category: str, max_results: int = 10) -> List[GadgetProduct]:
+        Returns:
+            asin, title, brand, price, image_url, features を含む辞書（取得できない項目はNone）
         """
-        キーワードで商品を検索（429エラー時はリトライ）
+        return self.item_fields.extract(item)
+
+    def field_stats(self) -> Dict:
+        """処理した商品数と、PA-APIのレスポンスに含まれていなかった項目ごとの件数"""
+        return self.item_fields.stats()
+
+    def search_products(
+        self,
+        keyword: str,
+        category: str,
+        max_results: int = 10,
+        region: Optional[str] = None,
+        max_age: Optional[float] = None
+    ) -> List[GadgetProduct]:
+        """
+        キーワードで商品を検索（キャッシュがあればAPIを呼ばない）
 
         Args:
             keyword: 検索キーワード
             category: カテゴリー
             max_results: 最大取得件数
+            region: 検索するマーケットプレイスの地域コード（省略時は主のマーケットプレイス）
+            max_age: キャッシュの許容する古さ（秒、省略時は有効期限切れの結果も stale-while-revalidate で使う）
+
+        Returns:
+            商品リスト（検索結果が0件の場合は空リスト）
+
+        Raises:
+            PAAPISearchError: 応答を得られなかった場合（空の検索結果と区別する）
+        """
+        marketplace = self._marketplace(region)
+        if marketplace.search_keyword(keyword) is None:
+            print(f"'{keyword}' は {marketplace.region} の検索キーワードがないため検索しません")
+            return []
+        key = PAAPICache.make_key('search', keyword, category, max_results, marketplace.region)
+        data = self.cache.get_or_fetch(
+            key, lambda: self._fetch_search_products(keyword, category, max_results, marketplace),
+            max_age=max_age
+        )
+        if data is None:
+            raise PAAPISearchError(f"'{keyword}' の検索結果を取得できませんでした（{marketplace.region}）")
+        return [GadgetProduct(**item) for item in data]
+
+    def search_all_marketplaces(
+        self,
+        keyword: str,
+        category: str,
+        max_results: int = 10,
+        max_age: Optional[float] = None
+    ) -> List[GadgetProduct]:
+        """
+        すべてのマーケットプレイスを並行して検索し、ASINごとにマージ
+
+        各マーケットプレイスは自身のレートリミッターで待機するため、マーケットプレイスの数だけ取得量が増える。
+        同じASINが複数のマーケットプレイスにある場合は、設定順で先のマーケットプレイスの商品（URL・価格）を使い、
+        欠けている画像・特徴・元タイトルだけを他のマーケットプレイスの結果で補う。
+
+        Args:
+            keyword: 検索キーワード
+            category: カテゴリー
+            max_results: マーケットプレイスごとの最大取得件数
+            max_age: キャッシュの許容する古さ（秒、search_products を参照）
 
         Returns:
-            商品リスト
+            商品リスト（マーケットプレイスの設定順・検索結果の順）。一部のマーケットプレイスで失敗した場合は
+            応答を得られたマーケットプレイスの結果だけを返す
+
+        Raises:
+            PAAPISearchError: すべてのマーケットプレイスで応答を得られなかった場合
         """
-        # 429エラー時のリトライ設定
+        regions = list(self.marketplaces)
+        if len(regions) == 1:
+            return self.search_products(keyword, category, max_results, max_age=max_age)
+
+        def search(region: str) -> Optional[List[GadgetProduct]]:
+            try:
+                return self.search_products(keyword, category, max_results, region=region, max_age=max_age)
+            except Exception as e:
+                print(f"⚠ {region} の検索に失敗しました（他のマーケットプレイスの結果を使います）: {e}")
+                return None
+
+        with self.cache.batch(), ThreadPoolExecutor(max_workers=len(regions), thread_name_prefix='paapi-search') as executor:
+            results = [products for products in executor.map(search, regions) if products is not None]
+        if not results:
+            raise PAAPISearchError(f"'{keyword}' の検索結果をすべてのマーケットプレイスで取得できませんでした")
+
+        merged: Dict[str, GadgetProduct] = {}
+        for products in results:
+            for product in products:
+                existing = merged.get(product.asin)
+                if existing is None:
+                    merged[product.asin] = product
+                    continue
+                for name in ('image_url', 'features', 'original_title'):
+                    if not getattr(existing, name) and getattr(product, name):
+                        setattr(existing, name, getattr(product, name))
+        return list(merged.values())
+
+    def _fetch_search_products(
+        self,
+        keyword: str,
+        category: str,
+        max_results: int,
+        marketplace: Marketplace
+    ) -> Optional[List[Dict]]:
+        """
+        PA-APIで商品を検索（429エラー時はリトライ）
+
+        Returns:
+            商品データ（辞書）のリスト（エラー時はNone。キャッシュしない）
+        """
+        # 429エラー時のリトライ回数（待機時間はレートリミッターが429のたびに広げる）
         max_retries = 3
-        base_wait_time = 15.0  # 初回待機時間（秒）
 
         for retry in range(max_retries):
             try:
-                # リトライ時は待機（exponential backoff）
-                if retry > 0:
-                    wait_time = base_wait_time * (2 ** (retry - 1))  # 15秒、30秒、60秒
-                    print(f"⏳ PA-APIレート制限のため{wait_time}秒待機中... (リトライ {retry}/{max_retries})")
-                    time.sleep(wait_time)
-
                 # PA-APIで商品検索
-                search_result = self.api.search_items(keywords=keyword, item_count=max_results)
+                self._acquire_request_slot(marketplace)
+                search_result = marketplace.api.search_items(
+                    keywords=marketplace.search_keyword(keyword), item_count=max_results
+                )
+                marketplace.rate_limiter.on_success()
 
                 gadget_products = []
 
@@ -202,132 +395,239 @@ class AmazonPAAPIClient:
                 if not search_result or not hasattr(search_result, 'items'):
                     return []
 
-                # 各商品を処理
+                # 各商品を処理（欠損した項目はNoneになり、欠損数は field_stats で確認できる）
                 for item in search_result.items:
                     try:
-                        # ブランド取得
-                        brand = None
-                        if hasattr(item, 'item_info') and item.item_info:
-                            if hasattr(item.item_info, 'by_line_info') and item.item_info.by_line_info:
-                                if hasattr(item.item_info.by_line_info, 'brand') and item.item_info.by_line_info.brand:
-                                    brand = item.item_info.by_line_info.brand.display_value
-
-                        # タイトル取得
-                        title = ""
-                        if hasattr(item, 'item_info') and item.item_info:
-                            if hasattr(item.item_info, 'title') and item.item_info.title:
-                                title = item.item_info.title.display_value
+                        fields = self._extract_item_fields(item)
+                        title = fields['title'] or ""
+                        brand = fields['brand']
 
                         # 大手メーカーの商品のみを選定
                         if not self.is_major_brand(title, brand):
                             continue
 
                         # ASIN取得
-                        asin = item.asin if hasattr(item, 'asin') else None
+                        asin = fields['asin']
                         if not asin:
                             continue
 
-                        # 価格取得
-                        price = None
-                        if hasattr(item, 'offers') and item.offers:
-                            if hasattr(item.offers, 'listings') and item.offers.listings:
-                                if len(item.offers.listings) > 0:
-                                    listing = item.offers.listings[0]
-                                    if hasattr(listing, 'price') and listing.price:
-                                        if hasattr(listing.price, 'display_amount'):
-                                            price = listing.price.display_amount
-
-                        # 画像URL取得
-                        image_url = None
-                        if hasattr(item, 'images') and item.images:
-                            if hasattr(item.images, 'primary') and item.images.primary:
-                                if hasattr(item.images.primary, 'large') and item.images.primary.large:
-                                    if hasattr(item.images.primary.large, 'url'):
-                                        image_url = item.images.primary.large.url
-
-                        # 特徴取得
-                        features = []
-                        if hasattr(item, 'item_info') and item.item_info:
-                            if hasattr(item.item_info, 'features') and item.item_info.features:
-                                if hasattr(item.item_info.features, 'display_values'):
-                                    # display_valuesは既に文字列のリストなので、そのまま使用
-                                    features = item.item_info.features.display_values[:5]
-
                         # 説明文生成（ブランド名とキーワードから）
                         description = f"{brand or ''}の{keyword}として高い評価を得ている製品"
 
-                        # 商品名を短縮
-                        from amazon_scraper import shorten_product_name
-                        # タイトル用: 企業名+製品カテゴリー
-                        short_name = shorten_product_name(title, category, for_title=True)
-                        # 本文用: 企業名+製品名
-                        full_name = shorten_product_name(title, category, for_title=False)
+                        # 商品名を短縮（タイトル用: 企業名+製品カテゴリー、本文用: 企業名+製品名）
+                        short_name, full_name = normalize_product_name(title, category)
 
                         # GadgetProductオブジェクト作成
                         product = GadgetProduct(
                             name=short_name,  # タイトル用の短い商品名
                             asin=asin,
-                            url=f"https://www.amazon.co.jp/dp/{asin}?tag={self.associate_tag}",
-                            price=price,
-                            image_url=image_url,
+                            url=marketplace.product_url(asin),
+                            price=fields['price'],
+                            image_url=fields['image_url'],
                             description=description,
                             category=category,
-                            features=features if features else None,
+                            features=fields['features'],
                             rating=None,
                             full_name=full_name,  # 本文用の詳細な商品名
                             original_title=title  # PA-APIから取得した元のタイトル（原文）
                         )
 
-                        gadget_products.append(product)
+                        gadget_products.append(product.to_dict())
 
                     except Exception as e:
-                        print(f"商品データの処理中にエラー: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        continue
+                        # 1件の不正なアイテムで検索結果全体を失わないよう、その商品だけスキップする
+                        self.item_fields.record_failure()
+                        print(f"商品データの処理中にエラー（スキップします）: {e}")
 
                 # 成功したらリストを返す
                 return gadget_products
 
             except Exception as e:
                 # 429エラーの場合はリトライ
-                error_message = str(e)
-                if '429' in error_message or 'Too Many Requests' in error_message:
+                if self._is_throttled(e):
                     print(f"⚠ PA-API レート制限エラー (429): {e}")
+                    marketplace.rate_limiter.on_throttle()
                     if retry < max_retries - 1:
                         print(f"リトライします... ({retry + 1}/{max_retries})")
                         continue
                     else:
                         print("最大リトライ回数に達しました。")
-                        return []
+                        return None
                 else:
                     # 429以外のエラーは即座に返す
                     print(f"商品検索中にエラー: {e}")
                     import traceback
                     traceback.print_exc()
-                    return []
+                    return None
 
         # すべてのリトライが失敗した場合
         print("PA-APIのレート制限により商品を取得できませんでした。")
-        return []
+        return None
 
-    def get_random_product(self) -> Optional[GadgetProduct]:
+    # GetItemsで1リクエストに指定できるASINの最大数
+    GET_ITEMS_BATCH_SIZE = 10
+    # 商品情報キャッシュの有効期間（秒）。価格・在庫は変わりやすいため検索結果より短くする
+    ITEM_CACHE_TTL = 24 * 3600
+
+    def get_items(self, asins: List[str], region: Optional[str] = None) -> Dict[str, Dict]:
         """
-        ランダムなカテゴリーとキーワードで商品を検索し、1つ返す
+        ASINを指定して商品情報を取得（GetItems、10件ずつまとめてリクエスト）
+
+        Args:
+            asins: 取得するASINのリスト
+            region: 取得するマーケットプレイスの地域コード（省略時は主のマーケットプレイス）
 
         Returns:
-            ランダムに選択された大手メーカーの商品
+            ASIN -> 商品情報（_extract_item_fields の形式）。取得できなかったASINは含まない
+        """
+        marketplace = self._marketplace(region)
+        asins = list(dict.fromkeys(asins))
+        items: Dict[str, Dict] = {}
+
+        # バッチごとの結果はまとめて1回だけキャッシュファイルに保存する
+        with self.cache.batch():
+            for start in range(0, len(asins), self.GET_ITEMS_BATCH_SIZE):
+                batch = asins[start:start + self.GET_ITEMS_BATCH_SIZE]
+                key = PAAPICache.make_key('items', batch, marketplace.region)
+                data = self.cache.get_or_fetch(
+                    key, lambda batch=batch: self._fetch_items(batch, marketplace), ttl=self.ITEM_CACHE_TTL
+                )
+                if data:
+                    items.update(data)
+
+        return items
+
+    def refresh_known_asins(self, products: List[GadgetProduct]) -> List[GadgetProduct]:
+        """
+        既存の商品の価格・画像・特徴・元タイトルをGetItemsで最新化（商品オブジェクトを直接更新）
+
+        Args:
+            products: 更新する商品
+
+        Returns:
+            値が変わった商品のリスト
+        """
+        # 商品URLのマーケットプレイスごとに取得（設定されていないマーケットプレイスの商品は主のマーケットプレイスで取得）
+        asins_by_region: Dict[str, List[str]] = {}
+        product_regions = {}
+        for product in products:
+            region = region_for_url(product.url)
+            if region not in self.marketplaces:
+                region = self.region
+            product_regions[product.asin] = region
+            asins_by_region.setdefault(region, []).append(product.asin)
+
+        with self.cache.batch(), ThreadPoolExecutor(
+            max_workers=max(1, len(asins_by_region)), thread_name_prefix='paapi-items'
+        ) as executor:
+            futures = {
+                region: executor.submit(self.get_items, asins, region)
+                for region, asins in asins_by_region.items()
+            }
+            items_by_region = {region: future.result() for region, future in futures.items()}
+
+        changed = []
+        refreshed_at = datetime.now().isoformat()
+
+        for product in products:
+            fields = items_by_region[product_regions[product.asin]].get(product.asin)
+            if not fields:
+                continue
+            product.last_refreshed = refreshed_at
+
+            updates = {
+                'price': fields['price'],
+                'image_url': fields['image_url'],
+                'features': fields['features'],
+                'original_title': fields['title']
+            }
+            # 取得できなかった項目は既存の値を残し、変わった項目だけを書き換える
+            updates = {
+                field: value for field, value in updates.items()
+                if value and value != getattr(product, field)
+            }
+            if updates:
+                for field, value in updates.items():
+                    setattr(product, field, value)
+                changed.append(product)
+
+        return changed
+
+    def _fetch_items(self, asins: List[str], marketplace: Marketplace) -> Optional[Dict[str, Dict]]:
+        """
+        PA-APIのGetItemsで商品情報を取得（429エラー時はリトライ）
+
+        Returns:
+            ASIN -> 商品情報（エラー時はNone。キャッシュしない）
+        """
+        max_retries = 3
+
+        for retry in range(max_retries):
+            try:
+                self._acquire_request_slot(marketplace)
+                result = marketplace.api.get_items(asins)
+                marketplace.rate_limiter.on_success()
+
+                items = {}
+                for item in result or []:
+                    try:
+                        fields = self._extract_item_fields(item)
+                    except Exception as e:
+                        # その商品だけスキップする
+                        self.item_fields.record_failure()
+                        print(f"商品データの処理中にエラー（スキップします）: {e}")
+                        continue
+                    if fields['asin']:
+                        items[fields['asin']] = fields
+                return items
+
+            except Exception as e:
+                if self._is_throttled(e):
+                    print(f"⚠ PA-API レート制限エラー (429): {e}")
+                    marketplace.rate_limiter.on_throttle()
+                    if retry < max_retries - 1:
+                        print(f"リトライします... ({retry + 1}/{max_retries})")
+                        continue
+                    print("最大リトライ回数に達しました。")
+                    return None
+                print(f"商品情報の取得中にエラー: {e}")
+                return None
+
+        return None
+
+    def search_random_keyword(self, max_age: Optional[float] = None) -> List[GadgetProduct]:
         """
-        # ランダムにカテゴリーを選択
-        category = random.choice(list(self.SEARCH_KEYWORDS.keys()))
+        最後に検索してから最も時間が経ったカテゴリーとキーワードで商品を検索
+
+        Args:
+            max_age: キャッシュの許容する古さ（秒、search_products を参照）
 
-        # そのカテゴリーからランダムにキーワードを選択
-        keyword = random.choice(self.SEARCH_KEYWORDS[category])
+        Returns:
+            大手メーカーの商品リスト（検索結果すべて）
+
+        Raises:
+            PAAPISearchError: 応答を得られなかった場合
+        """
+        # 未使用・最も古く使ったキーワードから選択（同率の場合はランダム）
+        category, keyword = self.keyword_scheduler.pick(self.SEARCH_KEYWORDS)
 
         print(f"検索中: カテゴリー={category}, キーワード={keyword}")
 
-        # 商品を検索
-        products = self.search_products(keyword, category, max_results=10)
+        # 商品を検索（複数のマーケットプレイスを設定している場合は並行して検索）
+        return self.search_all_marketplaces(keyword, category, max_results=10, max_age=max_age)
+
+    def get_random_product(self) -> Optional[GadgetProduct]:
+        """
+        ランダムなカテゴリーとキーワードで商品を検索し、1つ返す
+
+        Returns:
+            ランダムに選択された大手メーカーの商品
+        """
+        try:
+            products = self.search_random_keyword()
+        except PAAPISearchError as e:
+            print(f"商品検索に失敗しました: {e}")
+            return None
 
         if not products:
             print("商品が見つかりませんでした。")
@@ -1,10 +1,14 @@
-import json
 import random
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 import os
 from datetime import datetime, timedelta
-import re
+
+from catalog_merge import STALE_GRACE_DAYS, MergeSummary, merge_catalog
+from name_normalizer import normalize_product_name
+from product_catalog import ProductCatalog
+from product_scheduler import ProductScheduler, load_weight_config
+from product_store import JsonProductStore, SQLiteProductStore
 
 
 def shorten_product_name(name: str, category: str, for_title: bool = True) -> str:
@@ -27,116 +31,8 @@ def shorten_product_name(name: str, category: str, for_title: bool = True) -> st
     Returns:
         短縮された商品名
     """
-    # PCパーツのカテゴリー
-    pc_parts_categories = ["SSD", "メモリ", "グラフィックボード", "CPU", "マザーボード", "電源ユニット"]
-
-    # 主要ブランド名のリスト
-    major_brands = [
-        "Logitech", "Logicool", "Microsoft", "Samsung", "Crucial", "Anker", "BenQ",
-        "HHKB", "Corsair", "Razer", "ASUS", "Dell", "HP", "Lenovo", "Sony",
-        "Kingston", "Western Digital", "WD", "SanDisk", "Intel", "AMD", "NVIDIA",
-        "Seagate", "LG", "Acer", "MSI", "Gigabyte", "ASRock", "EVGA",
-        "HyperX", "G.Skill", "Thermaltake", "Cooler Master", "NZXT"
-    ]
-
-    # ブランド名を抽出（大文字小文字を無視）
-    brand = None
-    name_lower = name.lower()
-    for b in major_brands:
-        if b.lower() in name_lower:
-            # 元の商品名からブランド名の部分を抽出（大文字小文字を保持）
-            match = re.search(re.escape(b), name, re.IGNORECASE)
-            if match:
-                brand = match.group(0)
-                break
-
-    # ブランド名が見つからない場合は最初の単語を使用
-    if not brand:
-        brand = name.split()[0] if name.split() else name[:10]
-
-    # 商品名から不要な文字列を削除
-    # 【...】内のすべての文字を削除
-    cleaned_name = re.sub(r'【[^】]*】', '', name)
-    # [...]内のすべての文字を削除
-    cleaned_name = re.sub(r'\[[^\]]*\]', '', cleaned_name)
-    cleaned_name = cleaned_name.strip()
-
-    # 本文用の場合: 企業名+製品名（最大30文字）
-    if not for_title:
-        # ブランド名の後ろの部分を抽出
-        brand_pattern = re.escape(brand)
-        match = re.search(brand_pattern, cleaned_name, re.IGNORECASE)
-        if match:
-            # ブランド名の後の部分を取得
-            after_brand = cleaned_name[match.end():].strip()
-            # 不要な文字を削除（括弧、記号など）
-            after_brand = re.sub(r'[\(\[].*?[\)\]]', '', after_brand).strip()
-            # 単語を分割して最初の2-3語を取得
-            words = after_brand.split()[:3]
-            product_model = ' '.join(words)
-            # 最大30文字に制限
-            if len(product_model) > 30:
-                product_model = product_model[:30]
-
-            if product_model:
-                # 一般的な製品名のリスト（スペースなしで結合）
-                generic_product_names = [
-                    "USB", "コンセント", "充電器", "ケーブル", "アダプター", "アダプタ",
-                    "ハブ", "スタンド", "マウスパッド", "リストレスト", "カバー",
-                    "フィルム", "保護フィルム", "バッテリー", "モバイルバッテリー",
-                    "スピーカー", "イヤホン", "ヘッドホン", "マイク", "Webカメラ",
-                    "キーボード", "マウス", "モニター", "ディスプレイ"
-                ]
-
-                # 製品名の最初の単語を取得
-                first_word = words[0] if words else ""
-
-                # 一般的な製品名かどうかチェック
-                is_generic = any(generic in first_word for generic in generic_product_names)
-
-                # 一般的な製品名の場合はスペースなし、固有名詞の場合はスペースあり
-                if is_generic:
-                    return f"{brand}{product_model}"
-                else:
-                    return f"{brand} {product_model}"
-
-    # タイトル用: 企業名+製品カテゴリー
-    # PCパーツの場合
-    is_pc_part = any(part in category or part in name for part in pc_parts_categories)
-
-    if is_pc_part:
-        # カテゴリー名を抽出
-        for part_category in pc_parts_categories:
-            if part_category in name or part_category in category:
-                return f"{brand} {part_category}"
-        # カテゴリーが見つからない場合はカテゴリー名を使用
-        return f"{brand} {category}"
-
-    # PC周辺機器の場合: 企業名+製品タイプ
-    # 製品タイプのキーワード
-    product_types = {
-        "マウス": ["マウス", "mouse"],
-        "キーボード": ["キーボード", "keyboard"],
-        "モニター": ["モニター", "ディスプレイ", "monitor", "display"],
-        "ヘッドセット": ["ヘッドセット", "headset"],
-        "ヘッドホン": ["ヘッドホン", "headphone"],
-        "イヤホン": ["イヤホン", "earphone"],
-        "スピーカー": ["スピーカー", "speaker"],
-        "Webカメラ": ["Webカメラ", "webcam", "カメラ"],
-        "マイク": ["マイク", "microphone"],
-        "充電器": ["充電器", "charger"],
-        "ケーブル": ["ケーブル", "cable"],
-        "ハブ": ["ハブ", "hub"],
-    }
-
-    # 製品タイプを検出
-    for product_type, keywords in product_types.items():
-        for keyword in keywords:
-            if keyword.lower() in name_lower or keyword.lower() in category.lower():
-                return f"{brand} {product_type}"
-
-    # 製品タイプが見つからない場合はカテゴリー名を使用
-    return f"{brand} {category}"
+    normalized = normalize_product_name(name, category)
+    return normalized.short_name if for_title else normalized.full_name
 
 
 @dataclass
@@ -153,6 +49,8 @@ class GadgetProduct:
     rating: Optional[float] = None
     full_name: Optional[str] = None  # 本文用の詳細な商品名（企業名+製品名）
     original_title: Optional[str] = None  # PA-APIから取得した元のタイトル（原文）
+    stale_since: Optional[str] = None  # 商品データの更新で取得できなくなった日時（ISO形式、猶予期間後に削除）
+    last_refreshed: Optional[str] = None  # PA-APIの取得結果で最後に更新した日時（ISO形式）
 
     def to_dict(self) -> Dict:
         return asdict(self)
@@ -161,87 +59,121 @@ class GadgetProduct:
 class AmazonProductManager:
     """Amazon商品管理クラス"""
 
-    def __init__(self, products_file: str = "data/products.json"):
+    def __init__(self, products_file: str = "data/products.json", storage: Optional[str] = None):
         """
         初期化
 
         Args:
             products_file: 商品データを保存するJSONファイルのパス
+            storage: 保存先（'json' または 'sqlite'、省略時は環境変数 PRODUCT_STORAGE、既定は 'json'）
         """
         self.products_file = products_file
-        self.products: List[GadgetProduct] = []
+        self.catalog = ProductCatalog()
 
         # 投稿済み商品とメタデータのファイルパス
         data_dir = os.path.dirname(self.products_file)
         self.posted_file = os.path.join(data_dir, 'posted_products.json')
         self.metadata_file = os.path.join(data_dir, 'products_metadata.json')
 
-        self.posted_asins: List[str] = []
+        # 保存先を選択（SQLiteは初回のみ既存のJSONファイルを取り込む）
+        self.storage = (storage or os.getenv('PRODUCT_STORAGE', 'json')).lower()
+        json_store = JsonProductStore(self.products_file)
+        if self.storage == 'sqlite':
+            self.store = SQLiteProductStore(os.path.join(data_dir, 'products.db'))
+            self.store.import_from_json(json_store)
+        else:
+            self.store = json_store
+
+        self.posted_ledger = self.store.create_posted_ledger()  # 生成時に台帳を読み込む
+
+        # 次に投稿する製品グループを選ぶスケジューラー（索引はカタログの変更後に遅延して作り直す）
+        self.scheduler = ProductScheduler(
+            os.path.join(data_dir, 'scheduler_state.json'),
+            category_quotas=load_weight_config(os.getenv('SCHEDULER_CATEGORY_QUOTAS')),
+            price_band_weights=load_weight_config(os.getenv('SCHEDULER_PRICE_BAND_WEIGHTS')),
+            seed=os.getenv('SCHEDULER_SEED')
+        )
+        self._scheduler_dirty = True
+
         self.load_products()
-        self.load_posted_asins()
         self.check_and_refresh_products()
 
     def load_products(self):
-        """商品データをファイルから読み込み"""
-        if os.path.exists(self.products_file):
-            try:
-                with open(self.products_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.products = [GadgetProduct(**item) for item in data]
-            except Exception as e:
-                print(f"商品データの読み込みに失敗: {e}")
-                self.products = []
+        """商品データを読み込み"""
+        try:
+            self.products = [GadgetProduct(**item) for item in self.store.load_products()]
+        except Exception as e:
+            print(f"商品データの読み込みに失敗: {e}")
+            self.products = []
+
+    @property
+    def products(self) -> List[GadgetProduct]:
+        """全商品のリスト（追加順）"""
+        return self.catalog.all()
+
+    @products.setter
+    def products(self, products: List[GadgetProduct]):
+        """商品リストを置き換え（索引を再構築）"""
+        self.catalog.rebuild(products, is_posted=self.posted_ledger.__contains__)
+        self._scheduler_dirty = True
 
     def save_products(self):
-        """商品データをファイルに保存"""
-        os.makedirs(os.path.dirname(self.products_file), exist_ok=True)
-        with open(self.products_file, 'w', encoding='utf-8') as f:
-            data = [product.to_dict() for product in self.products]
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-    def add_product(self, product: GadgetProduct):
-        """商品を追加"""
-        # 既存の商品（同じASIN）がある場合は更新
-        for i, p in enumerate(self.products):
-            if p.asin == product.asin:
-                self.products[i] = product
-                self.save_products()
-                return
-
-        self.products.append(product)
-        self.save_products()
+        """商品データを保存（全件置き換え）"""
+        self.store.save_products([product.to_dict() for product in self.catalog])
+
+    def add_product(self, product: GadgetProduct, save: bool = False):
+        """
+        商品を追加（既存の商品（同じASIN）がある場合は更新）
+
+        Args:
+            product: 追加する商品
+            save: すぐに保存するかどうか（まとめて追加する場合は add_products を使う）
+        """
+        self.catalog.add(product, posted=product.asin in self.posted_ledger)
+        self._scheduler_dirty = True
+        if save:
+            self._upsert_products([product])
+
+    def add_products(self, products: List[GadgetProduct]):
+        """複数の商品を追加して1回だけ保存"""
+        for product in products:
+            self.catalog.add(product, posted=product.asin in self.posted_ledger)
+        self._scheduler_dirty = True
+        self._upsert_products(products)
+
+    def _upsert_products(self, products: List[GadgetProduct]):
+        """追加・更新した商品だけを保存（JSONの場合は全件を書き直す）"""
+        self.store.upsert_products(
+            [product.to_dict() for product in products],
+            lambda: [product.to_dict() for product in self.catalog]
+        )
+
+    @property
+    def posted_asins(self):
+        """投稿済みASINの台帳（in / len で参照可能）"""
+        return self.posted_ledger
 
     def load_posted_asins(self):
-        """投稿済み商品ASINリストを読み込み"""
-        if os.path.exists(self.posted_file):
-            try:
-                with open(self.posted_file, 'r', encoding='utf-8') as f:
-                    self.posted_asins = json.load(f)
-            except Exception as e:
-                print(f"投稿済み商品データの読み込みに失敗: {e}")
-                self.posted_asins = []
+        """投稿済み商品の台帳を読み込み"""
+        self.posted_ledger.load()
 
     def save_posted_asins(self):
-        """投稿済み商品ASINリストを保存"""
-        os.makedirs(os.path.dirname(self.posted_file), exist_ok=True)
-        with open(self.posted_file, 'w', encoding='utf-8') as f:
-            json.dump(self.posted_asins, f, ensure_ascii=False, indent=2)
+        """投稿済み商品の台帳をスナップショットとして保存"""
+        self.posted_ledger.compact()
+
+    def clear_posted_asins(self):
+        """投稿済み商品履歴をクリア"""
+        self.posted_ledger.clear()
+        self.catalog.reset_posted()
+        self._scheduler_dirty = True
 
     def load_metadata(self) -> Dict:
         """メタデータを読み込み"""
-        if os.path.exists(self.metadata_file):
-            try:
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"メタデータの読み込みに失敗: {e}")
-        return {}
+        return self.store.load_metadata()
 
     def save_metadata(self, metadata: Dict):
         """メタデータを保存"""
-        os.makedirs(os.path.dirname(self.metadata_file), exist_ok=True)
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        self.store.save_metadata(metadata)
 
     def check_and_refresh_products(self):
         """50日経過していたら商品データをリフレッシュ"""
@@ -264,16 +196,11 @@ class AmazonProductManager:
             self.save_metadata(metadata)
 
     def refresh_products(self):
-        """商品データと投稿履歴をリフレッシュ"""
+        """商品データをリフレッシュ（既存の商品データに差分マージ）"""
         print("=" * 50)
         print("商品データのリフレッシュを開始します")
         print("=" * 50)
 
-        # 投稿済みASINをクリア
-        self.posted_asins = []
-        self.save_posted_asins()
-        print("✓ 投稿済み商品履歴をクリアしました")
-
         # メタデータを更新
         metadata = {
             'last_refresh_date': datetime.now().isoformat(),
@@ -285,7 +212,7 @@ class AmazonProductManager:
         # 新しい商品データを生成
         try:
             # PA-APIを使用して新しい商品を取得
-            from amazon_paapi_client import AmazonPAAPIClient
+            from amazon_paapi_client import AmazonPAAPIClient, PAAPISearchError
 
             print("PA-APIから新しい商品データを取得中...")
             paapi_client = AmazonPAAPIClient()
@@ -296,7 +223,11 @@ class AmazonProductManager:
             for category in categories:
                 keywords = paapi_client.SEARCH_KEYWORDS[category]
                 for keyword in keywords[:5]:  # 各カテゴリーから5キーワード
-                    products = paapi_client.search_products(keyword, category, max_results=2)
+                    try:
+                        products = paapi_client.search_all_marketplaces(keyword, category, max_results=2)
+                    except PAAPISearchError as e:
+                        print(f"  {e}（スキップします）")
+                        continue
                     new_products.extend(products)
 
                     if len(new_products) >= 100:
@@ -313,10 +244,12 @@ class AmazonProductManager:
                     seen_asins.add(p.asin)
                     unique_products.append(p)
 
-            # 100個に制限
-            self.products = unique_products[:100]
-            self.save_products()
-            print(f"✓ PA-APIから{len(self.products)}個の新商品を取得しました")
+            if not unique_products:
+                raise ValueError("新しい商品を取得できませんでした")
+
+            # 取得が完了してから既存の商品データにマージ（100個に制限、投稿済み状態は維持）
+            summary = self.merge_products(unique_products[:100])
+            print(f"✓ PA-APIから{len(unique_products[:100])}個の商品を取得しました（{summary.describe()}）")
 
         except Exception as e:
             print(f"警告: PA-APIでの商品取得に失敗しました - {e}")
@@ -326,16 +259,129 @@ class AmazonProductManager:
         print("商品データのリフレッシュが完了しました")
         print("=" * 50)
 
-    def mark_as_posted(self, asin: str):
+    def merge_products(self, fresh_products: List[GadgetProduct], grace_days: int = STALE_GRACE_DAYS) -> MergeSummary:
+        """
+        新たに取得した商品を既存の商品リストにマージして保存
+
+        既存の商品は置き換えずに変わった項目だけを更新し、取得結果に含まれなくなった商品は
+        猶予期間が過ぎるまで残す。残った商品の投稿済み状態は維持する。
+
+        Args:
+            fresh_products: 新たに取得した商品
+            grace_days: 取得結果に含まれなくなった商品を残す日数
+
+        Returns:
+            マージ結果の集計
+        """
+        summary = merge_catalog(self.products, fresh_products, grace_days=grace_days)
+
+        added = set(summary.added)
+        for product in fresh_products:
+            if product.asin in added:
+                self.catalog.add(product, posted=product.asin in self.posted_ledger)
+                added.discard(product.asin)
+
+        for asin in summary.removed:
+            self.catalog.remove(asin)
+            self.posted_ledger.remove(asin)
+
+        # 期限切れになった・期限切れが解除された商品を選択の対象から外す・戻す
+        for asin in summary.stale + summary.updated:
+            self.catalog.reindex(asin)
+
+        self._scheduler_dirty = True
+        self.save_products()
+        return summary
+
+    def refresh_known_asins(self, paapi_client=None) -> Dict[str, int]:
+        """
+        登録済みの商品の価格・画像などをPA-APIのGetItems（10件ずつ）で最新化
+
+        商品リストは置き換えず、変わった商品だけを保存する。
+
+        Args:
+            paapi_client: PA-APIクライアント（省略時は新たに作成）
+
+        Returns:
+            {'requested': 対象商品数, 'updated': 更新した商品数}
+        """
+        if paapi_client is None:
+            from amazon_paapi_client import AmazonPAAPIClient
+            paapi_client = AmazonPAAPIClient()
+
+        products = self.products
+        changed = paapi_client.refresh_known_asins(products)
+        if changed:
+            self._upsert_products(changed)
+
+        print(f"✓ {len(products)}件中{len(changed)}件の商品情報を更新しました")
+        return {'requested': len(products), 'updated': len(changed)}
+
+    def mark_as_posted(self, asin: str, post_id: Optional[int] = None):
         """商品を投稿済みとしてマーク"""
-        if asin not in self.posted_asins:
-            self.posted_asins.append(asin)
-            self.save_posted_asins()
+        self.mark_many_as_posted([asin], post_id)
+
+    def mark_many_as_posted(self, asins: List[str], post_id: Optional[int] = None):
+        """複数の商品（バリエーション）をまとめて投稿済みとしてマーク（ジャーナルへの追記1回）"""
+        self.posted_ledger.add_many(asins, post_id)
+        posted_products = []
+        for asin in asins:
+            product = self.catalog.get(asin)
+            if product is not None:
+                posted_products.append(product)
+            self.catalog.mark_posted(asin)
             print(f"✓ 商品 {asin} を投稿済みとしてマークしました")
 
+        # 投稿した製品グループの重みを更新し、ブランド・カテゴリーの投稿履歴を記録
+        if not self._scheduler_dirty:
+            for name in dict.fromkeys(product.name for product in posted_products):
+                self._update_scheduled_group(name)
+        self.scheduler.record(posted_products)
+
+    def _update_scheduled_group(self, name: str):
+        """製品グループの未投稿商品に合わせてスケジューラーの索引を更新"""
+        unposted = self.catalog.unposted_by_group.get(name)
+        if unposted:
+            self.scheduler.add(name, [self.catalog.by_asin[asin] for asin in unposted])
+        else:
+            self.scheduler.remove(name)
+
+    def _pick_scheduled_group(self, category: Optional[str] = None) -> List[GadgetProduct]:
+        """
+        スケジューラーで製品グループを選び、そのグループの未投稿商品を返す
+
+        Args:
+            category: カテゴリーでフィルター（省略可）
+        """
+        if self._scheduler_dirty:
+            self.scheduler.rebuild({
+                name: [self.catalog.by_asin[asin] for asin in asins]
+                for name, asins in self.catalog.unposted_by_group.items()
+            })
+            self._scheduler_dirty = False
+
+        name = self.scheduler.pick(category)
+        if name is None:
+            return []
+        variants = [self.catalog.by_asin[asin] for asin in self.catalog.unposted_by_group.get(name, {})]
+        if category:
+            variants = [p for p in variants if p.category == category]
+        return variants
+
+    def last_posted_at(self, asin: str) -> Optional[datetime]:
+        """商品を最後に投稿した日時"""
+        return self.posted_ledger.last_posted_at(asin)
+
+    def _least_recently_posted_products(self) -> List[GadgetProduct]:
+        """全商品が投稿済みの場合に、最も古く投稿された商品から再投稿候補を選ぶ（期限切れの商品は除く）"""
+        asins = self.posted_ledger.least_recently_posted(
+            asin for asin, product in self.catalog.by_asin.items() if not product.stale_since
+        )
+        return [self.catalog.by_asin[asin] for asin in asins]
+
     def get_random_product(self, category: Optional[str] = None) -> Optional[GadgetProduct]:
         """
-        投稿済みでない商品をランダムに取得
+        投稿済みでない商品をスケジューラーの重みで選んで取得
 
         Args:
             category: カテゴリーでフィルター（省略可）
@@ -343,17 +389,18 @@ class AmazonProductManager:
         Returns:
             ランダムに選択された商品
         """
-        if not self.products:
+        if not self.catalog:
             return None
 
-        # 投稿済みでない商品をフィルター
-        available_products = [p for p in self.products if p.asin not in self.posted_asins]
+        # 投稿済みでない商品の製品グループから選択（グループ内は追加順の先頭）
+        if self.catalog.has_unposted():
+            variants = self._pick_scheduled_group(category)
+            if variants:
+                return variants[0]
+            return self.catalog.random_unposted(category)
 
-        if not available_products:
-            print("警告: 全ての商品が投稿済みです。投稿履歴をリセットします。")
-            self.posted_asins = []
-            self.save_posted_asins()
-            available_products = self.products
+        print("警告: 全ての商品が投稿済みです。最も古く投稿した商品から再投稿します。")
+        available_products = self._least_recently_posted_products()
 
         if category:
             filtered = [p for p in available_products if p.category == category]
@@ -374,36 +421,29 @@ class AmazonProductManager:
         Returns:
             同一製品のバリエーションリスト（最低1つ、複数ある場合は全て）
         """
-        if not self.products:
+        if not self.catalog:
             return []
 
-        # 投稿済みでない商品をフィルター
-        available_products = [p for p in self.products if p.asin not in self.posted_asins]
+        if self.catalog.has_unposted():
+            # 未投稿商品を含む製品グループからスケジューラーの重みで1つ選択
+            variants = self._pick_scheduled_group(category) or self.catalog.random_unposted_group(category)
+        else:
+            print("警告: 全ての商品が投稿済みです。最も古く投稿した商品から再投稿します。")
+            available_products = self._least_recently_posted_products()
 
-        if not available_products:
-            print("警告: 全ての商品が投稿済みです。投稿履歴をリセットします。")
-            self.posted_asins = []
-            self.save_posted_asins()
-            available_products = self.products
+            # カテゴリーフィルター
+            if category:
+                available_products = [p for p in available_products if p.category == category]
 
-        # カテゴリーフィルター
-        if category:
-            available_products = [p for p in available_products if p.category == category]
+            variants = []
+            if available_products:
+                group_name = random.choice(list(dict.fromkeys(p.name for p in available_products)))
+                variants = [p for p in available_products if p.name == group_name]
 
-        if not available_products:
+        if not variants:
             return []
 
-        # 商品をnameでグループ化
-        from collections import defaultdict
-        product_groups = defaultdict(list)
-        for product in available_products:
-            product_groups[product.name].append(product)
-
-        # ランダムに1つの製品グループを選択
-        group_name = random.choice(list(product_groups.keys()))
-        variants = product_groups[group_name]
-
-        print(f"✓ 選択された製品: {group_name}")
+        print(f"✓ 選択された製品: {variants[0].name}")
         print(f"✓ バリエーション数: {len(variants)}個")
         if len(variants) > 1:
             print(f"  仕様違いの商品を1記事にまとめます")
@@ -414,10 +454,7 @@ class AmazonProductManager:
 
     def get_product_by_asin(self, asin: str) -> Optional[GadgetProduct]:
         """ASINで商品を取得"""
-        for product in self.products:
-            if product.asin == asin:
-                return product
-        return None
+        return self.catalog.get(asin)
 
     def get_all_products(self) -> List[GadgetProduct]:
         """全商品を取得"""
@@ -425,7 +462,7 @@ class AmazonProductManager:
 
     def get_products_by_category(self, category: str) -> List[GadgetProduct]:
         """カテゴリー別に商品を取得"""
-        return [p for p in self.products if p.category == category]
+        return self.catalog.get_by_category(category)
 
 
 def create_sample_products() -> List[GadgetProduct]:
@@ -533,7 +570,6 @@ if __name__ == "__main__":
     manager = AmazonProductManager(products_file)
 
     sample_products = create_sample_products()
-    for product in sample_products:
-        manager.add_product(product)
+    manager.add_products(sample_products)
 
     print(f"{len(sample_products)}件の商品データを保存しました。")
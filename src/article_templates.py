@@ -0,0 +1,204 @@
+"""
+記事セクションのテンプレート
+data/templates/article_sections.json のテンプレートを読み込み時に1回だけコンパイルし、
+（セクション, 製品タイプ）ごとに静的な断片をキャッシュして、商品ごとの差し込み（スロット）だけを埋める
+"""
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from html_builder import HtmlBuilder
+
+# 対応しているテンプレートファイルのバージョン
+TEMPLATE_VERSION = 1
+
+# 既定のテンプレートファイル
+DEFAULT_TEMPLATES_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'templates', 'article_sections.json')
+
+# 製品タイプに一致するテンプレートがない場合に使うキー
+DEFAULT_TYPE = 'default'
+
+Segment = Union[str, Callable[[Dict[str, Any]], str]]
+
+
+def _slot(template: str) -> Segment:
+    """スロット（{category} など）を含む断片は差し込み関数に、含まない断片は文字列のままにする"""
+    if '{' not in template:
+        return template
+    return lambda context: template.format_map(context)
+
+
+def _each_slot(name: str, item_template: str) -> Segment:
+    """リストの値（context[name]）の要素ごとに <li> を繰り返す差し込み関数"""
+    def render(context: Dict[str, Any]) -> str:
+        return "".join(
+            f"  <li>{item_template.format_map({**context, 'item': item})}</li>\n"
+            for item in context.get(name) or []
+        )
+    return render
+
+
+def _compile_element(element: Dict[str, Any], type_items: List[str]) -> List[Segment]:
+    """テンプレートの要素（h2・h3・p・ul）を断片に変換"""
+    if 'h2' in element or 'h3' in element:
+        level = 2 if 'h2' in element else 3
+        return [_slot(HtmlBuilder().heading(level, element[f'h{level}']).build())]
+
+    if 'p' in element:
+        sentences = element['p']
+        if isinstance(sentences, str):
+            sentences = [sentences]
+        return [_slot(HtmlBuilder().paragraph(*sentences).build())]
+
+    if 'ul' in element:
+        segments: List[Segment] = ["<ul>\n"]
+        for item in element['ul']:
+            if isinstance(item, dict) and item.get('type_items'):
+                # 製品タイプごとの項目
+                segments.extend(_slot(f"  <li>{type_item}</li>\n") for type_item in type_items)
+            elif isinstance(item, dict):
+                segments.append(_each_slot(item['each'], item['li']))
+            else:
+                segments.append(_slot(f"  <li>{item}</li>\n"))
+        segments.append("</ul>\n")
+        return segments
+
+    raise ValueError(f"不明なテンプレート要素です: {element}")
+
+
+def compile_elements(elements: List[Dict[str, Any]], type_items: Optional[List[str]] = None) -> List[Segment]:
+    """
+    要素のリストを断片に変換し、連続する静的な断片を1つの文字列にまとめる
+
+    Args:
+        elements: テンプレートの要素
+        type_items: 箇条書きの {"type_items": true} に展開する製品タイプごとの項目
+    """
+    segments: List[Segment] = []
+    for element in elements:
+        for segment in _compile_element(element, type_items or []):
+            if isinstance(segment, str) and segments and isinstance(segments[-1], str):
+                segments[-1] += segment
+            else:
+                segments.append(segment)
+    return segments
+
+
+class ArticleTemplates:
+    """コンパイル済みの記事セクションのテンプレート（ファイルが更新されたら再読み込み）"""
+
+    def __init__(self, templates_file: str = DEFAULT_TEMPLATES_FILE):
+        """
+        初期化
+
+        Args:
+            templates_file: テンプレートのJSONファイルのパス
+        """
+        self.templates_file = templates_file
+        self.version: Optional[int] = None
+        self._compiled: Dict[Tuple[str, str], List[Segment]] = {}
+        self._mtime: Optional[float] = None
+        self.load()
+
+    def load(self):
+        """テンプレートファイルを読み込み、すべての（セクション, 製品タイプ）をコンパイル"""
+        mtime = os.path.getmtime(self.templates_file)
+        with open(self.templates_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        version = data.get('version')
+        if version != TEMPLATE_VERSION:
+            raise ValueError(
+                f"テンプレートのバージョンが対応していません: {version}（対応: {TEMPLATE_VERSION}）"
+            )
+
+        compiled = {}
+        for section, spec in data['sections'].items():
+            product_types = set(spec.get('types', {})) | set(spec.get('type_items', {})) | {DEFAULT_TYPE}
+            for product_type in product_types:
+                compiled[(section, product_type)] = self._compile_section(spec, product_type)
+
+        # コンパイルがすべて成功してから置き換える
+        self.version = version
+        self._compiled = compiled
+        self._mtime = mtime
+
+    @staticmethod
+    def _compile_section(spec: Dict[str, Any], product_type: str) -> List[Segment]:
+        """セクションの共通部分（before・after）と製品タイプごとの部分をまとめてコンパイル"""
+        types = spec.get('types', {})
+        type_items = spec.get('type_items', {})
+        elements = list(spec.get('before', []))
+        elements.extend(types.get(product_type, types.get(DEFAULT_TYPE, [])))
+        elements.extend(spec.get('after', []))
+        return compile_elements(elements, type_items.get(product_type, type_items.get(DEFAULT_TYPE, [])))
+
+    def reload_if_changed(self) -> bool:
+        """
+        ファイルが更新されていれば再読み込み（読み込みに失敗した場合は現在のテンプレートを使い続ける）
+
+        Returns:
+            再読み込みした場合True
+        """
+        try:
+            mtime = os.path.getmtime(self.templates_file)
+        except OSError as e:
+            print(f"記事テンプレートを確認できません（現在のテンプレートを使用します）: {e}")
+            return False
+        if mtime == self._mtime:
+            return False
+
+        try:
+            self.load()
+        except Exception as e:
+            print(f"記事テンプレートの再読み込みに失敗（現在のテンプレートを使用します）: {e}")
+            # 同じファイルを描画のたびに読み直さない（次に更新されたら再び読み込む）
+            self._mtime = mtime
+            return False
+
+        print(f"✓ 記事テンプレートを再読み込みしました（バージョン: {self.version}）")
+        return True
+
+    def _segments(self, section: str, product_type: Optional[str]) -> List[Segment]:
+        """（セクション, 製品タイプ）のコンパイル済みの断片（テンプレートがない製品タイプは default）"""
+        segments = self._compiled.get((section, product_type or DEFAULT_TYPE))
+        if segments is None:
+            segments = self._compiled[(section, DEFAULT_TYPE)]
+        return segments
+
+    def render(self, section: str, product_type: Optional[str] = None, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        セクションを描画
+
+        Args:
+            section: セクション名（例: usage_scenarios）
+            product_type: 製品タイプ（例: マウス。テンプレートがない場合は default を使う）
+            context: スロットに差し込む値（例: {'category': ..., 'top_features': [...]}）
+
+        Returns:
+            セクションのHTML
+        """
+        self.reload_if_changed()
+        context = context or {}
+        return "".join(
+            segment if isinstance(segment, str) else segment(context)
+            for segment in self._segments(section, product_type)
+        )
+
+
+_shared_templates: Dict[str, ArticleTemplates] = {}
+
+
+def get_article_templates(templates_file: Optional[str] = None) -> ArticleTemplates:
+    """
+    プロセス内で共有するテンプレート（ファイルごとに1回だけ読み込む）
+
+    Args:
+        templates_file: テンプレートのJSONファイルのパス（省略時は環境変数 ARTICLE_TEMPLATES_FILE、既定は data/templates/article_sections.json）
+    """
+    templates_file = templates_file or os.getenv('ARTICLE_TEMPLATES_FILE') or DEFAULT_TEMPLATES_FILE
+    templates = _shared_templates.get(templates_file)
+    if templates is None:
+        templates = ArticleTemplates(templates_file)
+        _shared_templates[templates_file] = templates
+    return templates
@@ -0,0 +1,156 @@
+"""
+WordPress REST API 非同期クライアント
+依存関係のない呼び出し（カテゴリー解決、タグ解決、前回投稿の取得、画像アップロード等）を並行実行する
+"""
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from amazon_scraper import GadgetProduct
+from wordpress_client import WordPressClient
+
+
+class AsyncWordPressClient:
+    """WordPressClient の asyncio 版（同時実行数を制限して並行実行）"""
+
+    def __init__(
+        self,
+        site_url: str,
+        username: str,
+        app_password: str,
+        max_concurrency: int = 4,
+        **client_options
+    ):
+        """
+        初期化
+
+        Args:
+            site_url: WordPressサイトのURL（例: https://wwnaoya.com）
+            username: WordPressユーザー名
+            app_password: WordPress Application Password
+            max_concurrency: 同時に実行するリクエストの上限
+            client_options: WordPressClient に渡す追加オプション（タイムアウト、キャッシュ等）
+        """
+        # コネクションプールは同時実行数以上の接続を保持できるようにする
+        client_options.setdefault('pool_maxsize', max(max_concurrency, 10))
+        self.client = WordPressClient(site_url, username, app_password, **client_options)
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_client(cls, client: WordPressClient, max_concurrency: int = 4) -> 'AsyncWordPressClient':
+        """既存の WordPressClient（セッション・キャッシュ）を共有して作成"""
+        instance = cls.__new__(cls)
+        instance.client = client
+        instance.max_concurrency = max_concurrency
+        instance._semaphore = None
+        return instance
+
+    async def _run(self, func, *args, **kwargs):
+        """同期メソッドをスレッドで実行（セマフォで同時実行数を制限）"""
+        # セマフォは実行中のイベントループに紐づけて遅延生成する
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def test_connection(self) -> Dict:
+        """REST API接続とユーザー権限をテスト"""
+        return await self._run(self.client.test_connection)
+
+    async def create_post(self, title: str, content: str, **kwargs) -> Dict:
+        """新しい投稿を作成（引数は WordPressClient.create_post と同じ）"""
+        return await self._run(self.client.create_post, title, content, **kwargs)
+
+    async def update_seo_meta(
+        self,
+        post_id: int,
+        seo_title: str = None,
+        seo_description: str = None,
+        seo_keywords: str = None
+    ):
+        """投稿のSEOメタデータを1回のリクエストで更新"""
+        seo_meta = self.client._build_seo_meta(seo_title, seo_description, seo_keywords)
+        seo_meta = await self._run(self.client._filter_registered_meta, seo_meta)
+        if seo_meta:
+            await self._run(self.client._update_seo_meta, post_id, seo_meta)
+
+    async def upload_media(self, image_url: str, filename: str) -> Dict:
+        """メディアライブラリに画像をアップロード"""
+        return await self._run(self.client.upload_media, image_url, filename)
+
+    async def upload_media_many(self, images: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+        """
+        複数の画像を並行してアップロード
+
+        Args:
+            images: (画像URL, ファイル名) のリスト
+
+        Returns:
+            アップロード結果のリスト（入力と同じ順序、失敗した画像はNone）
+        """
+        results = await asyncio.gather(
+            *(self.upload_media(image_url, filename) for image_url, filename in images),
+            return_exceptions=True
+        )
+
+        uploaded = []
+        for (image_url, _), result in zip(images, results):
+            if isinstance(result, Exception):
+                print(f"⚠ 画像のアップロードに失敗: {image_url} - {result}")
+                uploaded.append(None)
+            else:
+                uploaded.append(result)
+        return uploaded
+
+    async def upload_product_images(self, variants: List[GadgetProduct]) -> Dict[str, Optional[Dict]]:
+        """
+        製品の全バリエーション画像を並行してアップロード
+        同じ画像URLを共有するバリエーションは1回だけアップロードする（アップロード済みの画像はキャッシュを利用）
+
+        Args:
+            variants: 同一製品のバリエーションリスト
+
+        Returns:
+            ASIN -> メディア情報（画像なし・失敗時はNone）
+        """
+        unique_images = {}
+        for variant in variants:
+            if variant.image_url and variant.image_url not in unique_images:
+                unique_images[variant.image_url] = f"{variant.asin}.jpg"
+
+        images = list(unique_images.items())
+        uploaded = await self.upload_media_many(images)
+        media_by_url = {image_url: media for (image_url, _), media in zip(images, uploaded)}
+
+        return {variant.asin: media_by_url.get(variant.image_url) for variant in variants}
+
+    async def get_categories(self) -> List[Dict]:
+        """カテゴリー一覧を取得"""
+        return await self._run(self.client.get_categories)
+
+    async def get_or_create_category(self, name: str) -> int:
+        """カテゴリーを取得または作成してIDを返す"""
+        return await self._run(self.client.get_or_create_category, name)
+
+    async def get_tags(self) -> List[Dict]:
+        """タグ一覧を取得"""
+        return await self._run(self.client.get_tags)
+
+    async def get_or_create_tags(self, tag_names: List[str]) -> List[int]:
+        """タグを取得または作成してIDリストを返す"""
+        return await self._run(self.client.get_or_create_tags, tag_names)
+
+    async def get_latest_post(self) -> Optional[Dict]:
+        """最新の投稿を1件取得（アイキャッチ画像のURLを含む）"""
+        return await self._run(self.client.get_latest_post)
+
+    def close(self):
+        """セッションを閉じる"""
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,102 @@
+"""
+ブランド名の照合
+ブランド辞書から1つの正規表現を作り、商品タイトル中のブランドを1回の走査で見つける
+"""
+import re
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+# 日本語表記などの別名 -> 正式な表記
+# 「デル」は「モデル」などの一般的な語に含まれるため別名に含めない
+BRAND_ALIASES: Dict[str, str] = {
+    "ロジクール": "Logicool",
+    "マイクロソフト": "Microsoft",
+    "サムスン": "Samsung",
+    "クルーシャル": "Crucial",
+    "アンカー": "Anker",
+    "ベンキュー": "BenQ",
+    "Happy Hacking Keyboard": "HHKB",
+    "コルセア": "Corsair",
+    "レイザー": "Razer",
+    "エイスース": "ASUS",
+    "ヒューレット・パッカード": "HP",
+    "レノボ": "Lenovo",
+    "サンディスク": "SanDisk",
+    "ウエスタンデジタル": "Western Digital",
+    "キングストン": "Kingston",
+    "インテル": "Intel",
+    "エヌビディア": "NVIDIA",
+    "ソニー": "Sony",
+    "パナソニック": "Panasonic",
+    "キヤノン": "Canon",
+    "エプソン": "Epson",
+    "バッファロー": "Buffalo",
+    "エレコム": "Elecom",
+    "シーゲート": "Seagate",
+    "トランセンド": "Transcend",
+    "フィリップス": "Philips",
+    "エイサー": "Acer",
+    "アップル": "Apple",
+    "クリエイティブ": "Creative",
+    "サーマルテイク": "Thermaltake",
+}
+
+
+class BrandMatch(NamedTuple):
+    """ブランドの照合結果"""
+    canonical: str  # 正式な表記（別名の場合は変換後）
+    text: str  # 元の文字列中の表記（大文字小文字を保持）
+    start: int
+    end: int
+    is_alias: bool  # 別名（日本語表記など）で一致したかどうか
+
+    @property
+    def display_name(self) -> str:
+        """表示用のブランド名（別名は正式な表記、それ以外は元の表記）"""
+        return self.canonical if self.is_alias else self.text
+
+
+class BrandMatcher:
+    """ブランド辞書を1つの正規表現にまとめた照合器"""
+
+    def __init__(self, brands: Iterable[str], aliases: Optional[Dict[str, str]] = None):
+        """
+        初期化
+
+        Args:
+            brands: ブランド名のリスト（別名を含んでもよい）
+            aliases: 別名 -> 正式な表記（正式な表記が brands にある別名も照合対象に加える）
+        """
+        aliases = BRAND_ALIASES if aliases is None else aliases
+        brands = list(dict.fromkeys(brands))
+        brand_set = set(brands)
+        entries = brands + [alias for alias, canonical in aliases.items() if canonical in brand_set and alias not in brand_set]
+
+        # 小文字化した表記 -> (正式な表記, 別名かどうか)
+        self._canonical: Dict[str, Tuple[str, bool]] = {}
+        for entry in entries:
+            canonical = aliases.get(entry, entry)
+            self._canonical.setdefault(entry.lower(), (canonical, canonical != entry))
+
+        # 長い表記を先に並べ、最も左で一致するもののうち最長のものを選ぶ
+        alternatives = sorted(self._canonical, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(re.escape(entry) for entry in alternatives), re.IGNORECASE)
+
+    def search(self, text: Optional[str]) -> Optional[BrandMatch]:
+        """
+        文字列中で最も左にあるブランド（同じ位置では最長のもの）を探す
+
+        Returns:
+            照合結果（見つからない場合はNone）
+        """
+        if not text:
+            return None
+        match = self._pattern.search(text)
+        if not match:
+            return None
+        canonical, is_alias = self._canonical[match.group(0).lower()]
+        return BrandMatch(canonical, match.group(0), match.start(), match.end(), is_alias)
+
+    def matches(self, *texts: Optional[str]) -> bool:
+        """いずれかの文字列にブランドが含まれるかどうか（1回の走査）"""
+        # 改行はどのブランド名にも含まれないため、文字列をまたいで一致することはない
+        return self._pattern.search('\n'.join(text for text in texts if text)) is not None
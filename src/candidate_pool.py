@@ -0,0 +1,171 @@
+"""
+投稿候補プール
+PA-APIの検索結果（大手メーカーの未投稿商品）をすべて保存し、投稿時はここから取り出す
+"""
+import json
+import os
+import random
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from amazon_scraper import GadgetProduct
+from file_utils import write_json_atomic
+
+
+class CandidatePool:
+    """ファイルに保存する投稿候補のプール"""
+
+    def __init__(self, pool_file: str, low_water: int = 3, max_size: int = 200, ttl: float = 7 * 24 * 3600):
+        """
+        初期化
+
+        Args:
+            pool_file: プールを保存するJSONファイルのパス
+            low_water: 候補がこの数を下回ったら検索で補充する
+            max_size: 保持する候補の上限（超えた分は古いものから削除）
+            ttl: 候補の有効期間（秒）。価格などが古くなった候補は使わない
+        """
+        self.pool_file = pool_file
+        self.low_water = low_water
+        self.max_size = max_size
+        self.ttl = ttl
+        self.candidates: Dict[str, Dict] = {}  # ASIN -> {'added_at': UNIX時刻, 'product': 商品データ}
+        self._reserved: Set[str] = set()  # このプロセスで取り出し、投稿が完了していない候補
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def __contains__(self, asin: str) -> bool:
+        return asin in self.candidates
+
+    def load(self):
+        """プールを読み込み（期限切れの候補は除く）"""
+        self.candidates = {}
+        if not os.path.exists(self.pool_file):
+            return
+        try:
+            with open(self.pool_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.candidates = data.get('candidates', {})
+        except Exception as e:
+            print(f"投稿候補プールの読み込みに失敗: {e}")
+        self._expire()
+
+    def save(self):
+        """プールをアトミックに保存"""
+        write_json_atomic(self.pool_file, {'candidates': self.candidates})
+
+    def add_many(self, products: List[GadgetProduct], is_posted: Optional[Callable[[str], bool]] = None) -> int:
+        """
+        候補を追加（投稿済み・登録済みの商品は除く）
+
+        有効期間は追加した時刻から数えるため、products は取得したばかりの検索結果を渡す
+        （キャッシュを使う場合は max_age で古い結果を除く）。
+
+        Returns:
+            追加した候補の数
+        """
+        now = time.time()
+        added = 0
+        for product in products:
+            if product.asin in self.candidates or (is_posted and is_posted(product.asin)):
+                continue
+            self.candidates[product.asin] = {'added_at': now, 'product': product.to_dict()}
+            added += 1
+
+        # 上限を超えた分は古い候補から削除
+        while len(self.candidates) > self.max_size:
+            del self.candidates[next(iter(self.candidates))]
+
+        if added:
+            self.save()
+        return added
+
+    def discard_posted(self, is_posted: Callable[[str], bool]) -> int:
+        """投稿済みになった候補を削除"""
+        posted = [asin for asin in self.candidates if is_posted(asin)]
+        for asin in posted:
+            del self.candidates[asin]
+            self._reserved.discard(asin)
+        if posted:
+            self.save()
+        return len(posted)
+
+    def _available(self) -> List[str]:
+        """取り出していない候補のASIN"""
+        return [asin for asin in self.candidates if asin not in self._reserved]
+
+    def available_count(self) -> int:
+        """取り出していない候補数（取り出し中の候補は含まない）"""
+        return len(self._available())
+
+    def needs_refill(self) -> bool:
+        """取り出せる候補数が補充の基準を下回っているかどうか"""
+        return len(self._available()) < self.low_water
+
+    def reserve(self, rng: Optional[random.Random] = None) -> Optional[GadgetProduct]:
+        """
+        候補をランダムに1つ取り出す（プールには残し、このプロセスでは再び選ばない）
+
+        投稿に成功したら complete で削除する。投稿に失敗した場合はプールに残り、次回の実行で再び候補になる。
+        """
+        available = self._available()
+        if not available:
+            return None
+        asin = (rng or random).choice(available)
+        self._reserved.add(asin)
+        return GadgetProduct(**self.candidates[asin]['product'])
+
+    def complete(self, asin: str):
+        """投稿が完了した候補をプールから削除"""
+        self._reserved.discard(asin)
+        if self.candidates.pop(asin, None) is not None:
+            self.save()
+
+    def take(
+        self,
+        search: Callable[[], List[GadgetProduct]],
+        is_posted: Callable[[str], bool],
+        max_searches: int = 10
+    ) -> Optional[GadgetProduct]:
+        """
+        未投稿の候補を1つ取り出す（候補が少ない場合のみ検索して補充）
+
+        候補が残っている場合の補充は1回の検索にとどめ、空の場合は見つかるまで最大 max_searches 回検索する。
+        取り出した候補は投稿に成功して complete を呼ぶまでプールに残る。
+
+        Args:
+            search: 商品を検索する関数（検索結果のすべてを候補にする）
+            is_posted: ASINが投稿済みかどうかを返す関数
+            max_searches: 検索回数の上限
+
+        Returns:
+            候補の商品（見つからない場合はNone）
+        """
+        self._expire()
+        self.discard_posted(is_posted)
+
+        searches = 0
+        while self.needs_refill() and searches < max_searches:
+            if searches > 0 and self._available():
+                break
+            searches += 1
+            try:
+                products = search()
+            except Exception as e:
+                # 検索の失敗は空の検索結果と同じ扱い（次の検索を試す）
+                print(f"投稿候補の検索に失敗しました: {e}")
+                continue
+            added = self.add_many(products, is_posted)
+            print(f"投稿候補を{added}件追加しました（候補数: {len(self.candidates)}件）")
+
+        return self.reserve()
+
+    def _expire(self):
+        """有効期間を過ぎた候補を削除"""
+        now = time.time()
+        expired = [asin for asin, entry in self.candidates.items() if now - entry.get('added_at', 0) >= self.ttl]
+        for asin in expired:
+            del self.candidates[asin]
+            self._reserved.discard(asin)
@@ -0,0 +1,108 @@
+"""
+商品カタログの差分マージ
+新たに取得した商品を既存のカタログとASINで突き合わせ、追加・更新・期限切れ（stale）・削除を判定する
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    # amazon_scraper からインポートされるため、実行時には循環インポートを避ける
+    from amazon_scraper import GadgetProduct
+
+# PA-APIの取得結果で更新する項目（商品名・説明文・カテゴリーなどの編集済みの項目は維持する）
+MERGE_FIELDS = ('url', 'price', 'image_url', 'features', 'original_title')
+
+# 取得結果に含まれなくなった商品を残しておく日数
+STALE_GRACE_DAYS = 30
+
+
+@dataclass
+class MergeSummary:
+    """マージ結果の集計"""
+    added: List[str] = field(default_factory=list)  # 追加したASIN
+    updated: List[str] = field(default_factory=list)  # 項目を更新したASIN
+    unchanged: List[str] = field(default_factory=list)  # 変更のなかったASIN
+    stale: List[str] = field(default_factory=list)  # 取得結果に含まれず、猶予期間中のASIN
+    removed: List[str] = field(default_factory=list)  # 猶予期間を過ぎて削除したASIN
+
+    def describe(self) -> str:
+        """集計の表示用文字列"""
+        return (
+            f"追加: {len(self.added)}件、更新: {len(self.updated)}件、変更なし: {len(self.unchanged)}件、"
+            f"期限切れ（猶予中）: {len(self.stale)}件、削除: {len(self.removed)}件"
+        )
+
+    def to_dict(self) -> Dict[str, int]:
+        """件数のみの辞書（メタデータへの保存用）"""
+        return {
+            'added': len(self.added),
+            'updated': len(self.updated),
+            'unchanged': len(self.unchanged),
+            'stale': len(self.stale),
+            'removed': len(self.removed)
+        }
+
+
+def merge_catalog(
+    existing: List['GadgetProduct'],
+    fresh: List['GadgetProduct'],
+    grace_days: int = STALE_GRACE_DAYS,
+    now: Optional[datetime] = None
+) -> MergeSummary:
+    """
+    新たに取得した商品を既存の商品と突き合わせ、既存の商品オブジェクトを直接更新する
+
+    - 取得結果にある既存の商品: MERGE_FIELDS のうち変わった項目を更新し、期限切れを解除
+    - 取得結果にない既存の商品: 期限切れとして記録し、猶予期間を過ぎたら削除対象にする
+    - 新しい商品: 追加対象にする
+
+    Args:
+        existing: 既存の商品
+        fresh: 新たに取得した商品
+        grace_days: 取得結果に含まれなくなった商品を残す日数
+        now: 現在日時（省略時は datetime.now()）
+
+    Returns:
+        マージ結果（追加・削除の反映は呼び出し側で行う）
+    """
+    now = now or datetime.now()
+    summary = MergeSummary()
+    existing_by_asin = {product.asin: product for product in existing}
+    fresh_by_asin: Dict[str, 'GadgetProduct'] = {}
+    for product in fresh:
+        fresh_by_asin.setdefault(product.asin, product)
+
+    for asin, new in fresh_by_asin.items():
+        old = existing_by_asin.get(asin)
+        if old is None:
+            new.last_refreshed = now.isoformat()
+            summary.added.append(asin)
+            continue
+
+        old.last_refreshed = now.isoformat()
+
+        changed = False
+        for name in MERGE_FIELDS:
+            value = getattr(new, name)
+            # 取得できなかった項目は既存の値を残す
+            if value and value != getattr(old, name):
+                setattr(old, name, value)
+                changed = True
+        if old.stale_since:
+            old.stale_since = None
+            changed = True
+        (summary.updated if changed else summary.unchanged).append(asin)
+
+    expire_before = now - timedelta(days=grace_days)
+    for asin, old in existing_by_asin.items():
+        if asin in fresh_by_asin:
+            continue
+        if not old.stale_since:
+            old.stale_since = now.isoformat()
+        if datetime.fromisoformat(old.stale_since) <= expire_before:
+            summary.removed.append(asin)
+        else:
+            summary.stale.append(asin)
+
+    return summary
@@ -0,0 +1,16 @@
+"""
+ファイル書き込みのユーティリティ
+"""
+import json
+import os
+
+
+def write_json_atomic(path: str, data):
+    """一時ファイルに書き出してから置き換える（書き込み途中のクラッシュでファイルを壊さない）"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
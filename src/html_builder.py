@@ -0,0 +1,134 @@
+"""
+HTML・Gutenbergブロックのビルダー
+記事の断片をリストに集めて最後に1回だけ連結する（文字列の繰り返し連結による再コピーを避ける）
+"""
+import json
+from contextlib import contextmanager
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence
+
+
+def _block_comment(name: str, attrs: Optional[Dict[str, Any]] = None) -> str:
+    """ブロックの開始コメント（属性はGutenbergと同じく空白なしのJSON）"""
+    if attrs:
+        return f"<!-- wp:{name} {json.dumps(attrs, ensure_ascii=False, separators=(',', ':'))} -->\n"
+    return f"<!-- wp:{name} -->\n"
+
+
+class HtmlBuilder:
+    """HTMLの断片を集めて連結するビルダー"""
+
+    def __init__(self):
+        self._parts: List[str] = []
+
+    def raw(self, *fragments: str) -> 'HtmlBuilder':
+        """断片をそのまま追加"""
+        self._parts.extend(fragments)
+        return self
+
+    def blank(self) -> 'HtmlBuilder':
+        """空行（改行）を追加"""
+        self._parts.append("\n")
+        return self
+
+    def heading(self, level: int, text: str) -> 'HtmlBuilder':
+        """見出し（<h2> など）"""
+        self._parts.append(f"<h{level}>{text}</h{level}>\n")
+        return self
+
+    def paragraph(self, *sentences: str) -> 'HtmlBuilder':
+        """段落（複数の文を1つの<p>にまとめる）"""
+        self._parts.append("<p>")
+        self._parts.extend(sentences)
+        self._parts.append("</p>\n")
+        return self
+
+    def bullet_list(self, items: Iterable[str]) -> 'HtmlBuilder':
+        """箇条書き（<ul>）"""
+        self._parts.append("<ul>\n")
+        self._parts.extend(f"  <li>{item}</li>\n" for item in items)
+        self._parts.append("</ul>\n")
+        return self
+
+    def table(self, headers: Sequence[str], rows: Iterable[Sequence[str]]) -> 'HtmlBuilder':
+        """表（見出し行＋本文の行）"""
+        self._parts.append("<table>\n<thead>\n<tr>\n")
+        self._parts.extend(f"<th>{header}</th>\n" for header in headers)
+        self._parts.append("</tr>\n</thead>\n<tbody>\n")
+        for row in rows:
+            self._parts.append("<tr>\n")
+            self._parts.extend(f"<td>{cell}</td>\n" for cell in row)
+            self._parts.append("</tr>\n")
+        self._parts.append("</tbody>\n</table>\n")
+        return self
+
+    @contextmanager
+    def wp_block(self, name: str, html_open: str, html_close: str = "</div>",
+                 attrs: Optional[Dict[str, Any]] = None) -> Iterator['HtmlBuilder']:
+        """入れ子にできるGutenbergブロック（開始コメント＋開始タグ … 終了タグ＋終了コメント）"""
+        self._parts.append(_block_comment(name, attrs))
+        self._parts.append(f"{html_open}\n")
+        yield self
+        self._parts.append(f"{html_close}\n")
+        self._parts.append(f"<!-- /wp:{name} -->\n")
+
+    def wp_columns(self) -> ContextManager['HtmlBuilder']:
+        """カラムブロック（wp:columns）"""
+        return self.wp_block('columns', "<div class=\"wp-block-columns\">")
+
+    def wp_column(self, width: str = "50%", vertical_alignment: Optional[str] = None) -> ContextManager['HtmlBuilder']:
+        """カラム（wp:column）"""
+        attrs: Dict[str, Any] = {'width': width}
+        class_name = "wp-block-column"
+        if vertical_alignment:
+            attrs['verticalAlignment'] = vertical_alignment
+            class_name += f" is-vertically-aligned-{vertical_alignment}"
+        return self.wp_block('column', f"<div class=\"{class_name}\" style=\"flex-basis:{width}\">", attrs=attrs)
+
+    def wp_buttons(self, justify: str = "right") -> ContextManager['HtmlBuilder']:
+        """ボタンのグループ（wp:buttons）"""
+        return self.wp_block(
+            'buttons', "<div class=\"wp-block-buttons\">",
+            attrs={'layout': {'type': 'flex', 'justifyContent': justify}}
+        )
+
+    def wp_paragraph(self, text: str) -> 'HtmlBuilder':
+        """段落ブロック（wp:paragraph）"""
+        self._parts.append(f"<!-- wp:paragraph -->\n<p>{text}</p>\n<!-- /wp:paragraph -->\n")
+        return self
+
+    def wp_image(self, src: str, alt: str) -> 'HtmlBuilder':
+        """画像ブロック（wp:image）"""
+        self._parts.append(
+            f"<!-- wp:image -->\n<figure class=\"wp-block-image\"><img src=\"{src}\" alt=\"{alt}\"/></figure>\n"
+            "<!-- /wp:image -->\n"
+        )
+        return self
+
+    def wp_button(self, href: str, label: str, background: str,
+                  radius: Optional[str] = None, new_tab: bool = False) -> 'HtmlBuilder':
+        """ボタンブロック（wp:button、背景色・角丸を指定）"""
+        style: Dict[str, Any] = {'color': {'background': background}}
+        if radius:
+            style['border'] = {'radius': radius}
+        target = " target=\"_blank\" rel=\"noopener noreferrer\"" if new_tab else ""
+        inline_style = f"border-radius:{radius};" if radius else ""
+        self._parts.append(_block_comment('button', {'backgroundColor': 'custom', 'style': style}))
+        self._parts.append(
+            f"<div class=\"wp-block-button\"><a class=\"wp-block-button__link wp-element-button\" href=\"{href}\"{target}"
+            f" style=\"{inline_style}background-color:{background}\">{label}</a></div>\n"
+        )
+        self._parts.append("<!-- /wp:button -->\n")
+        return self
+
+    def wp_spacer(self, height: str) -> 'HtmlBuilder':
+        """スペーサーブロック（wp:spacer）"""
+        self._parts.append(
+            f"{_block_comment('spacer', {'height': height})}"
+            f"<div style=\"height:{height}\" aria-hidden=\"true\" class=\"wp-block-spacer\"></div>\n"
+            "<!-- /wp:spacer -->\n"
+        )
+        return self
+
+    def build(self) -> str:
+        """集めた断片を1回だけ連結"""
+        return "".join(self._parts)
@@ -3,14 +3,163 @@
 WordPress ガジェットブログ自動投稿スクリプト
 """
 
+import asyncio
 import os
 import sys
-import time
+from typing import Dict, List, Optional, Tuple
 from wordpress_client import WordPressClient
+from async_wordpress_client import AsyncWordPressClient
 from amazon_scraper import AmazonProductManager, GadgetProduct
+from candidate_pool import CandidatePool
 from post_generator import BlogPostGenerator
 
 
+async def prefetch_wordpress_data(wp_client: WordPressClient, product: GadgetProduct) -> Tuple[Optional[Dict], Optional[int]]:
+    """
+    互いに依存しないWordPressへの問い合わせを並行実行
+
+    Returns:
+        (前回の投稿情報, カテゴリーID)
+    """
+    async_client = AsyncWordPressClient.from_client(wp_client)
+    previous_result, category_result = await asyncio.gather(
+        async_client.get_latest_post(),
+        async_client.get_or_create_category(product.category),
+        return_exceptions=True
+    )
+
+    # 前回の投稿を取得（関連記事セクション用）
+    previous_post = None
+    if isinstance(previous_result, Exception):
+        print(f"⚠ 前回の投稿取得に失敗: {previous_result}")
+    elif previous_result:
+        previous_post = previous_result
+        print(f"✓ 前回の投稿を取得しました: {previous_post['title']}")
+    else:
+        print("⚠ 前回の投稿が見つかりませんでした（初回投稿の可能性）")
+
+    # カテゴリーの準備（403エラーの場合はスキップ）
+    category_id = None
+    if isinstance(category_result, Exception):
+        # カテゴリー設定に失敗してもスキップして続行
+        print(f"⚠ カテゴリー設定をスキップします: {str(category_result)[:100]}")
+        print("  カテゴリーなしで投稿を続行します...")
+    else:
+        category_id = category_result
+        print(f"✓ カテゴリー設定: {product.category} (ID: {category_id})")
+
+    return previous_post, category_id
+
+
+def select_product_variants(
+    product_manager: AmazonProductManager,
+    paapi_client,
+    products_file: str,
+    candidate_pool: Optional[CandidatePool] = None
+) -> List[GadgetProduct]:
+    """
+    投稿する商品（同一製品のバリエーション）を選択
+
+    Args:
+        product_manager: 商品マネージャー
+        paapi_client: PA-APIクライアント（Noneの場合はローカルデータを使用）
+        products_file: 商品データファイルのパス（エラー表示用）
+        candidate_pool: PA-APIの検索結果を保存する投稿候補プール
+
+    Returns:
+        同一製品のバリエーションリスト（見つからない場合は空リスト）
+    """
+    product = None
+
+    if paapi_client and candidate_pool is not None:
+        # 投稿候補プールから取り出し、候補が少ない場合のみPA-APIで検索して補充
+        # PA-APIのレート制限はクライアント内のレートリミッターが待機を管理する
+        # 候補の有効期間は追加時から数えるため、補充にはキャッシュの古い検索結果（価格）を使わない
+        try:
+            product = candidate_pool.take(
+                lambda: paapi_client.search_random_keyword(max_age=paapi_client.ITEM_CACHE_TTL),
+                is_posted=product_manager.posted_asins.__contains__,
+                max_searches=10
+            )
+            if product:
+                print(f"✓ 投稿候補プールから選択しました（投稿後の残り: {candidate_pool.available_count()}件）")
+            else:
+                print("警告: PA-APIで未投稿の商品が見つかりませんでした。ローカルデータを使用します。")
+        except Exception as e:
+            print(f"警告: PA-APIの使用中にエラーが発生しました - {e}")
+            import traceback
+            traceback.print_exc()
+            print("ローカルの商品データを使用します。")
+
+    # PA-APIから取得した場合は単一商品
+    if product:
+        return [product]
+
+    # ローカルの商品データを使用（フォールバック）
+    if not product_manager.get_all_products():
+        print("エラー: 商品データが見つかりません。")
+        print(f"products.json ファイルを {products_file} に配置してください。")
+        return []
+
+    print(f"✓ {len(product_manager.get_all_products())}件のローカル商品データを読み込みました。")
+
+    # 同一製品のバリエーションをすべて取得
+    product_variants = product_manager.get_product_variants()
+    if not product_variants:
+        print("エラー: 投稿する商品が見つかりません。")
+    return product_variants
+
+
+def publish_post(
+    wp_client: WordPressClient,
+    generator: BlogPostGenerator,
+    product_variants: List[GadgetProduct],
+    previous_post: Optional[Dict],
+    category_id: Optional[int],
+    post_status: str
+) -> Dict:
+    """
+    記事を生成してWordPressに投稿
+
+    Args:
+        wp_client: WordPressクライアント
+        generator: 記事ジェネレーター
+        product_variants: 同一製品のバリエーションリスト（先頭がメイン商品）
+        previous_post: 前回の投稿情報（関連記事セクション用）
+        category_id: カテゴリーID（Noneの場合はカテゴリーなし）
+        post_status: 投稿ステータス
+
+    Returns:
+        作成された投稿の情報
+    """
+    # メイン商品（最初のバリエーション）
+    product = product_variants[0]
+
+    # ブログ記事生成（バリエーション対応、関連記事付き）
+    post = generator.render_post(product, variants=product_variants, previous_post=previous_post)
+
+    print(f"記事タイトル: {post.title}")
+    print(f"メタディスクリプション: {post.meta_description}")
+    print(f"SEOタイトル: {post.seo_title}")
+    print(f"SEOキーワード: {post.seo_keywords}")
+    print("-" * 50)
+
+    # 記事を投稿
+    post_data = wp_client.create_post(
+        title=post.title,
+        content=post.content,
+        status=post_status,
+        categories=[category_id] if category_id else None,
+        tags=None,
+        excerpt=post.excerpt,
+        seo_title=post.seo_title,
+        seo_description=post.meta_description,
+        seo_keywords=post.seo_keywords
+    )
+
+    return post_data
+
+
 def main():
     """メイン処理"""
 
@@ -19,6 +168,7 @@ def main():
     wp_username = os.getenv('WP_USERNAME')
     wp_app_password = os.getenv('WP_APP_PASSWORD')
     post_status = os.getenv('POST_STATUS', 'draft')  # draft または publish
+    post_count = max(1, int(os.getenv('POST_COUNT', '1')))  # 1回の実行で投稿する記事数
 
     # 必須環境変数のチェック
     if not wp_username or not wp_app_password:
@@ -27,11 +177,20 @@ def main():
 
     print(f"WordPress サイト: {wp_site_url}")
     print(f"投稿ステータス: {post_status}")
+    if post_count > 1:
+        print(f"一括投稿モード: {post_count}記事")
     print("-" * 50)
 
     # WordPress クライアント初期化
     try:
-        wp_client = WordPressClient(wp_site_url, wp_username, wp_app_password)
+        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+        wp_client = WordPressClient(
+            wp_site_url,
+            wp_username,
+            wp_app_password,
+            taxonomy_cache_file=os.path.join(data_dir, 'taxonomy_cache.json'),
+            media_cache_file=os.path.join(data_dir, 'media_cache.json')
+        )
         print("✓ WordPress REST API クライアントを初期化しました。")
 
         # 接続と認証のテスト（エラーでも続行）
@@ -46,133 +205,83 @@ def main():
         traceback.print_exc()
         sys.exit(1)
 
-    # 前回の投稿を取得（関連記事セクション用）
-    previous_post = None
-    try:
-        previous_post = wp_client.get_latest_post()
-        if previous_post:
-            print(f"✓ 前回の投稿を取得しました: {previous_post['title']}")
-        else:
-            print("⚠ 前回の投稿が見つかりませんでした（初回投稿の可能性）")
-    except Exception as e:
-        print(f"⚠ 前回の投稿取得に失敗: {e}")
-
     # 商品マネージャーを初期化（50日経過チェックと自動リフレッシュを含む）
     products_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'products.json')
     product_manager = AmazonProductManager(products_file)
 
     # Amazon PA-APIを使用して商品を自動取得
     use_paapi = os.getenv('USE_AMAZON_PAAPI', 'true').lower() == 'true'
-    product = None
+    paapi_client = None
+    candidate_pool = None
 
     if use_paapi:
-        # PA-APIから商品を取得
         try:
             from amazon_paapi_client import AmazonPAAPIClient
             print("Amazon PA-APIを使用して商品を検索中...")
-            print("PA-API 5.0 レート制限: 10秒に1リクエスト（安全マージン込みで12秒）")
+            print("PA-API 5.0 レート制限: 10秒に1リクエスト（レートリミッターで自動調整）")
             paapi_client = AmazonPAAPIClient()
-
-            # 投稿済みでない商品を取得するまでリトライ
-            # PA-API 5.0のレート制限を考慮: 10秒に1リクエスト + 安全マージン2秒 = 12秒
-            max_attempts = 10
-            request_interval = 12.0  # 秒
-
-            for attempt in range(max_attempts):
-                # 2回目以降のリクエストでは12秒待機
-                if attempt > 0:
-                    print(f"PA-APIレート制限を考慮し、{request_interval}秒待機中...")
-                    time.sleep(request_interval)
-
-                candidate = paapi_client.get_random_product()
-                if candidate and candidate.asin not in product_manager.posted_asins:
-                    product = candidate
-                    break
-                elif candidate:
-                    print(f"商品 {candidate.asin} は投稿済みです。別の商品を検索中... ({attempt + 1}/{max_attempts})")
-
-            if not product:
-                print("警告: PA-APIで未投稿の商品が見つかりませんでした。ローカルデータを使用します。")
-                use_paapi = False
+            candidate_pool = CandidatePool(os.path.join(data_dir, 'candidate_pool.json'))
+            print(f"✓ 投稿候補プール: {len(candidate_pool)}件")
         except Exception as e:
             print(f"警告: PA-APIの使用中にエラーが発生しました - {e}")
             import traceback
             traceback.print_exc()
             print("ローカルの商品データを使用します。")
-            use_paapi = False
-
-    # 商品バリエーションを取得（同じ製品の仕様違いをまとめる）
-    product_variants = []
+            paapi_client = None
+            candidate_pool = None
 
-    if not use_paapi:
-        # ローカルの商品データを使用（フォールバック）
-        if not product_manager.get_all_products():
-            print("エラー: 商品データが見つかりません。")
-            print(f"products.json ファイルを {products_file} に配置してください。")
-            sys.exit(1)
+    # クライアント・キャッシュ・商品マネージャーは全記事で共有する
+    generator = BlogPostGenerator()
+    previous_post = None
+    posted_count_in_run = 0
 
-        print(f"✓ {len(product_manager.get_all_products())}件のローカル商品データを読み込みました。")
+    for post_index in range(post_count):
+        if post_count > 1:
+            print("=" * 50)
+            print(f"[{post_index + 1}/{post_count}] 記事を作成します")
+            print("=" * 50)
 
-        # 同一製品のバリエーションをすべて取得
-        product_variants = product_manager.get_product_variants()
+        # 商品バリエーションを取得（同じ製品の仕様違いをまとめる）
+        product_variants = select_product_variants(product_manager, paapi_client, products_file, candidate_pool)
         if not product_variants:
-            print("エラー: 投稿する商品が見つかりません。")
+            if posted_count_in_run > 0:
+                break
             sys.exit(1)
-    else:
-        # PA-APIから取得した場合は単一商品
-        if product:
-            product_variants = [product]
 
-    # メイン商品（最初のバリエーション）
-    product = product_variants[0]
-
-    print(f"選択された商品: {product.name}")
-    print(f"商品ASIN: {product.asin}")
-    if len(product_variants) > 1:
-        print(f"バリエーション: {len(product_variants)}個の仕様違いを1記事にまとめます")
-    print("-" * 50)
+        # メイン商品（最初のバリエーション）
+        product = product_variants[0]
 
-    # ブログ記事生成（バリエーション対応、関連記事付き）
-    generator = BlogPostGenerator()
-    title = generator.generate_title(product)
-    content = generator.generate_post_content(product, variants=product_variants, previous_post=previous_post)
-    meta_description = generator.generate_meta_description(product)
-    seo_title = generator.generate_seo_title(product, post_title=title)  # 投稿タイトルをSEOタイトルとして使用
-    seo_keywords = generator.generate_seo_keywords(product)
-
-    print(f"記事タイトル: {title}")
-    print(f"メタディスクリプション: {meta_description}")
-    print(f"SEOタイトル: {seo_title}")
-    print(f"SEOキーワード: {seo_keywords}")
-    print("-" * 50)
+        print(f"選択された商品: {product.name}")
+        print(f"商品ASIN: {product.asin}")
+        if len(product_variants) > 1:
+            print(f"バリエーション: {len(product_variants)}個の仕様違いを1記事にまとめます")
+        print("-" * 50)
 
-    # カテゴリーの準備（403エラーの場合はスキップ）
-    category_id = None
-    try:
-        # カテゴリーの取得または作成を試みる
-        category_id = wp_client.get_or_create_category(product.category)
-        print(f"✓ カテゴリー設定: {product.category} (ID: {category_id})")
-    except Exception as e:
-        # カテゴリー設定に失敗してもスキップして続行
-        print(f"⚠ カテゴリー設定をスキップします: {str(e)[:100]}")
-        print("  カテゴリーなしで投稿を続行します...")
+        if post_index == 0:
+            # 前回の投稿（関連記事セクション用）とカテゴリーを並行して取得
+            previous_post, category_id = asyncio.run(prefetch_wordpress_data(wp_client, product))
+        else:
+            # 2記事目以降は直前に投稿した記事を関連記事とする（カテゴリーはキャッシュ済み）
+            try:
+                category_id = wp_client.get_or_create_category(product.category)
+                print(f"✓ カテゴリー設定: {product.category} (ID: {category_id})")
+            except Exception as e:
+                print(f"⚠ カテゴリー設定をスキップします: {str(e)[:100]}")
+                category_id = None
 
-    # 記事を投稿
-    try:
-        post_data = wp_client.create_post(
-            title=title,
-            content=content,
-            status=post_status,
-            categories=[category_id] if category_id else None,
-            tags=None,
-            excerpt=meta_description,
-            seo_title=seo_title,
-            seo_description=meta_description,
-            seo_keywords=seo_keywords
-        )
+        try:
+            post_data = publish_post(wp_client, generator, product_variants, previous_post, category_id, post_status)
+        except Exception as e:
+            print(f"エラー: 記事の投稿に失敗しました - {e}")
+            import traceback
+            traceback.print_exc()
+            if post_count > 1:
+                continue
+            sys.exit(1)
 
         post_url = post_data.get('link', '')
         post_id = post_data.get('id', '')
+        posted_count_in_run += 1
 
         print("=" * 50)
         print("✓ 記事の投稿に成功しました!")
@@ -182,29 +291,37 @@ def main():
         print("=" * 50)
 
         # 投稿成功後、すべてのバリエーションを投稿済みとしてマーク
-        for variant in product_variants:
-            product_manager.mark_as_posted(variant.asin)
-
-        # 投稿済み商品の統計を表示
-        total_products = len(product_manager.get_all_products())
-        posted_count = len(product_manager.posted_asins)
-        remaining_count = total_products - posted_count
+        product_manager.mark_many_as_posted([variant.asin for variant in product_variants], post_id or None)
+        if candidate_pool is not None:
+            # 投稿候補プールから選んだ商品は、投稿済みにしてから削除する（投稿に失敗した場合は次回も候補に残す）
+            candidate_pool.complete(product.asin)
+
+        # 次の記事から今回の記事へリンクする
+        previous_post = {
+            'title': post_data.get('title', {}).get('rendered', ''),
+            'link': post_url,
+            'featured_image_url': product.image_url or ''
+        }
+
+    if posted_count_in_run == 0:
+        sys.exit(1)
 
-        print("\n商品投稿状況:")
-        print(f"  総商品数: {total_products}個")
-        print(f"  投稿済み: {posted_count}個")
-        print(f"  残り: {remaining_count}個")
+    # 投稿済み商品の統計を表示
+    total_products = len(product_manager.get_all_products())
+    posted_count = len(product_manager.posted_asins)
+    remaining_count = total_products - posted_count
 
-        if remaining_count == 0:
-            print("  ⚠ 全商品の投稿が完了しました。次回実行時に履歴がリセットされます。")
+    print("\n商品投稿状況:")
+    if post_count > 1:
+        print(f"  今回の投稿数: {posted_count_in_run}/{post_count}記事")
+    print(f"  総商品数: {total_products}個")
+    print(f"  投稿済み: {posted_count}個")
+    print(f"  残り: {remaining_count}個")
 
-        return 0
+    if remaining_count == 0:
+        print("  ⚠ 全商品の投稿が完了しました。次回以降は最も古く投稿した商品から再投稿します。")
 
-    except Exception as e:
-        print(f"エラー: 記事の投稿に失敗しました - {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+"""
+アップロード済みメディアのキャッシュ
+画像URLとコンテンツのハッシュ（SHA-256）から、WordPressのメディアIDを引けるようにする
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from file_utils import write_json_atomic
+
+
+class MediaCache:
+    """画像URL・コンテンツハッシュ → WordPressメディアの対応表（ディスクに永続化）"""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        初期化
+
+        Args:
+            cache_file: キャッシュを保存するJSONファイルのパス（省略時はメモリのみ）
+        """
+        self.cache_file = cache_file
+        self.urls: Dict[str, str] = {}  # 画像URL -> SHA-256
+        self.media: Dict[str, Dict] = {}  # SHA-256 -> メディア情報（id, source_url, filename）
+        self._lock = threading.RLock()
+        self.load()
+
+    def load(self):
+        """キャッシュをファイルから読み込み"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.urls = data.get('urls', {})
+            self.media = data.get('media', {})
+        except Exception as e:
+            print(f"メディアキャッシュの読み込みに失敗: {e}")
+            self.urls = {}
+            self.media = {}
+
+    def save(self):
+        """キャッシュをファイルにアトミックに保存"""
+        if not self.cache_file:
+            return
+
+        with self._lock:
+            try:
+                write_json_atomic(self.cache_file, {'urls': self.urls, 'media': self.media})
+            except Exception as e:
+                print(f"メディアキャッシュの保存に失敗: {e}")
+
+    def get_by_url(self, image_url: str) -> Optional[Dict]:
+        """画像URLからアップロード済みメディアを取得"""
+        with self._lock:
+            digest = self.urls.get(image_url)
+            return self.media.get(digest) if digest else None
+
+    def get_by_hash(self, digest: str) -> Optional[Dict]:
+        """コンテンツのハッシュからアップロード済みメディアを取得"""
+        with self._lock:
+            return self.media.get(digest)
+
+    def add_url(self, image_url: str, digest: str):
+        """画像URLと既存メディアのハッシュを関連付け"""
+        with self._lock:
+            self.urls[image_url] = digest
+            self.save()
+
+    def add(self, image_url: str, digest: str, media: Dict) -> Dict:
+        """
+        アップロードしたメディアを登録
+
+        Args:
+            image_url: 元画像のURL
+            digest: 画像データのSHA-256
+            media: WordPressのメディアAPIのレスポンス
+
+        Returns:
+            キャッシュに登録したメディア情報
+        """
+        entry = {
+            'id': media.get('id'),
+            'source_url': media.get('source_url', ''),
+            'filename': media.get('media_details', {}).get('file', ''),
+            'uploaded_at': time.time()
+        }
+        with self._lock:
+            self.media[digest] = entry
+            self.urls[image_url] = digest
+            self.save()
+        return entry
+
+    def invalidate(self, media_id: int):
+        """WordPress側で削除されたメディアをキャッシュから除外"""
+        with self._lock:
+            digests = [digest for digest, entry in self.media.items() if entry.get('id') == media_id]
+            for digest in digests:
+                del self.media[digest]
+            self.urls = {url: digest for url, digest in self.urls.items() if digest not in digests}
+            self.save()
@@ -0,0 +1,150 @@
+"""
+商品名の正規化
+商品タイトルからタイトル用の短い商品名と本文用の商品名を1回の処理で作る
+（正規表現と参照テーブルはインポート時に1回だけ構築し、結果はLRUキャッシュで再利用する）
+"""
+import re
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Tuple
+
+from brand_matcher import BrandMatcher
+
+# 商品名の短縮で使う主要ブランド名（日本語表記の別名も照合する）
+NAME_BRAND_MATCHER = BrandMatcher([
+    "Logitech", "Logicool", "Microsoft", "Samsung", "Crucial", "Anker", "BenQ",
+    "HHKB", "Corsair", "Razer", "ASUS", "Dell", "HP", "Lenovo", "Sony",
+    "Kingston", "Western Digital", "WD", "SanDisk", "Intel", "AMD", "NVIDIA",
+    "Seagate", "LG", "Acer", "MSI", "Gigabyte", "ASRock", "EVGA",
+    "HyperX", "G.Skill", "Thermaltake", "Cooler Master", "NZXT"
+])
+
+# PCパーツのカテゴリー（先に一致したものを使う）
+PC_PARTS_CATEGORIES: Tuple[str, ...] = ("SSD", "メモリ", "グラフィックボード", "CPU", "マザーボード", "電源ユニット")
+
+# 一般的な製品名（ブランド名とスペースなしで結合する）
+GENERIC_PRODUCT_NAMES: Tuple[str, ...] = (
+    "USB", "コンセント", "充電器", "ケーブル", "アダプター", "アダプタ",
+    "ハブ", "スタンド", "マウスパッド", "リストレスト", "カバー",
+    "フィルム", "保護フィルム", "バッテリー", "モバイルバッテリー",
+    "スピーカー", "イヤホン", "ヘッドホン", "マイク", "Webカメラ",
+    "キーボード", "マウス", "モニター", "ディスプレイ"
+)
+
+# PC周辺機器の製品タイプと検出キーワード（小文字、先に一致したものを使う）
+PRODUCT_TYPES: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (product_type, tuple(keyword.lower() for keyword in keywords))
+    for product_type, keywords in (
+        ("マウス", ("マウス", "mouse")),
+        ("キーボード", ("キーボード", "keyboard")),
+        ("モニター", ("モニター", "ディスプレイ", "monitor", "display")),
+        ("ヘッドセット", ("ヘッドセット", "headset")),
+        ("ヘッドホン", ("ヘッドホン", "headphone")),
+        ("イヤホン", ("イヤホン", "earphone")),
+        ("スピーカー", ("スピーカー", "speaker")),
+        ("Webカメラ", ("Webカメラ", "webcam", "カメラ")),
+        ("マイク", ("マイク", "microphone")),
+        ("充電器", ("充電器", "charger")),
+        ("ケーブル", ("ケーブル", "cable")),
+        ("ハブ", ("ハブ", "hub")),
+    )
+)
+
+# 【...】内・[...]内の文字列
+_LENTICULAR_BRACKETS_PATTERN = re.compile(r'【[^】]*】')
+_SQUARE_BRACKETS_PATTERN = re.compile(r'\[[^\]]*\]')
+# 製品名に含まれる括弧（(...)・[...]）
+_PARENTHESES_PATTERN = re.compile(r'[\(\[].*?[\)\]]')
+# 一般的な製品名
+_GENERIC_PATTERN = re.compile('|'.join(re.escape(name) for name in GENERIC_PRODUCT_NAMES))
+
+# 本文用の製品名の最大文字数
+MAX_MODEL_LENGTH = 30
+
+
+class NormalizedName(NamedTuple):
+    """正規化した商品名"""
+    short_name: str  # タイトル用: 企業名+製品カテゴリー（例: Logicool マウス）
+    full_name: str  # 本文用: 企業名+製品名（例: Logicool G304）
+
+
+@lru_cache(maxsize=10000)
+def normalize_product_name(name: str, category: str) -> NormalizedName:
+    """
+    商品名を正規化（タイトル用・本文用の両方を1回で作る）
+
+    Args:
+        name: 元の商品名
+        category: 商品カテゴリー
+
+    Returns:
+        正規化した商品名
+    """
+    # ブランド名を抽出（大文字小文字を無視、日本語表記は正式な表記に変換）
+    brand_match = NAME_BRAND_MATCHER.search(name)
+    if brand_match:
+        brand = brand_match.display_name
+    else:
+        # ブランド名が見つからない場合は最初の単語を使用
+        words = name.split()
+        brand = words[0] if words else name[:10]
+
+    short_name = _short_name(name, category, brand)
+
+    # 【...】・[...] 内の文字列を削除
+    cleaned_name = _SQUARE_BRACKETS_PATTERN.sub('', _LENTICULAR_BRACKETS_PATTERN.sub('', name)).strip()
+
+    # ブランド名の後ろの部分を抽出
+    if brand_match:
+        cleaned_match = NAME_BRAND_MATCHER.search(cleaned_name)
+        brand_end = cleaned_match.end if cleaned_match else None
+    else:
+        match = re.search(re.escape(brand), cleaned_name, re.IGNORECASE)
+        brand_end = match.end() if match else None
+
+    if brand_end is None:
+        return NormalizedName(short_name, short_name)
+
+    # 不要な文字を削除（括弧、記号など）し、最初の2-3語を取得（最大30文字）
+    after_brand = _PARENTHESES_PATTERN.sub('', cleaned_name[brand_end:].strip()).strip()
+    words = after_brand.split()[:3]
+    product_model = ' '.join(words)[:MAX_MODEL_LENGTH]
+
+    if not product_model:
+        return NormalizedName(short_name, short_name)
+
+    # 一般的な製品名の場合はスペースなし、固有名詞の場合はスペースあり
+    if _GENERIC_PATTERN.search(words[0]):
+        return NormalizedName(short_name, f"{brand}{product_model}")
+    return NormalizedName(short_name, f"{brand} {product_model}")
+
+
+def _short_name(name: str, category: str, brand: str) -> str:
+    """タイトル用の商品名（企業名+製品カテゴリー）"""
+    # PCパーツの場合: 企業名+パーツ名
+    for part_category in PC_PARTS_CATEGORIES:
+        if part_category in name or part_category in category:
+            return f"{brand} {part_category}"
+
+    # PC周辺機器の場合: 企業名+製品タイプ
+    name_lower = name.lower()
+    category_lower = category.lower()
+    for product_type, keywords in PRODUCT_TYPES:
+        for keyword in keywords:
+            if keyword in name_lower or keyword in category_lower:
+                return f"{brand} {product_type}"
+
+    # 製品タイプが見つからない場合はカテゴリー名を使用
+    return f"{brand} {category}"
+
+
+def normalize_product_names(items: Iterable[Tuple[str, str]]) -> List[NormalizedName]:
+    """
+    複数の商品名をまとめて正規化（同じ商品名はキャッシュを再利用）
+
+    Args:
+        items: (商品名, カテゴリー) のリスト
+
+    Returns:
+        正規化した商品名のリスト（入力と同じ順序）
+    """
+    return [normalize_product_name(name, category) for name, category in items]
@@ -0,0 +1,222 @@
+"""
+PA-API レスポンスキャッシュ
+検索結果・商品情報をディスクに保存し、TTL・件数上限（LRU）・stale-while-revalidate で管理する
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from file_utils import write_json_atomic
+
+
+class PAAPICache:
+    """ディスクに保存するPA-APIレスポンスのキャッシュ"""
+
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        default_ttl: float = 7 * 24 * 3600,
+        stale_ttl: float = 30 * 24 * 3600,
+        max_entries: int = 500,
+        offline: bool = False
+    ):
+        """
+        初期化
+
+        Args:
+            cache_file: キャッシュを保存するJSONファイルのパス（Noneの場合はメモリのみ）
+            default_ttl: エントリの有効期間（秒）
+            stale_ttl: 有効期限切れ後もバックグラウンドで更新しつつ返す期間（秒）
+            max_entries: 保持するエントリ数の上限（超えた分は最も古く使われたものから削除）
+            offline: Trueの場合はAPIを呼ばず、期限切れも含めて保存済みのレスポンスだけを返す
+        """
+        self.cache_file = cache_file
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.offline = offline
+        self.entries: 'OrderedDict[str, Dict]' = OrderedDict()  # キー -> {'stored_at', 'ttl', 'value'}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._revalidating = set()
+        self._lock = threading.RLock()
+        self._batch_depth = 0  # batch() のネストの深さ（0より大きい間は保存を遅らせる）
+        self._dirty = False  # 保存していない変更があるかどうか
+        self.load()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """キャッシュキーを作成"""
+        return json.dumps(parts, ensure_ascii=False)
+
+    def load(self):
+        """キャッシュファイルを読み込み"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # ファイルには最も古く使われたものから順に保存されている
+            self.entries = OrderedDict(data.get('entries', {}))
+        except Exception as e:
+            print(f"PA-APIキャッシュの読み込みに失敗: {e}")
+            self.entries = OrderedDict()
+
+    def save(self):
+        """キャッシュファイルをアトミックに保存（一時ファイルを共有するため、書き込みもロック内で行う）"""
+        if not self.cache_file:
+            return
+        with self._lock:
+            write_json_atomic(self.cache_file, {'entries': dict(self.entries)})
+            self._dirty = False
+
+    def _changed(self):
+        """変更を保存（batch() の中ではブロックを抜けるまで遅らせる）"""
+        with self._lock:
+            self._dirty = True
+            if self._batch_depth:
+                return
+        self.save()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        ブロック内の set・invalidate をまとめて、抜けるときに1回だけファイルに保存する
+        （GetItemsの複数バッチ・複数マーケットプレイスの並行検索などで、ファイルを何度も書き直さない）
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self.save()
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """
+        キャッシュから値を取得
+
+        Args:
+            key: キャッシュキー
+            allow_stale: 有効期限切れ（stale_ttl以内）の値も返すかどうか
+
+        Returns:
+            キャッシュされた値（ない場合はNone）
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            age = time.time() - entry['stored_at']
+            if self.offline or age < entry['ttl'] or (allow_stale and age < entry['ttl'] + self.stale_ttl):
+                self.entries.move_to_end(key)
+                return entry['value']
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """値をキャッシュに保存（上限を超えたら最も古く使われたエントリを削除）"""
+        with self._lock:
+            self.entries[key] = {
+                'stored_at': time.time(),
+                'ttl': self.default_ttl if ttl is None else ttl,
+                'value': value
+            }
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        self._changed()
+
+    def invalidate(self, key: str):
+        """エントリを削除"""
+        with self._lock:
+            if self.entries.pop(key, None) is None:
+                return
+        self._changed()
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Optional[Any]],
+        ttl: Optional[float] = None,
+        max_age: Optional[float] = None
+    ) -> Optional[Any]:
+        """
+        キャッシュから値を取得し、なければ fetch で取得して保存
+
+        有効期限切れでも stale_ttl 以内であれば古い値をすぐに返し、バックグラウンドで再取得する。
+        PA-APIには条件付きリクエスト（ETag・If-Modified-Since）がないため、再取得は通常の取得と同じく
+        1リクエストを使う。fetch が None を返した場合（エラー時など）はキャッシュしない。
+
+        Args:
+            key: キャッシュキー
+            fetch: 値を取得する関数
+            ttl: このエントリの有効期間（秒、省略時は default_ttl）
+            max_age: 許容する古さ（秒）。これより古いエントリは有効期間内でも使わず、その場で取得し直す
+                （古い値を返してバックグラウンドで再取得することもしない。オフライン時は無視）
+
+        Returns:
+            値（オフラインでキャッシュにない場合はNone）
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            age = time.time() - entry['stored_at'] if entry else None
+            if entry is not None and max_age is not None and not self.offline and age >= max_age:
+                entry = None
+
+            if entry is not None and (self.offline or age < entry['ttl']):
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return entry['value']
+
+            if self.offline:
+                self.misses += 1
+                return None
+
+            if entry is not None and age < entry['ttl'] + self.stale_ttl:
+                self.stale_hits += 1
+                self.entries.move_to_end(key)
+                self._revalidate(key, fetch, ttl)
+                return entry['value']
+
+            self.misses += 1
+
+        value = fetch()
+        if value is not None:
+            self.set(key, value, ttl)
+        return value
+
+    def _revalidate(self, key: str, fetch: Callable[[], Optional[Any]], ttl: Optional[float]):
+        """バックグラウンドで値を再取得（同じキーの再取得は重複させない）"""
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+
+        def worker():
+            try:
+                value = fetch()
+                if value is not None:
+                    self.set(key, value, ttl)
+            except Exception as e:
+                print(f"PA-APIキャッシュの再取得に失敗: {e}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        # プロセス終了前に再取得を完了させるため daemon にはしない
+        threading.Thread(target=worker, name='paapi-revalidate', daemon=False).start()
+
+    def stats(self) -> Dict[str, int]:
+        """ヒット数などの統計"""
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses
+        }
@@ -0,0 +1,126 @@
+"""
+PA-API レスポンスの項目抽出
+「offers.listings[0].price.display_amount」のような項目パスを一度だけアクセサ関数に変換し、
+SDKのオブジェクトと生のJSON（辞書）のどちらからも値を取り出す
+"""
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# 生のJSONでキー名が単純なパスカルケースにならないもの
+_JSON_KEY_OVERRIDES = {
+    'asin': 'ASIN',
+    'url': 'URL',
+}
+
+_SEGMENT_PATTERN = re.compile(r'([A-Za-z_][A-Za-z0-9_]*)((?:\[\d+\])*)')
+_INDEX_PATTERN = re.compile(r'\[(\d+)\]')
+
+Accessor = Callable[[Any], Any]
+FieldSpec = Union[str, Tuple[str, Callable[[Any], Any]]]
+
+
+def _json_key(name: str) -> str:
+    """SDKの属性名（スネークケース）を生のJSONのキー名（パスカルケース）に変換"""
+    return _JSON_KEY_OVERRIDES.get(name, ''.join(part.capitalize() for part in name.split('_')))
+
+
+def _attribute_step(name: str) -> Accessor:
+    """属性（SDKのオブジェクト）またはキー（辞書）を1段たどる関数"""
+    json_key = _json_key(name)
+
+    def step(value: Any) -> Any:
+        if isinstance(value, dict):
+            result = value.get(name)
+            return value.get(json_key) if result is None else result
+        return getattr(value, name, None)
+
+    return step
+
+
+def _index_step(index: int) -> Accessor:
+    """リストの要素を1段たどる関数"""
+    def step(value: Any) -> Any:
+        try:
+            return value[index]
+        except (IndexError, KeyError, TypeError):
+            return None
+
+    return step
+
+
+def compile_path(path: str) -> Accessor:
+    """
+    項目パスをアクセサ関数に変換
+
+    途中の値がない（None・範囲外など）場合、アクセサはNoneを返す。
+
+    Args:
+        path: 項目パス（例: "images.primary.large.url"、"offers.listings[0].price.display_amount"）
+
+    Returns:
+        アイテムを受け取り値を返す関数
+    """
+    steps: List[Accessor] = []
+    for segment in path.split('.'):
+        match = _SEGMENT_PATTERN.fullmatch(segment)
+        if not match:
+            raise ValueError(f"不正な項目パスです: {path}")
+        steps.append(_attribute_step(match.group(1)))
+        steps.extend(_index_step(int(index)) for index in _INDEX_PATTERN.findall(match.group(2)))
+
+    def accessor(item: Any) -> Any:
+        value = item
+        for step in steps:
+            if value is None:
+                return None
+            value = step(value)
+        return value
+
+    return accessor
+
+
+class FieldExtractor:
+    """項目名 -> 項目パスの定義から値をまとめて取り出し、取得できなかった項目を数える"""
+
+    def __init__(self, fields: Dict[str, FieldSpec]):
+        """
+        初期化
+
+        Args:
+            fields: 項目名 -> 項目パス、または (項目パス, 変換関数)
+        """
+        self._accessors: List[Tuple[str, Accessor, Optional[Callable[[Any], Any]]]] = []
+        for name, spec in fields.items():
+            path, transform = (spec, None) if isinstance(spec, str) else spec
+            self._accessors.append((name, compile_path(path), transform))
+        self.items = 0
+        self.misses: Counter = Counter()
+        self.failures = 0  # 処理中にエラーになり、スキップしたアイテムの数
+
+    def extract(self, item: Any) -> Dict[str, Any]:
+        """
+        アイテムから全項目を取り出す
+
+        Returns:
+            項目名 -> 値（取得できなかった項目はNone）
+        """
+        self.items += 1
+        result = {}
+        for name, accessor, transform in self._accessors:
+            value = accessor(item)
+            if value is not None and transform is not None:
+                value = transform(value)
+            if value is None or value == [] or value == '':
+                self.misses[name] += 1
+                value = None
+            result[name] = value
+        return result
+
+    def record_failure(self):
+        """アイテムの処理に失敗したことを記録"""
+        self.failures += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """処理したアイテム数・項目ごとの欠損数・処理に失敗したアイテム数"""
+        return {'items': self.items, 'misses': dict(self.misses), 'failures': self.failures}
@@ -0,0 +1,165 @@
+"""
+PA-API のマーケットプレイス設定
+マーケットプレイス（地域）ごとに認証情報・アソシエイトタグ・レート制限を持ち、商品URLを正しいドメインで作る
+"""
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from rate_limiter import TokenBucketRateLimiter
+
+
+class MarketplaceInfo(NamedTuple):
+    """マーケットプレイスの国コード・ドメイン・検索キーワードの言語"""
+    country: str  # PA-APIの国コード
+    domain: str  # 商品ページのドメイン
+    keyword_language: str  # 検索キーワードの言語（ja 以外は SEARCH_KEYWORD_TRANSLATIONS で翻訳する）
+
+
+# 地域コード -> マーケットプレイス
+# 欧州のマーケットプレイスもPC製品は英語の製品名で検索されることが多いため、英語のキーワードを使う
+MARKETPLACES: Dict[str, MarketplaceInfo] = {
+    'jp': MarketplaceInfo('JP', 'www.amazon.co.jp', 'ja'),
+    'us': MarketplaceInfo('US', 'www.amazon.com', 'en'),
+    'uk': MarketplaceInfo('UK', 'www.amazon.co.uk', 'en'),
+    'de': MarketplaceInfo('DE', 'www.amazon.de', 'en'),
+    'fr': MarketplaceInfo('FR', 'www.amazon.fr', 'en'),
+    'ca': MarketplaceInfo('CA', 'www.amazon.ca', 'en'),
+    'it': MarketplaceInfo('IT', 'www.amazon.it', 'en'),
+    'es': MarketplaceInfo('ES', 'www.amazon.es', 'en'),
+}
+
+# 言語 -> {日本語の検索キーワード: その言語の検索キーワード}（翻訳がないキーワードはそのマーケットプレイスでは検索しない）
+SEARCH_KEYWORD_TRANSLATIONS: Dict[str, Dict[str, str]] = {
+    'en': {
+        "ワイヤレスマウス": "wireless mouse",
+        "ゲーミングマウス": "gaming mouse",
+        "エルゴノミクスマウス": "ergonomic mouse",
+        "メカニカルキーボード": "mechanical keyboard",
+        "ゲーミングキーボード": "gaming keyboard",
+        "ワイヤレスキーボード": "wireless keyboard",
+        "モニターライト": "monitor light bar",
+        "デスクライト": "desk lamp",
+        "Webカメラ": "webcam",
+        "マイク": "USB microphone",
+        "ヘッドセット": "headset",
+        "スピーカー": "computer speakers",
+        "モバイルバッテリー": "power bank",
+        "USB充電器": "USB charger",
+        "USBハブ": "USB hub",
+        "ドッキングステーション": "docking station",
+        "マウスパッド": "mouse pad",
+        "ゲーミングヘッドセット": "gaming headset",
+        "NVMe SSD": "NVMe SSD",
+        "M.2 SSD": "M.2 SSD",
+        "内蔵SSD": "internal SSD",
+        "DDR5 メモリ": "DDR5 RAM",
+        "DDR4 メモリ": "DDR4 RAM",
+        "グラフィックボード": "graphics card",
+        "外付けSSD": "external SSD",
+        "外付けHDD": "external hard drive",
+        "PCケース": "PC case",
+        "電源ユニット": "power supply unit",
+        "CPUクーラー": "CPU cooler",
+        "ケースファン": "case fan",
+    },
+}
+
+DEFAULT_REGION = 'jp'
+
+
+@dataclass
+class Marketplace:
+    """1つのマーケットプレイスへの接続設定"""
+    region: str  # 地域コード（例: jp）
+    access_key: Optional[str]
+    secret_key: Optional[str]
+    associate_tag: Optional[str]
+    rate_limiter: TokenBucketRateLimiter
+    api: Any = None  # AmazonApi（オフライン時・接続前はNone）
+
+    @property
+    def info(self) -> MarketplaceInfo:
+        return MARKETPLACES.get(self.region, MARKETPLACES[DEFAULT_REGION])
+
+    @property
+    def country(self) -> str:
+        """PA-APIの国コード"""
+        return self.info.country
+
+    @property
+    def has_credentials(self) -> bool:
+        return all([self.access_key, self.secret_key, self.associate_tag])
+
+    def search_keyword(self, keyword: str) -> Optional[str]:
+        """
+        日本語の検索キーワードをこのマーケットプレイスの言語に変換
+
+        Returns:
+            検索キーワード（翻訳がない場合はNone。日本語のキーワードをそのまま送らない）
+        """
+        language = self.info.keyword_language
+        if language == 'ja':
+            return keyword
+        return SEARCH_KEYWORD_TRANSLATIONS.get(language, {}).get(keyword)
+
+    def product_url(self, asin: str) -> str:
+        """このマーケットプレイスの商品URL（アソシエイトタグ付き）"""
+        return f"https://{self.info.domain}/dp/{asin}?tag={self.associate_tag}"
+
+
+def region_for_url(url: Optional[str]) -> Optional[str]:
+    """商品URLのドメインから地域コードを判定（判定できない場合はNone）"""
+    if not url:
+        return None
+    host = url.split('://', 1)[-1].split('/', 1)[0].lower()
+    for region, info in MARKETPLACES.items():
+        if host == info.domain or host == info.domain[len('www.'):]:
+            return region
+    return None
+
+
+def _region_env(name: str, region: str, default: Optional[str] = None) -> Optional[str]:
+    """地域別の環境変数（例: AMAZON_ACCESS_KEY_US）、なければ共通の環境変数を読む"""
+    return os.getenv(f"{name}_{region.upper()}") or os.getenv(name) or default
+
+
+def load_marketplaces() -> List[Marketplace]:
+    """
+    環境変数からマーケットプレイスの設定を読み込む
+
+    AMAZON_REGIONS（カンマ区切り、例: "jp,us"）で複数の地域を指定できる。省略時は AMAZON_REGION（既定は jp）。
+    認証情報・タグ・レート制限は地域別の環境変数（AMAZON_ACCESS_KEY_US など）を優先し、なければ共通の値を使う。
+
+    Returns:
+        マーケットプレイスのリスト（先頭が主のマーケットプレイス）
+    """
+    regions = []
+    setting = os.getenv('AMAZON_REGIONS') or os.getenv('AMAZON_REGION') or DEFAULT_REGION
+    for region in dict.fromkeys(region.strip().lower() for region in setting.split(',') if region.strip()):
+        if region in MARKETPLACES:
+            regions.append(region)
+        else:
+            print(f"警告: 未対応の地域コードです（無視します）: {region}")
+    if not regions:
+        # 有効な地域がない場合は日本を使う
+        regions = [DEFAULT_REGION]
+
+    marketplaces = []
+    for region in regions:
+        # PA-API 5.0の制限は10秒に1リクエスト（マーケットプレイスごとに別の予算）
+        state_file = os.getenv('PAAPI_RATE_STATE_FILE')
+        if state_file and region != DEFAULT_REGION:
+            state_file = f"{state_file}.{region}"
+        marketplaces.append(Marketplace(
+            region=region,
+            access_key=_region_env('AMAZON_ACCESS_KEY', region),
+            secret_key=_region_env('AMAZON_SECRET_KEY', region),
+            associate_tag=_region_env('AMAZON_ASSOCIATE_TAG', region),
+            rate_limiter=TokenBucketRateLimiter(
+                rate=float(_region_env('PAAPI_REQUESTS_PER_SECOND', region, '0.1')),
+                burst=float(_region_env('PAAPI_BURST', region, '1')),
+                state_file=state_file or None
+            )
+        ))
+    return marketplaces
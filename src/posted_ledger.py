@@ -0,0 +1,194 @@
+"""
+投稿済み商品の台帳
+追記専用のジャーナルと定期的なスナップショット（コンパクション）で投稿履歴を管理する
+"""
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from file_utils import write_json_atomic
+
+
+class BasePostedLedger:
+    """
+    投稿済み台帳の共通部分（保存先に依存しない参照系）
+
+    サブクラスは entries を読み込み、add_many・remove・clear を実装する。
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, Dict] = {}  # ASIN -> {'posted_at': ISO形式, 'post_id': 投稿ID}
+
+    def __contains__(self, asin: str) -> bool:
+        return asin in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def add(self, asin: str, post_id: Optional[int] = None) -> bool:
+        """
+        ASINを投稿済みとして記録
+
+        Returns:
+            新たに記録した場合True（既に投稿済みの場合は投稿日時のみ更新してFalse）
+        """
+        return self.add_many([asin], post_id) == 1
+
+    def add_many(self, asins: Iterable[str], post_id: Optional[int] = None) -> int:
+        """
+        複数のASINをまとめて投稿済みとして記録
+
+        Returns:
+            新たに記録したASINの数
+        """
+        raise NotImplementedError
+
+    def last_posted_at(self, asin: str) -> Optional[datetime]:
+        """ASINを最後に投稿した日時（未投稿・日時不明の場合はNone）"""
+        entry = self.entries.get(asin)
+        if not entry or not entry.get('posted_at'):
+            return None
+        return datetime.fromisoformat(entry['posted_at'])
+
+    def post_id(self, asin: str) -> Optional[int]:
+        """ASINを掲載した投稿ID"""
+        entry = self.entries.get(asin)
+        return entry.get('post_id') if entry else None
+
+    def least_recently_posted(self, asins: Iterable[str], ratio: float = 0.25) -> List[str]:
+        """
+        指定したASINのうち、最も古く投稿されたものを返す（全件投稿済み時のローテーション用）
+
+        Args:
+            asins: 対象のASIN
+            ratio: 返す割合（最低1件）
+        """
+        asins = list(asins)
+        if not asins:
+            return []
+
+        # 日時不明（旧形式から移行した履歴）は最も古いものとして扱う
+        ordered = sorted(asins, key=lambda asin: (self.entries.get(asin) or {}).get('posted_at') or '')
+        count = max(1, int(len(ordered) * ratio))
+        return ordered[:count]
+
+
+class PostedLedger(BasePostedLedger):
+    """投稿済みASINの台帳（ASIN -> 投稿日時・投稿ID）"""
+
+    def __init__(self, snapshot_file: str, compact_threshold: int = 100):
+        """
+        初期化
+
+        Args:
+            snapshot_file: スナップショットを保存するJSONファイルのパス
+            compact_threshold: ジャーナルがこの行数を超えたらスナップショットに統合する
+        """
+        super().__init__()
+        self.snapshot_file = snapshot_file
+        self.journal_file = os.path.splitext(snapshot_file)[0] + '.journal.jsonl'
+        self.compact_threshold = compact_threshold
+        self._journal_lines = 0
+        self.load()
+
+    def load(self):
+        """スナップショットを読み込み、ジャーナルを再生"""
+        self.entries = {}
+        self._journal_lines = 0
+
+        if os.path.exists(self.snapshot_file):
+            try:
+                with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                # 旧形式（ASINのリスト）にも対応
+                if isinstance(data, list):
+                    self.entries = {asin: {'posted_at': None, 'post_id': None} for asin in data}
+                else:
+                    self.entries = data.get('entries', {})
+            except Exception as e:
+                print(f"投稿済み商品データの読み込みに失敗: {e}")
+                self.entries = {}
+
+        if os.path.exists(self.journal_file):
+            try:
+                with open(self.journal_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            # 書き込み途中で中断された最終行は無視する
+                            continue
+                        self._apply(record)
+                        self._journal_lines += 1
+            except Exception as e:
+                print(f"投稿履歴ジャーナルの読み込みに失敗: {e}")
+
+    def _apply(self, record: Dict):
+        """ジャーナルの1レコードをメモリ上の台帳に反映"""
+        op = record.get('op', 'post')
+        if op == 'post':
+            self.entries.pop(record['asin'], None)  # 末尾へ移動して投稿順を保つ
+            self.entries[record['asin']] = {
+                'posted_at': record.get('posted_at'),
+                'post_id': record.get('post_id')
+            }
+        elif op == 'remove':
+            self.entries.pop(record['asin'], None)
+        elif op == 'reset':
+            self.entries = {}
+
+    def _append(self, records: List[Dict]):
+        """ジャーナルにレコードを追記（1回の書き込み）"""
+        os.makedirs(os.path.dirname(self.journal_file) or '.', exist_ok=True)
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+
+        for record in records:
+            self._apply(record)
+        self._journal_lines += len(records)
+
+        if self._journal_lines >= self.compact_threshold:
+            self.compact()
+
+    def add_many(self, asins: Iterable[str], post_id: Optional[int] = None) -> int:
+        """
+        複数のASINをまとめて投稿済みとして記録
+
+        Returns:
+            新たに記録したASINの数
+        """
+        posted_at = datetime.now().isoformat()
+        asins = list(dict.fromkeys(asins))
+        new_count = sum(1 for asin in asins if asin not in self.entries)
+        self._append([
+            {'op': 'post', 'asin': asin, 'posted_at': posted_at, 'post_id': post_id}
+            for asin in asins
+        ])
+        return new_count
+
+    def remove(self, asin: str):
+        """ASINを台帳から削除"""
+        if asin in self.entries:
+            self._append([{'op': 'remove', 'asin': asin}])
+
+    def clear(self):
+        """投稿履歴をすべて削除"""
+        self.entries = {}
+        self.compact()
+
+    def compact(self):
+        """台帳をスナップショットとしてアトミックに書き出し、ジャーナルを空にする"""
+        write_json_atomic(self.snapshot_file, {'entries': self.entries})
+
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self._journal_lines = 0
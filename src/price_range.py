@@ -0,0 +1,42 @@
+"""
+価格帯の判定
+"""
+import re
+from typing import Optional
+
+_PRICE_PATTERN = re.compile(r'¥?([\d,]+)')
+# 円以外の通貨（海外のマーケットプレイスの価格）。価格帯は円の金額で判定するため対象外にする
+_FOREIGN_CURRENCY_PATTERN = re.compile(r'[$€£]|\b(?:USD|EUR|GBP|CAD)\b')
+
+# (上限（この金額未満）, 価格帯)。最後の価格帯は上限なし
+PRICE_BANDS = (
+    (5000, "5千円未満"),
+    (10000, "5千円台～1万円未満"),
+    (20000, "1万円台"),
+    (30000, "2万円台"),
+    (40000, "3万円台"),
+    (50000, "4万円台"),
+    (None, "5万円以上"),
+)
+
+
+def parse_price(price_str: Optional[str]) -> Optional[int]:
+    """価格の文字列（例: ¥12,800）から円の金額を取り出す（円以外の通貨の場合はNone）"""
+    if not price_str or _FOREIGN_CURRENCY_PATTERN.search(price_str):
+        return None
+    match = _PRICE_PATTERN.search(price_str)
+    if not match:
+        return None
+    return int(match.group(1).replace(',', ''))
+
+
+def get_price_range(price_str: Optional[str]) -> str:
+    """具体的な価格から価格帯を抽出（価格が不明な場合は空文字）"""
+    price_num = parse_price(price_str)
+    if price_num is None:
+        return ""
+
+    for upper, band in PRICE_BANDS:
+        if upper is None or price_num < upper:
+            return band
+    return ""
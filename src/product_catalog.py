@@ -0,0 +1,251 @@
+"""
+商品カタログ
+ASIN・カテゴリー・製品グループ（name）の索引と、未投稿商品の索引を差分更新で保持する
+"""
+import random
+from typing import TYPE_CHECKING, Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, TypeVar
+
+if TYPE_CHECKING:
+    # amazon_scraper からインポートされるため、実行時には循環インポートを避ける
+    from amazon_scraper import GadgetProduct
+
+T = TypeVar('T', bound=Hashable)
+
+
+class RandomSet(Generic[T]):
+    """追加・削除・ランダム選択がすべてO(1)の集合"""
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: List[T] = []
+        self._positions: Dict[T, int] = {}
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._positions
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def add(self, item: T):
+        if item not in self._positions:
+            self._positions[item] = len(self._items)
+            self._items.append(item)
+
+    def discard(self, item: T):
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+        # 末尾の要素を削除位置に移動してから末尾を取り除く
+        last = self._items.pop()
+        if position < len(self._items):
+            self._items[position] = last
+            self._positions[last] = position
+
+    def choice(self, rng: Optional[random.Random] = None) -> T:
+        return (rng or random).choice(self._items)
+
+
+class ProductCatalog:
+    """多重索引付きの商品カタログ"""
+
+    def __init__(self, products: Iterable['GadgetProduct'] = (), is_posted: Optional[Callable[[str], bool]] = None):
+        """
+        初期化
+
+        Args:
+            products: 初期商品リスト
+            is_posted: ASINが投稿済みかどうかを返す関数
+        """
+        self.rebuild(products, is_posted)
+
+    def rebuild(self, products: Iterable['GadgetProduct'] = (), is_posted: Optional[Callable[[str], bool]] = None):
+        """全索引を作り直す"""
+        self.by_asin: Dict[str, 'GadgetProduct'] = {}
+        self.by_category: Dict[str, Dict[str, None]] = {}  # カテゴリー -> ASIN（挿入順の集合）
+        self.by_group: Dict[str, Dict[str, None]] = {}  # 製品グループ（name） -> ASIN
+        self.posted: set = set()
+
+        # 未投稿商品の索引（期限切れ（stale_since あり）の商品は選択の対象にしないため含めない）
+        self.unposted: RandomSet[str] = RandomSet()
+        self.unposted_by_category: Dict[str, RandomSet[str]] = {}
+        self.unposted_by_group: Dict[str, Dict[str, None]] = {}
+        self.unposted_groups: RandomSet[str] = RandomSet()
+        self.unposted_groups_by_category: Dict[str, Dict[str, int]] = {}  # カテゴリー -> {name: 未投稿数}
+        self._unposted_group_sets: Dict[str, RandomSet[str]] = {}
+
+        for product in products:
+            self.add(product, posted=bool(is_posted and is_posted(product.asin)))
+
+    def __len__(self) -> int:
+        return len(self.by_asin)
+
+    def __contains__(self, asin: str) -> bool:
+        return asin in self.by_asin
+
+    def __iter__(self) -> Iterator['GadgetProduct']:
+        return iter(self.by_asin.values())
+
+    def all(self) -> List['GadgetProduct']:
+        """全商品（追加順）"""
+        return list(self.by_asin.values())
+
+    def get(self, asin: str) -> Optional['GadgetProduct']:
+        """ASINで商品を取得"""
+        return self.by_asin.get(asin)
+
+    def get_by_category(self, category: str) -> List['GadgetProduct']:
+        """カテゴリー別に商品を取得"""
+        return [self.by_asin[asin] for asin in self.by_category.get(category, {})]
+
+    def get_group(self, name: str) -> List['GadgetProduct']:
+        """同じ製品グループ（name）の商品を取得"""
+        return [self.by_asin[asin] for asin in self.by_group.get(name, {})]
+
+    def add(self, product: 'GadgetProduct', posted: Optional[bool] = None):
+        """
+        商品を追加（同じASINがある場合は置き換え）
+
+        Args:
+            product: 商品
+            posted: 投稿済みかどうか（省略時は既存の状態を維持）
+        """
+        if posted is None:
+            posted = product.asin in self.posted
+
+        asin = product.asin
+        old = self.by_asin.get(asin)
+        if old is not None:
+            # 既存商品の索引だけを外し、追加順は維持する
+            self._unindex_unposted(old)
+            self.posted.discard(asin)
+            self._discard_from(self.by_category, old.category, asin)
+            self._discard_from(self.by_group, old.name, asin)
+
+        self.by_asin[asin] = product
+        self.by_category.setdefault(product.category, {})[asin] = None
+        self.by_group.setdefault(product.name, {})[asin] = None
+
+        if posted:
+            self.posted.add(asin)
+        else:
+            self._index_unposted(product)
+
+    def remove(self, asin: str) -> Optional['GadgetProduct']:
+        """商品を削除"""
+        product = self.by_asin.pop(asin, None)
+        if product is None:
+            return None
+
+        self._unindex_unposted(product)
+        self.posted.discard(asin)
+        self._discard_from(self.by_category, product.category, asin)
+        self._discard_from(self.by_group, product.name, asin)
+        return product
+
+    def mark_posted(self, asin: str):
+        """商品を投稿済みにする"""
+        product = self.by_asin.get(asin)
+        if product is None or asin in self.posted:
+            return
+        self.posted.add(asin)
+        self._unindex_unposted(product)
+
+    def mark_unposted(self, asin: str):
+        """商品を未投稿に戻す"""
+        product = self.by_asin.get(asin)
+        if product is None or asin not in self.posted:
+            return
+        self.posted.discard(asin)
+        self._index_unposted(product)
+
+    def reindex(self, asin: str):
+        """期限切れ（stale_since）の状態が変わった商品の未投稿索引を更新"""
+        product = self.by_asin.get(asin)
+        if product is None or asin in self.posted:
+            return
+        self._unindex_unposted(product)
+        self._index_unposted(product)
+
+    def reset_posted(self):
+        """すべての商品を未投稿に戻す"""
+        for asin in list(self.posted):
+            self.mark_unposted(asin)
+
+    def has_unposted(self, category: Optional[str] = None) -> bool:
+        """未投稿の商品があるかどうか"""
+        if category:
+            return len(self.unposted_by_category.get(category, ())) > 0
+        return len(self.unposted) > 0
+
+    def random_unposted(self, category: Optional[str] = None, rng: Optional[random.Random] = None) -> Optional['GadgetProduct']:
+        """未投稿の商品をランダムに1つ選ぶ（O(1)）"""
+        pool = self.unposted_by_category.get(category) if category else self.unposted
+        if not pool:
+            return None
+        return self.by_asin[pool.choice(rng)]
+
+    def random_unposted_group(self, category: Optional[str] = None, rng: Optional[random.Random] = None) -> List['GadgetProduct']:
+        """
+        未投稿の商品を含む製品グループをランダムに1つ選び、そのグループの未投稿商品を返す
+
+        Args:
+            category: カテゴリーでフィルター（省略可）
+            rng: 乱数生成器（省略時は random モジュール）
+        """
+        groups = self._unposted_group_sets.get(category) if category else self.unposted_groups
+        if not groups:
+            return []
+
+        name = groups.choice(rng)
+        variants = [self.by_asin[asin] for asin in self.unposted_by_group[name]]
+        if category:
+            variants = [p for p in variants if p.category == category]
+        return variants
+
+    def _index_unposted(self, product: 'GadgetProduct'):
+        if product.stale_since:
+            return
+        asin = product.asin
+        self.unposted.add(asin)
+        self.unposted_by_category.setdefault(product.category, RandomSet()).add(asin)
+
+        group = self.unposted_by_group.setdefault(product.name, {})
+        group[asin] = None
+        self.unposted_groups.add(product.name)
+
+        counts = self.unposted_groups_by_category.setdefault(product.category, {})
+        counts[product.name] = counts.get(product.name, 0) + 1
+        self._unposted_group_sets.setdefault(product.category, RandomSet()).add(product.name)
+
+    def _unindex_unposted(self, product: 'GadgetProduct'):
+        asin = product.asin
+        if asin not in self.unposted:
+            return
+
+        self.unposted.discard(asin)
+        self.unposted_by_category[product.category].discard(asin)
+
+        group = self.unposted_by_group[product.name]
+        group.pop(asin, None)
+        if not group:
+            del self.unposted_by_group[product.name]
+            self.unposted_groups.discard(product.name)
+
+        counts = self.unposted_groups_by_category[product.category]
+        counts[product.name] -= 1
+        if counts[product.name] == 0:
+            del counts[product.name]
+            self._unposted_group_sets[product.category].discard(product.name)
+
+    @staticmethod
+    def _discard_from(index: Dict[str, Dict[str, None]], key: str, asin: str):
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.pop(asin, None)
+        if not bucket:
+            del index[key]
@@ -0,0 +1,111 @@
+"""
+商品のプロファイル（製品タイプ・ブランド・価格帯）
+商品名を1回だけ走査して製品タイプを判定し、結果をキャッシュして記事のすべてのセクションで共有する
+"""
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Pattern, Tuple
+
+from name_normalizer import NAME_BRAND_MATCHER, PC_PARTS_CATEGORIES, PRODUCT_TYPES
+from price_range import get_price_range
+
+if TYPE_CHECKING:
+    # amazon_scraper からインポートされるため、実行時には循環インポートを避ける
+    from amazon_scraper import GadgetProduct
+
+# 複数の製品タイプに一致する場合に優先する製品タイプ（先のものほど優先）
+PRIORITY_PRODUCT_TYPES: Tuple[str, ...] = ("マウス", "キーボード", "SSD", "メモリ")
+
+# 商品名の【...】・[...]（ブランド名の判定では除く）
+_BRACKETS_PATTERN = re.compile(r'【[^】]*】|\[[^\]]*\]')
+
+
+def _build_type_keywords() -> Tuple[Dict[str, Tuple[int, str]], Pattern]:
+    """検出キーワード（小文字）-> (優先順位, 製品タイプ) と、全キーワードを1回で探す正規表現"""
+    product_types = [(product_type, keywords) for product_type, keywords in PRODUCT_TYPES]
+    product_types.extend((part, (part.lower(),)) for part in PC_PARTS_CATEGORIES)
+    ranked = sorted(
+        enumerate(product_types),
+        key=lambda item: (
+            PRIORITY_PRODUCT_TYPES.index(item[1][0]) if item[1][0] in PRIORITY_PRODUCT_TYPES
+            else len(PRIORITY_PRODUCT_TYPES) + item[0]
+        )
+    )
+    keyword_types: Dict[str, Tuple[int, str]] = {}
+    for rank, (_, (product_type, keywords)) in enumerate(ranked):
+        for keyword in keywords:
+            keyword_types.setdefault(keyword, (rank, product_type))
+    # 長いキーワードを先に試す（例: webカメラ と カメラ）
+    pattern = re.compile('|'.join(re.escape(keyword) for keyword in sorted(keyword_types, key=len, reverse=True)))
+    return keyword_types, pattern
+
+
+_KEYWORD_TYPES, _KEYWORD_PATTERN = _build_type_keywords()
+
+
+class ProductProfile(NamedTuple):
+    """記事の各セクションが参照する商品の属性"""
+    product_type: Optional[str]  # 製品タイプ（例: マウス・SSD、判定できない場合はNone）
+    brand: str  # ブランド名
+    price_band: str  # 価格帯（例: 1万円台、価格がない場合は空文字列）
+
+
+def product_type_of(name: str) -> Optional[str]:
+    """
+    商品名から製品タイプを判定（商品名を1回だけ走査し、複数に一致した場合は優先順位の高いものを使う）
+
+    Args:
+        name: 商品名
+
+    Returns:
+        製品タイプ（判定できない場合はNone）
+    """
+    best = None
+    for match in _KEYWORD_PATTERN.finditer(name.lower()):
+        ranked = _KEYWORD_TYPES[match.group(0)]
+        if best is None or ranked < best:
+            best = ranked
+    return best[1] if best else None
+
+
+def brand_of(name: str, original_title: Optional[str] = None) -> str:
+    """
+    商品のブランド名（主要ブランドは正式な表記、見つからない場合は商品名の最初の単語）
+
+    Args:
+        name: 商品名
+        original_title: PA-APIから取得した元のタイトル
+
+    Returns:
+        ブランド名（商品名の最初の単語が製品タイプの場合は空文字列）
+    """
+    brand_match = NAME_BRAND_MATCHER.search(original_title or name)
+    if brand_match:
+        return brand_match.canonical
+    words = _BRACKETS_PATTERN.sub(' ', name).split()
+    if not words or product_type_of(words[0]):
+        # 「【Amazon.co.jp限定】 Webカメラ」のようにブランド名がない商品名
+        return ""
+    return words[0]
+
+
+@lru_cache(maxsize=4096)
+def _classify(name: str, original_title: Optional[str], price: Optional[str]) -> ProductProfile:
+    return ProductProfile(
+        product_type=product_type_of(name),
+        brand=brand_of(name, original_title),
+        price_band=get_price_range(price) if price else ""
+    )
+
+
+def classify_product(product: 'GadgetProduct') -> ProductProfile:
+    """
+    商品のプロファイルを取得（同じ商品名・元のタイトル・価格の商品は判定結果を再利用する）
+
+    Args:
+        product: 商品情報
+
+    Returns:
+        製品タイプ・ブランド・価格帯
+    """
+    return _classify(product.name or "", product.original_title, product.price)
@@ -0,0 +1,410 @@
+"""
+重み付きの商品スケジューラー
+カテゴリーの配分（クォータ）・価格帯・評価・ブランドを最後に投稿してからの日数で製品グループに重みを付け、
+1回の選択をO(log n)で行う。選択の履歴は状態ファイルに保存し、シードから同じ順序を再現できる
+"""
+import json
+import os
+import random
+import secrets
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+from price_range import get_price_range
+from product_profile import classify_product
+from file_utils import write_json_atomic
+
+if TYPE_CHECKING:
+    # amazon_scraper からインポートされるため、実行時には循環インポートを避ける
+    from amazon_scraper import GadgetProduct
+
+# カテゴリーの配分を判定する直近の選択数
+RECENT_CATEGORY_WINDOW = 50
+
+# 評価がない商品に使う評価（5段階）
+DEFAULT_RATING = 4.0
+
+
+class WeightedSampler:
+    """Fenwick木による重み付きサンプラー（重みの更新・削除・選択がすべてO(log n)）"""
+
+    def __init__(self):
+        self._keys: List[Optional[str]] = []  # スロット -> キー
+        self._weights: List[float] = []  # スロット -> 重み
+        self._tree: List[float] = [0.0]  # Fenwick木（1始まり）
+        self._slots: Dict[str, int] = {}  # キー -> スロット
+        self._free: List[int] = []  # 削除で空いたスロット
+        self.total = 0.0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._slots
+
+    def weight(self, key: str) -> float:
+        """キーの重み（ない場合は0）"""
+        slot = self._slots.get(key)
+        return self._weights[slot] if slot is not None else 0.0
+
+    def set(self, key: str, weight: float):
+        """キーの重みを設定（ない場合は追加）"""
+        weight = max(0.0, weight)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._allocate(key)
+        self._add(slot, weight - self._weights[slot])
+        self._weights[slot] = weight
+
+    def remove(self, key: str):
+        """キーを削除（スロットは再利用する）"""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        self._add(slot, -self._weights[slot])
+        self._weights[slot] = 0.0
+        self._keys[slot] = None
+        self._free.append(slot)
+        if not self._slots:
+            # 浮動小数点の誤差を持ち越さない
+            self.total = 0.0
+
+    def sample(self, rng: random.Random) -> Optional[str]:
+        """重みに比例した確率でキーを1つ選ぶ"""
+        if not self._slots:
+            return None
+        if self.total <= 0:
+            # 重みがすべて0の場合は一様に選ぶ
+            return rng.choice(sorted(self._slots))
+
+        target = rng.random() * self.total
+        position = 0
+        step = 1 << (len(self._keys).bit_length() - 1)
+        while step:
+            next_position = position + step
+            if next_position <= len(self._keys) and self._tree[next_position] <= target:
+                position = next_position
+                target -= self._tree[position]
+            step >>= 1
+
+        if position < len(self._keys) and self._keys[position] is not None and self._weights[position] > 0:
+            return self._keys[position]
+        # 誤差で末尾を越えた場合は重みのある最後のスロットを使う
+        for slot in range(len(self._keys) - 1, -1, -1):
+            if self._keys[slot] is not None and self._weights[slot] > 0:
+                return self._keys[slot]
+        return None
+
+    def _allocate(self, key: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._keys)
+            self._keys.append(None)
+            self._weights.append(0.0)
+            self._tree.append(0.0)
+            # 追加したノードが受け持つ範囲の合計を設定
+            index = slot + 1
+            lowest = index & -index
+            child = index - 1
+            while child > index - lowest:
+                self._tree[index] += self._tree[child]
+                child -= child & -child
+        self._keys[slot] = key
+        self._slots[key] = slot
+        return slot
+
+    def _add(self, slot: int, delta: float):
+        if not delta:
+            return
+        self.total += delta
+        index = slot + 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+
+class GroupProfile(NamedTuple):
+    """重みの計算に使う製品グループの属性"""
+    category: str
+    brand: str
+    price_band: str
+    rating: Optional[float]
+
+
+def group_profile(variants: List['GadgetProduct']) -> GroupProfile:
+    """製品グループ（バリエーション）の属性（価格は最初に価格がある商品、評価は最高値を使う）"""
+    first = variants[0]
+    price = next((v.price for v in variants if v.price), None)
+    ratings = [v.rating for v in variants if v.rating is not None]
+    return GroupProfile(
+        category=first.category,
+        brand=classify_product(first).brand,
+        price_band=get_price_range(price),
+        rating=max(ratings) if ratings else None
+    )
+
+
+class ProductScheduler:
+    """カバレッジを考慮して次に投稿する製品グループを選ぶスケジューラー"""
+
+    def __init__(
+        self,
+        state_file: str,
+        category_quotas: Optional[Dict[str, float]] = None,
+        price_band_weights: Optional[Dict[str, float]] = None,
+        rating_exponent: float = 1.0,
+        brand_cooldown_days: float = 7.0,
+        seed: Optional[str] = None
+    ):
+        """
+        初期化
+
+        Args:
+            state_file: 選択の履歴を保存するJSONファイルのパス
+            category_quotas: カテゴリー -> 配分の比率（省略したカテゴリーは1.0）
+            price_band_weights: 価格帯（get_price_range の値） -> 重み（省略した価格帯は1.0）
+            rating_exponent: 評価による重み（評価/5 のべき乗）の指数（0で評価を無視）
+            brand_cooldown_days: ブランドを投稿してから重みが元に戻るまでの日数
+            seed: 乱数のシード（省略時は状態ファイルのシード、なければ新たに生成して保存）
+        """
+        self.state_file = state_file
+        self.category_quotas = category_quotas or {}
+        self.price_band_weights = price_band_weights or {}
+        self.rating_exponent = rating_exponent
+        self.brand_cooldown_days = brand_cooldown_days
+
+        self.seed: Optional[str] = None
+        self.picks = 0
+        self.brand_last_posted: Dict[str, str] = {}  # ブランド -> 最後に投稿した日時（ISO形式）
+        self.recent_categories: List[str] = []  # 直近に投稿したカテゴリー（古い順）
+        self.load()
+        if seed is not None:
+            self.seed = str(seed)
+        if self.seed is None:
+            self.seed = secrets.token_hex(8)
+            self.save()
+
+        self._samplers: Dict[str, WeightedSampler] = {}  # カテゴリー -> 製品グループのサンプラー
+        self._profiles: Dict[str, GroupProfile] = {}  # 製品グループ -> 属性
+        self._groups_by_brand: Dict[str, Dict[str, None]] = {}  # ブランド -> 製品グループ
+
+    def load(self):
+        """状態ファイルを読み込み"""
+        if not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.seed = state.get('seed')
+            self.picks = state.get('picks', 0)
+            self.brand_last_posted = state.get('brand_last_posted', {})
+            self.recent_categories = state.get('recent_categories', [])[-RECENT_CATEGORY_WINDOW:]
+        except Exception as e:
+            print(f"スケジューラーの状態の読み込みに失敗: {e}")
+
+    def save(self):
+        """状態ファイルをアトミックに保存"""
+        write_json_atomic(self.state_file, {
+            'seed': self.seed,
+            'picks': self.picks,
+            'brand_last_posted': self.brand_last_posted,
+            'recent_categories': self.recent_categories
+        })
+
+    def rebuild(self, groups: Dict[str, List['GadgetProduct']], now: Optional[datetime] = None):
+        """
+        製品グループの索引を作り直す
+
+        Args:
+            groups: 製品グループ（name） -> 未投稿の商品
+            now: 重みの基準日時（省略時は datetime.now()）
+        """
+        self._samplers = {}
+        self._profiles = {}
+        self._groups_by_brand = {}
+        # 読み込み順に関係なく同じシードで同じ順序になるよう、キーの順に登録する
+        for key in sorted(groups):
+            self.add(key, groups[key], now)
+
+    def add(self, key: str, variants: List['GadgetProduct'], now: Optional[datetime] = None):
+        """製品グループを追加（ある場合は重みを更新）"""
+        if not variants:
+            self.remove(key)
+            return
+        profile = group_profile(variants)
+        old = self._profiles.get(key)
+        if old is not None and old.category != profile.category:
+            self.remove(key)
+
+        self._profiles[key] = profile
+        if profile.brand:
+            self._groups_by_brand.setdefault(profile.brand, {})[key] = None
+        sampler = self._samplers.setdefault(profile.category, WeightedSampler())
+        sampler.set(key, self._weight(profile, now or datetime.now()))
+
+    def remove(self, key: str):
+        """製品グループを削除"""
+        profile = self._profiles.pop(key, None)
+        if profile is None:
+            return
+        self._samplers[profile.category].remove(key)
+        brand_groups = self._groups_by_brand.get(profile.brand)
+        if brand_groups is not None:
+            brand_groups.pop(key, None)
+            if not brand_groups:
+                del self._groups_by_brand[profile.brand]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._profiles
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def pick(self, category: Optional[str] = None) -> Optional[str]:
+        """
+        次に投稿する製品グループを選ぶ
+
+        カテゴリーを指定しない場合は、直近の投稿で配分に対して最も不足しているカテゴリーから選ぶ。
+
+        Args:
+            category: カテゴリーでフィルター（省略可）
+
+        Returns:
+            製品グループのキー（候補がない場合はNone）
+        """
+        rng = random.Random(f"{self.seed}:{self.picks}")
+        if category is None:
+            category = self._neediest_category(rng)
+        sampler = self._samplers.get(category) if category else None
+        if not sampler:
+            return None
+
+        key = sampler.sample(rng)
+        self.picks += 1
+        self.save()
+        return key
+
+    def record(self, products: List['GadgetProduct'], now: Optional[datetime] = None):
+        """
+        投稿した商品を記録し、同じブランドの製品グループの重みを下げる
+
+        Args:
+            products: 投稿した商品（1記事分のバリエーション）
+            now: 投稿日時（省略時は datetime.now()）
+        """
+        if not products:
+            return
+        now = now or datetime.now()
+        self.recent_categories.append(products[0].category)
+        self.recent_categories = self.recent_categories[-RECENT_CATEGORY_WINDOW:]
+
+        # ブランドが分からない商品（空文字列）はブランドの投稿間隔の対象にしない
+        brands = dict.fromkeys(classify_product(product).brand for product in products)
+        brands.pop("", None)
+        for brand in brands:
+            self.brand_last_posted[brand] = now.isoformat()
+            for key in self._groups_by_brand.get(brand, {}):
+                profile = self._profiles[key]
+                self._samplers[profile.category].set(key, self._weight(profile, now))
+        self.save()
+
+    def _weight(self, profile: GroupProfile, now: datetime) -> float:
+        """製品グループの重み（価格帯 × 評価 × ブランドの投稿間隔）"""
+        weight = self.price_band_weights.get(profile.price_band, 1.0)
+
+        rating = profile.rating if profile.rating is not None else DEFAULT_RATING
+        weight *= (max(0.0, min(rating, 5.0)) / 5.0) ** self.rating_exponent
+
+        last_posted = self.brand_last_posted.get(profile.brand) if profile.brand else None
+        if last_posted and self.brand_cooldown_days > 0:
+            days = max(0.0, (now - datetime.fromisoformat(last_posted)).total_seconds() / 86400)
+            weight *= min(1.0, (days + 1) / (self.brand_cooldown_days + 1))
+        return weight
+
+    def _neediest_category(self, rng: random.Random) -> Optional[str]:
+        """配分（クォータ）に対して直近の投稿が最も不足しているカテゴリー（同率の場合はランダム）"""
+        categories = sorted(category for category, sampler in self._samplers.items() if sampler)
+        if not categories:
+            return None
+
+        quotas = {category: max(0.0, self.category_quotas.get(category, 1.0)) for category in categories}
+        total_quota = sum(quotas.values()) or float(len(categories))
+        recent = [category for category in self.recent_categories if category in quotas]
+        counts = {category: 0 for category in categories}
+        for category in recent:
+            counts[category] += 1
+
+        def deficit(category: str) -> float:
+            share = counts[category] / len(recent) if recent else 0.0
+            return round(quotas[category] / total_quota - share, 9)
+
+        best = max(deficit(category) for category in categories)
+        return rng.choice([category for category in categories if deficit(category) == best])
+
+
+class KeywordScheduler:
+    """PA-APIの検索キーワードを、最後に使ってから最も時間が経ったものから順に選ぶ"""
+
+    def __init__(self, state_file: str, seed: Optional[str] = None):
+        """
+        初期化
+
+        Args:
+            state_file: キーワードの使用履歴を保存するJSONファイルのパス
+            seed: 同率のキーワードを選ぶ乱数のシード（省略時はランダム）
+        """
+        self.state_file = state_file
+        self.seed = seed
+        self.picks = 0
+        self.last_used: Dict[str, str] = {}  # 「カテゴリー\tキーワード」 -> 最後に使った日時（ISO形式）
+        if os.path.exists(state_file):
+            try:
+                with open(state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                self.picks = state.get('picks', 0)
+                self.last_used = state.get('last_used', {})
+            except Exception as e:
+                print(f"キーワードの使用履歴の読み込みに失敗: {e}")
+
+    def pick(self, keywords: Dict[str, List[str]], now: Optional[datetime] = None) -> Optional[Tuple[str, str]]:
+        """
+        次に検索するカテゴリーとキーワードを選んで記録
+
+        Args:
+            keywords: カテゴリー -> キーワードのリスト
+
+        Returns:
+            (カテゴリー, キーワード)（キーワードがない場合はNone）
+        """
+        candidates = [(category, keyword) for category, items in keywords.items() for keyword in items]
+        if not candidates:
+            return None
+
+        # 未使用のキーワード（空文字）を最優先し、使用日時が最も古いものから選ぶ
+        oldest = min(self.last_used.get(self._key(*candidate), '') for candidate in candidates)
+        tied = [candidate for candidate in candidates if self.last_used.get(self._key(*candidate), '') == oldest]
+        rng = random.Random(f"{self.seed}:{self.picks}") if self.seed is not None else random
+        category, keyword = rng.choice(tied)
+
+        self.picks += 1
+        self.last_used[self._key(category, keyword)] = (now or datetime.now()).isoformat()
+        write_json_atomic(self.state_file, {'picks': self.picks, 'last_used': self.last_used})
+        return category, keyword
+
+    @staticmethod
+    def _key(category: str, keyword: str) -> str:
+        return f"{category}\t{keyword}"
+
+
+def load_weight_config(value: Optional[str]) -> Dict[str, float]:
+    """環境変数のJSON（例: '{"マウス": 2, "SSD": 0.5}'）から重みの設定を読み込む"""
+    if not value:
+        return {}
+    try:
+        config = json.loads(value)
+        return {str(name): float(weight) for name, weight in config.items()}
+    except Exception as e:
+        print(f"重みの設定の読み込みに失敗（無視します）: {e}")
+        return {}
+
@@ -0,0 +1,281 @@
+"""
+商品データの保存先（ストレージバックエンド）
+- JsonProductStore: data/products.json などのJSONファイル（従来どおり）
+- SQLiteProductStore: SQLite（WALモード、索引付き、トランザクション単位の一括更新）
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from file_utils import write_json_atomic
+from posted_ledger import BasePostedLedger, PostedLedger
+
+
+class JsonProductStore:
+    """JSONファイルによる商品データの保存"""
+
+    def __init__(self, products_file: str):
+        """
+        初期化
+
+        Args:
+            products_file: 商品データを保存するJSONファイルのパス
+        """
+        self.products_file = products_file
+        data_dir = os.path.dirname(products_file)
+        self.posted_file = os.path.join(data_dir, 'posted_products.json')
+        self.metadata_file = os.path.join(data_dir, 'products_metadata.json')
+
+    def load_products(self) -> List[Dict]:
+        """商品データを読み込み"""
+        if not os.path.exists(self.products_file):
+            return []
+        with open(self.products_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_products(self, products: List[Dict]):
+        """商品データを保存（全件置き換え）"""
+        write_json_atomic(self.products_file, products)
+
+    def upsert_products(self, products: List[Dict], get_all_products: Callable[[], List[Dict]]):
+        """
+        商品を追加・更新（JSONファイルは全件を書き直す）
+
+        Args:
+            products: 追加・更新した商品
+            get_all_products: 全商品を返す関数
+        """
+        self.save_products(get_all_products())
+
+    def load_metadata(self) -> Dict:
+        """メタデータを読み込み"""
+        if os.path.exists(self.metadata_file):
+            try:
+                with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"メタデータの読み込みに失敗: {e}")
+        return {}
+
+    def save_metadata(self, metadata: Dict):
+        """メタデータを保存"""
+        write_json_atomic(self.metadata_file, metadata)
+
+    def create_posted_ledger(self) -> PostedLedger:
+        """投稿済み商品の台帳を作成"""
+        return PostedLedger(self.posted_file)
+
+
+class SQLiteProductStore:
+    """SQLiteによる商品データの保存"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS products (
+            asin TEXT PRIMARY KEY,
+            position INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            data TEXT NOT NULL,
+            last_refreshed TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_products_category ON products(category);
+        CREATE INDEX IF NOT EXISTS idx_products_name ON products(name);
+        CREATE INDEX IF NOT EXISTS idx_products_last_refreshed ON products(last_refreshed);
+        CREATE INDEX IF NOT EXISTS idx_products_position ON products(position);
+
+        CREATE TABLE IF NOT EXISTS posted (
+            asin TEXT PRIMARY KEY,
+            posted_at TEXT,
+            post_id INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_posted_posted_at ON posted(posted_at);
+
+        CREATE TABLE IF NOT EXISTS metadata (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db_file: str):
+        """
+        初期化
+
+        Args:
+            db_file: SQLiteデータベースファイルのパス
+        """
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(self.SCHEMA)
+        self.lock = threading.RLock()
+
+    def close(self):
+        """データベース接続を閉じる"""
+        self.conn.close()
+
+    def is_empty(self) -> bool:
+        """商品・投稿履歴・メタデータがすべて空かどうか"""
+        for table in ('products', 'posted', 'metadata'):
+            if self.conn.execute(f'SELECT 1 FROM {table} LIMIT 1').fetchone():
+                return False
+        return True
+
+    def load_products(self) -> List[Dict]:
+        """商品データを読み込み（保存順）"""
+        rows = self.conn.execute('SELECT data FROM products ORDER BY position').fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def save_products(self, products: List[Dict]):
+        """商品データを保存（全件置き換え、1トランザクション）"""
+        with self.lock, self.conn:
+            asins = [product['asin'] for product in products]
+            self._upsert(products, start_position=0)
+            # 今回のリストに含まれない商品を削除
+            self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS keep_asins (asin TEXT PRIMARY KEY)')
+            self.conn.execute('DELETE FROM keep_asins')
+            self.conn.executemany('INSERT OR IGNORE INTO keep_asins (asin) VALUES (?)', [(asin,) for asin in asins])
+            self.conn.execute('DELETE FROM products WHERE asin NOT IN (SELECT asin FROM keep_asins)')
+
+    def upsert_products(self, products: List[Dict], get_all_products: Optional[Callable[[], List[Dict]]] = None):
+        """商品を追加・更新（変更分のみ、1トランザクション）"""
+        with self.lock, self.conn:
+            next_position = self.conn.execute('SELECT COALESCE(MAX(position) + 1, 0) FROM products').fetchone()[0]
+            self._upsert(products, start_position=next_position, keep_position=True)
+
+    def _upsert(self, products: List[Dict], start_position: int, keep_position: bool = False):
+        """
+        商品をまとめてINSERT/UPDATE（呼び出し元でトランザクションを開始すること）
+
+        last_refreshed は商品自身の更新日時（GadgetProduct.last_refreshed）を使う。
+        更新日時のない商品は、既存の行の値を残す（新しい行の場合のみ現在日時）。
+        """
+        now = datetime.now().isoformat()
+        position_update = 'position' if keep_position else 'excluded.position'
+        self.conn.executemany(
+            f"""
+            INSERT INTO products (asin, position, name, category, data, last_refreshed)
+            VALUES (?, ?, ?, ?, ?, COALESCE(?, ?))
+            ON CONFLICT(asin) DO UPDATE SET
+                position = {position_update},
+                name = excluded.name,
+                category = excluded.category,
+                data = excluded.data,
+                last_refreshed = COALESCE(?, products.last_refreshed)
+            """,
+            [
+                (
+                    product['asin'],
+                    start_position + i,
+                    product.get('name', ''),
+                    product.get('category', ''),
+                    json.dumps(product, ensure_ascii=False),
+                    product.get('last_refreshed'),
+                    now,
+                    product.get('last_refreshed')
+                )
+                for i, product in enumerate(products)
+            ]
+        )
+
+    def load_metadata(self) -> Dict:
+        """メタデータを読み込み"""
+        rows = self.conn.execute('SELECT key, value FROM metadata').fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def save_metadata(self, metadata: Dict):
+        """メタデータを保存（全件置き換え）"""
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM metadata')
+            self.conn.executemany(
+                'INSERT INTO metadata (key, value) VALUES (?, ?)',
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in metadata.items()]
+            )
+
+    def create_posted_ledger(self) -> 'SQLitePostedLedger':
+        """投稿済み商品の台帳を作成"""
+        return SQLitePostedLedger(self)
+
+    def import_from_json(self, json_store: JsonProductStore) -> bool:
+        """
+        既存のJSONファイル（商品・投稿履歴・メタデータ）を一括で取り込む
+
+        Returns:
+            取り込んだ場合True（データベースが空でない場合は何もしない）
+        """
+        if not self.is_empty():
+            return False
+
+        try:
+            products = json_store.load_products()
+        except Exception as e:
+            print(f"商品データの読み込みに失敗: {e}")
+            products = []
+        ledger = json_store.create_posted_ledger()
+        metadata = json_store.load_metadata()
+
+        with self.lock, self.conn:
+            self._upsert(products, start_position=0)
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO posted (asin, posted_at, post_id) VALUES (?, ?, ?)',
+                [(asin, entry.get('posted_at'), entry.get('post_id')) for asin, entry in ledger.entries.items()]
+            )
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)',
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in metadata.items()]
+            )
+
+        print(f"✓ JSONファイルから商品{len(products)}件、投稿履歴{len(ledger)}件をSQLiteに取り込みました")
+        return True
+
+
+class SQLitePostedLedger(BasePostedLedger):
+    """SQLiteの posted テーブルを使う投稿済み商品の台帳（PostedLedger と同じインターフェース）"""
+
+    def __init__(self, store: SQLiteProductStore):
+        super().__init__()
+        self.store = store
+        self.load()
+
+    def load(self):
+        """投稿履歴を読み込み"""
+        rows = self.store.conn.execute(
+            'SELECT asin, posted_at, post_id FROM posted ORDER BY posted_at'
+        ).fetchall()
+        self.entries = {asin: {'posted_at': posted_at, 'post_id': post_id} for asin, posted_at, post_id in rows}
+
+    def add_many(self, asins: Iterable[str], post_id: Optional[int] = None) -> int:
+        """複数のASINをまとめて投稿済みとして記録（1トランザクション）"""
+        posted_at = datetime.now().isoformat()
+        asins = list(dict.fromkeys(asins))
+        new_count = sum(1 for asin in asins if asin not in self.entries)
+
+        with self.store.lock, self.store.conn:
+            self.store.conn.executemany(
+                'INSERT OR REPLACE INTO posted (asin, posted_at, post_id) VALUES (?, ?, ?)',
+                [(asin, posted_at, post_id) for asin in asins]
+            )
+        for asin in asins:
+            self.entries.pop(asin, None)
+            self.entries[asin] = {'posted_at': posted_at, 'post_id': post_id}
+        return new_count
+
+    def remove(self, asin: str):
+        """ASINを台帳から削除"""
+        with self.store.lock, self.store.conn:
+            self.store.conn.execute('DELETE FROM posted WHERE asin = ?', (asin,))
+        self.entries.pop(asin, None)
+
+    def clear(self):
+        """投稿履歴をすべて削除"""
+        with self.store.lock, self.store.conn:
+            self.store.conn.execute('DELETE FROM posted')
+        self.entries = {}
+
+    def compact(self):
+        """SQLiteでは書き込みごとにコミット済みのため何もしない"""
+        pass
@@ -0,0 +1,163 @@
+"""
+トークンバケット方式のレート制限
+429エラー時はAIMD（加算増加・乗算減少）でレートを調整し、
+状態ファイルを使う場合は同じホスト上の複数プロセスで予算を共有する
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Windowsなど fcntl がない環境ではプロセス間の共有を行わない
+    fcntl = None
+
+
+class TokenBucketRateLimiter:
+    """トークンバケット方式のレートリミッター"""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        min_rate: Optional[float] = None,
+        increase_step: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        state_file: Optional[str] = None
+    ):
+        """
+        初期化
+
+        Args:
+            rate: 1秒あたりのリクエスト数（上限）
+            burst: 連続して送信できるリクエスト数（バケットの容量）
+            min_rate: 429エラーで下げるレートの下限（省略時は rate の1/8）
+            increase_step: 成功時に戻すレートの増分（省略時は rate の1/10）
+            decrease_factor: 429エラー時にレートへ掛ける係数
+            state_file: 状態を共有するファイルのパス（Noneの場合はこのプロセス内のみ）
+        """
+        self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min_rate if min_rate is not None else rate / 8
+        self.increase_step = increase_step if increase_step is not None else rate / 10
+        self.decrease_factor = decrease_factor
+        self.state_file = state_file if fcntl else None
+        self.lock_file = self.state_file + '.lock' if self.state_file else None
+
+        self.rate = rate
+        self.tokens = burst
+        self.updated_at = time.time()
+        self.total_wait = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        トークンを1つ取得（足りない場合は待機）
+
+        Returns:
+            待機した秒数
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = self._try_consume()
+            if wait <= 0:
+                self.total_wait += waited
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def on_success(self):
+        """リクエスト成功時にレートを加算的に戻す"""
+        def recover():
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+        with self._lock:
+            self._update(recover)
+
+    def on_throttle(self):
+        """429エラー時にレートを乗算的に下げ、バケットを空にする"""
+        def throttle():
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self.tokens = 0.0
+
+        with self._lock:
+            self._update(throttle)
+        print(f"⚠ PA-APIのリクエスト間隔を{self.interval:.1f}秒に広げました")
+
+    def snapshot(self) -> Dict:
+        """現在の状態（チェックポイントへの保存用）"""
+        with self._lock:
+            return {'rate': self.rate, 'tokens': self.tokens, 'updated_at': self.updated_at}
+
+    def restore(self, state: Dict):
+        """保存した状態を復元（再開直後に予算を超えて送信しないようにする）"""
+        with self._lock:
+            self.rate = min(self.max_rate, max(self.min_rate, state.get('rate', self.rate)))
+            self.tokens = min(self.burst, state.get('tokens', self.tokens))
+            self.updated_at = state.get('updated_at', self.updated_at)
+
+    @property
+    def interval(self) -> float:
+        """現在のリクエスト間隔（秒）"""
+        return 1.0 / self.rate
+
+    def _refill(self, now: float):
+        """経過時間に応じてトークンを補充"""
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def _try_consume(self) -> float:
+        """トークンがあれば消費して0を、なければ必要な待機秒数を返す"""
+        result = {}
+
+        def consume():
+            self._refill(time.time())
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                result['wait'] = 0.0
+            else:
+                result['wait'] = (1.0 - self.tokens) / self.rate
+
+        self._update(consume)
+        return result['wait']
+
+    def _update(self, apply):
+        """状態を（ファイルを共有している場合はロックを取って）読み込み、更新して書き戻す"""
+        if not self.state_file:
+            apply()
+            return
+
+        os.makedirs(os.path.dirname(self.lock_file) or '.', exist_ok=True)
+        with open(self.lock_file, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._load_state()
+                apply()
+                self._save_state()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _load_state(self):
+        """共有状態を読み込み"""
+        if not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state: Dict = json.load(f)
+            self.rate = min(self.max_rate, max(self.min_rate, state.get('rate', self.rate)))
+            self.tokens = min(self.burst, state.get('tokens', self.tokens))
+            self.updated_at = state.get('updated_at', self.updated_at)
+        except Exception as e:
+            print(f"レート制限の状態の読み込みに失敗: {e}")
+
+    def _save_state(self):
+        """共有状態を書き込み（ロック取得中に呼ぶ）"""
+        tmp_file = self.state_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'rate': self.rate, 'tokens': self.tokens, 'updated_at': self.updated_at}, f)
+        os.replace(tmp_file, self.state_file)
@@ -0,0 +1,130 @@
+"""
+商品データ更新のチェックポイント
+リクエストごとに進捗（検索済みのカテゴリー・キーワード、取得済みの商品、レート制限の状態）を保存し、
+中断した更新を続きから再開できるようにする
+"""
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from amazon_scraper import GadgetProduct
+from file_utils import write_json_atomic
+
+
+class RefreshCheckpoint:
+    """商品データ更新の進捗"""
+
+    def __init__(self, checkpoint_file: str):
+        """
+        初期化
+
+        Args:
+            checkpoint_file: チェックポイントを保存するJSONファイルのパス
+        """
+        self.checkpoint_file = checkpoint_file
+        self.reset()
+
+    def reset(self):
+        """進捗を初期状態にする"""
+        self.started_at = datetime.now().isoformat()
+        self.completed: Dict[str, None] = {}  # 検索済みの「カテゴリー\tキーワード」（検索順）
+        self.products: Dict[str, Dict] = {}  # ASIN -> 商品データ（取得順）
+        self.total_requests = 0  # 実際にPA-APIを呼び出した回数（キャッシュヒットは含まない）
+        self.elapsed_seconds = 0.0
+        self.limiter_state: Optional[Dict] = None
+
+    def load(self) -> bool:
+        """
+        チェックポイントを読み込み
+
+        Returns:
+            前回の進捗がある場合True
+        """
+        if not os.path.exists(self.checkpoint_file):
+            return False
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('finished_at'):
+                # 前回の更新は完了している
+                return False
+            self.started_at = data['started_at']
+            self.completed = dict.fromkeys(data.get('completed', []))
+            self.products = {item['asin']: item for item in data.get('products', [])}
+            self.total_requests = data.get('total_requests', 0)
+            self.elapsed_seconds = data.get('elapsed_seconds', 0.0)
+            self.limiter_state = data.get('limiter_state')
+            return True
+        except Exception as e:
+            print(f"チェックポイントの読み込みに失敗しました（最初から実行します）: {e}")
+            self.reset()
+            return False
+
+    def save(self):
+        """チェックポイントをアトミックに保存"""
+        write_json_atomic(self.checkpoint_file, {
+            'started_at': self.started_at,
+            'completed': list(self.completed),
+            'products': list(self.products.values()),
+            'total_requests': self.total_requests,
+            'elapsed_seconds': self.elapsed_seconds,
+            'limiter_state': self.limiter_state
+        })
+
+    def finish(self):
+        """
+        更新の完了を記録（更新の完了後に呼ぶ）
+
+        ファイルを削除せず完了済みとして残すことで、CIのキャッシュから古い進捗が復元されても再開しない。
+        """
+        write_json_atomic(self.checkpoint_file, {'finished_at': datetime.now().isoformat()})
+        self.reset()
+
+    @staticmethod
+    def _key(category: str, keyword: str) -> str:
+        return f"{category}\t{keyword}"
+
+    def is_done(self, category: str, keyword: str) -> bool:
+        """カテゴリー・キーワードが検索済みかどうか"""
+        return self._key(category, keyword) in self.completed
+
+    def record(
+        self,
+        category: str,
+        keyword: str,
+        products: List[GadgetProduct],
+        elapsed_seconds: float,
+        limiter_state: Optional[Dict] = None,
+        api_calls: int = 1
+    ) -> int:
+        """
+        1回の検索結果を記録して保存
+
+        Args:
+            category: 検索したカテゴリー
+            keyword: 検索したキーワード
+            products: 検索結果
+            elapsed_seconds: これまでの所要時間（秒、前回までの実行を含む）
+            limiter_state: レートリミッターの状態
+            api_calls: この検索でPA-APIを呼び出した回数（キャッシュから返した場合は0）
+
+        Returns:
+            新たに追加した商品の数
+        """
+        added = 0
+        for product in products:
+            if product.asin not in self.products:
+                self.products[product.asin] = product.to_dict()
+                added += 1
+
+        self.completed[self._key(category, keyword)] = None
+        self.total_requests += api_calls
+        self.elapsed_seconds = elapsed_seconds
+        self.limiter_state = limiter_state
+        self.save()
+        return added
+
+    def get_products(self) -> List[GadgetProduct]:
+        """取得済みの商品（取得順）"""
+        return [GadgetProduct(**item) for item in self.products.values()]
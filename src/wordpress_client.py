@@ -1,14 +1,56 @@
 import requests
+from requests.adapters import HTTPAdapter
 import base64
+import hashlib
+import html
 import json
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import os
+import tempfile
+import threading
+
+from file_utils import write_json_atomic
+from media_cache import MediaCache
+
+if TYPE_CHECKING:
+    from amazon_scraper import GadgetProduct
 
 
 class WordPressClient:
     """WordPress REST API クライアント"""
 
-    def __init__(self, site_url: str, username: str, app_password: str):
+    # SEOプラグインごとのメタキー（title, description, keywords の順）
+    SEO_META_KEYS = {
+        'Yoast SEO': ('_yoast_wpseo_title', '_yoast_wpseo_metadesc', '_yoast_wpseo_focuskw'),
+        'Rank Math': ('rank_math_title', 'rank_math_description', 'rank_math_focus_keyword'),
+        'AIOSEO': ('_aioseo_title', '_aioseo_description', '_aioseo_keywords'),
+    }
+
+    # 画像ダウンロード時のチャンクサイズ（バイト）
+    MEDIA_CHUNK_SIZE = 64 * 1024
+
+    # 画像を並行してアップロードする際の最大スレッド数
+    MEDIA_UPLOAD_WORKERS = 4
+
+    # 登録済みメタキーの取得に失敗した後、再取得を控える時間（秒）
+    META_KEYS_RETRY_INTERVAL = 600.0
+
+    def __init__(
+        self,
+        site_url: str,
+        username: str,
+        app_password: str,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 2,
+        taxonomy_ttl: float = 3600.0,
+        taxonomy_cache_file: Optional[str] = None,
+        media_cache_file: Optional[str] = None
+    ):
         """
         初期化
 
@@ -16,6 +58,14 @@ class WordPressClient:
             site_url: WordPressサイトのURL（例: https://wwnaoya.com）
             username: WordPressユーザー名
             app_password: WordPress Application Password
+            pool_connections: コネクションプールを保持するホスト数
+            pool_maxsize: 1ホストあたりの最大同時接続数
+            connect_timeout: 接続タイムアウト（秒）
+            read_timeout: 読み込みタイムアウト（秒）
+            max_retries: 接続エラー時のリトライ回数
+            taxonomy_ttl: カテゴリー・タグのインデックスの有効期間（秒）
+            taxonomy_cache_file: インデックスのスナップショット保存先（省略時はメモリのみ）
+            media_cache_file: アップロード済みメディアのキャッシュ保存先（省略時はメモリのみ）
         """
         self.site_url = site_url.rstrip('/')
         self.api_url = f"{self.site_url}/wp-json/wp/v2"
@@ -33,6 +83,23 @@ class WordPressClient:
             'User-Agent': 'WordPress-Automation/1.0'
         }
 
+        # Keep-Alive付きのセッション（同一ホストへの接続を使い回してTLSハンドシェイクを削減）
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.session = self._create_session(pool_connections, pool_maxsize, max_retries)
+
+        # REST APIに登録済みのメタキー（初回参照時に取得）
+        self._registered_meta_keys: Optional[set] = None
+        self._meta_keys_failed_at: Optional[float] = None  # 取得に失敗した時刻（再取得を控える）
+
+        # カテゴリー・タグの「名前→ID」インデックス（taxonomy -> {fetched_at, index}）
+        self.taxonomy_ttl = taxonomy_ttl
+        self.taxonomy_cache_file = taxonomy_cache_file
+        self._taxonomy_cache: Dict[str, Dict] = {}
+        self._taxonomy_lock = threading.RLock()
+
+        # アップロード済みメディア（画像URL・ハッシュ → メディアID）
+        self.media_cache = MediaCache(media_cache_file)
+
         print(f"認証情報デバッグ:")
         print(f"  サイトURL: {self.site_url}")
         print(f"  API URL: {self.api_url}")
@@ -40,6 +107,35 @@ class WordPressClient:
         print(f"  パスワード長: {len(self.app_password)}文字")
         print(f"  Authorization ヘッダー長: {len(token)}文字")
 
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int, max_retries: int) -> requests.Session:
+        """コネクションプールを持つHTTPセッションを作成"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'Connection': 'keep-alive'})
+        return session
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """共有セッション経由でリクエストを送信（タイムアウトを既定で付与）"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def close(self):
+        """セッションを閉じてプール内の接続を解放"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def test_connection(self) -> Dict:
         """REST API接続とユーザー権限をテスト"""
         print("\n=== WordPress REST API 診断 ===")
@@ -49,7 +145,7 @@ class WordPressClient:
             print("1. REST APIの可用性をチェック中...")
             base_endpoint = f"{self.site_url}/wp-json"
             print(f"   テストURL: {base_endpoint}")
-            base_response = requests.get(base_endpoint)
+            base_response = self._request('GET', base_endpoint)
 
             if base_response.status_code == 200:
                 print("   ✓ REST APIは有効です")
@@ -74,7 +170,7 @@ class WordPressClient:
         try:
             print("2. 認証をテスト中...")
             endpoint = f"{self.site_url}/wp-json/wp/v2/users/me"
-            response = requests.get(endpoint, headers=self.headers)
+            response = self._request('GET', endpoint, headers=self.headers)
 
             # レスポンス詳細を表示
             print(f"   リクエストURL: {endpoint}")
@@ -168,37 +264,15 @@ class WordPressClient:
             data['excerpt'] = excerpt
 
         # SEO情報の設定（meta フィールドに追加）
-        # Yoast SEO, Rank Math, All in One SEO に対応
-        if seo_title or seo_description or seo_keywords:
-            meta = {}
-
-            # Yoast SEO
-            if seo_title:
-                meta['_yoast_wpseo_title'] = seo_title
-            if seo_description:
-                meta['_yoast_wpseo_metadesc'] = seo_description
-            if seo_keywords:
-                meta['_yoast_wpseo_focuskw'] = seo_keywords
-
-            # Rank Math
-            if seo_title:
-                meta['rank_math_title'] = seo_title
-            if seo_description:
-                meta['rank_math_description'] = seo_description
-            if seo_keywords:
-                meta['rank_math_focus_keyword'] = seo_keywords
-
-            # All in One SEO (AIOSEO)
-            if seo_title:
-                meta['_aioseo_title'] = seo_title
-            if seo_description:
-                meta['_aioseo_description'] = seo_description
-            if seo_keywords:
-                meta['_aioseo_keywords'] = seo_keywords
-
-            data['meta'] = meta
+        # Yoast SEO, Rank Math, All in One SEO に対応（サイトに登録済みのキーのみ送信）
+        seo_meta = self._filter_registered_meta(
+            self._build_seo_meta(seo_title, seo_description, seo_keywords)
+        )
+        if seo_meta:
+            data['meta'] = seo_meta
 
-        response = requests.post(
+        response = self._request(
+            'POST',
             endpoint,
             headers=self.headers,
             json=data
@@ -207,79 +281,129 @@ class WordPressClient:
 
         post_data = response.json()
 
-        # SEO情報を別途更新（メタフィールドとして保存）
-        if seo_title or seo_description or seo_keywords:
+        # 作成時に保存されなかったSEO情報のみ、1回のリクエストでまとめて更新
+        if seo_meta:
             post_id = post_data.get('id')
             if post_id:
-                self._update_seo_meta(post_id, seo_title, seo_description, seo_keywords)
+                self._update_seo_meta(post_id, seo_meta, post_data.get('meta'))
 
         return post_data
 
-    def _update_seo_meta(self, post_id: int, seo_title: str = None, seo_description: str = None, seo_keywords: str = None):
-        """投稿のSEOメタデータを更新（Yoast SEO, Rank Math, AIOSEO対応）"""
-        try:
-            # Yoast SEO用のメタデータ更新
+    def _build_seo_meta(self, seo_title: str = None, seo_description: str = None, seo_keywords: str = None) -> Dict:
+        """全SEOプラグイン向けのメタフィールド辞書を作成"""
+        meta = {}
+        for title_key, description_key, keywords_key in self.SEO_META_KEYS.values():
             if seo_title:
-                self._update_post_meta(post_id, '_yoast_wpseo_title', seo_title)
+                meta[title_key] = seo_title
             if seo_description:
-                self._update_post_meta(post_id, '_yoast_wpseo_metadesc', seo_description)
+                meta[description_key] = seo_description
             if seo_keywords:
-                self._update_post_meta(post_id, '_yoast_wpseo_focuskw', seo_keywords)
+                meta[keywords_key] = seo_keywords
+        return meta
 
-            # Rank Math用のメタデータ更新
-            if seo_title:
-                self._update_post_meta(post_id, 'rank_math_title', seo_title)
-            if seo_description:
-                self._update_post_meta(post_id, 'rank_math_description', seo_description)
-            if seo_keywords:
-                self._update_post_meta(post_id, 'rank_math_focus_keyword', seo_keywords)
+    def get_registered_meta_keys(self) -> Optional[set]:
+        """
+        投稿エンドポイントのスキーマからREST APIに登録済みのメタキーを取得
 
-            # AIOSEO用のメタデータ更新
-            if seo_title:
-                self._update_post_meta(post_id, '_aioseo_title', seo_title)
-            if seo_description:
-                self._update_post_meta(post_id, '_aioseo_description', seo_description)
-            if seo_keywords:
-                self._update_post_meta(post_id, '_aioseo_keywords', seo_keywords)
+        取得に失敗した場合は META_KEYS_RETRY_INTERVAL の間は問い合わせずにNoneを返す
+        （OPTIONSがブロックされているサイトで投稿のたびにリクエスト・警告を繰り返さない）
 
+        Returns:
+            登録済みメタキーの集合、判定できない場合はNone
+        """
+        if self._registered_meta_keys is not None:
+            return self._registered_meta_keys
+        if (self._meta_keys_failed_at is not None
+                and time.time() - self._meta_keys_failed_at < self.META_KEYS_RETRY_INTERVAL):
+            return None
+
+        try:
+            response = self._request('OPTIONS', f"{self.api_url}/posts", headers=self.headers)
+            response.raise_for_status()
+            schema = response.json().get('schema', {})
+            meta_schema = schema.get('properties', {}).get('meta', {})
+            self._registered_meta_keys = set(meta_schema.get('properties', {}).keys())
+            return self._registered_meta_keys
+        except Exception as e:
+            print(f"  ⚠ 登録済みメタキーの取得に失敗しました（全キーを送信します）: {e}")
+            self._meta_keys_failed_at = time.time()
+            return None
+
+    def _filter_registered_meta(self, meta: Dict) -> Dict:
+        """サイトに登録されているメタキーのみを残す（判定できない場合はそのまま）"""
+        if not meta:
+            return meta
+
+        registered = self.get_registered_meta_keys()
+        if registered is None:
+            return meta
+
+        filtered = {key: value for key, value in meta.items() if key in registered}
+        skipped = len(meta) - len(filtered)
+        if skipped:
+            print(f"  サイト未登録のSEOメタキー {skipped}件をスキップします")
+        return filtered
+
+    def _update_seo_meta(self, post_id: int, seo_meta: Dict, stored_meta: Optional[Dict] = None):
+        """
+        投稿のSEOメタデータを更新（Yoast SEO, Rank Math, AIOSEO対応）
+
+        Args:
+            post_id: 投稿ID
+            seo_meta: 保存したいメタフィールド
+            stored_meta: 作成レスポンスに含まれていたメタフィールド
+        """
+        stored_meta = stored_meta if isinstance(stored_meta, dict) else {}
+        pending = {key: value for key, value in seo_meta.items() if stored_meta.get(key) != value}
+
+        if not pending:
+            print("  ✓ SEOメタフィールドは投稿作成時に保存済みです")
+            return
+
+        try:
+            self._update_post_meta(post_id, pending)
         except Exception as e:
             print(f"警告: SEOメタデータの更新に失敗しました - {e}")
 
-    def _update_post_meta(self, post_id: int, meta_key: str, meta_value: str):
-        """投稿メタデータを更新"""
+    def _update_post_meta(self, post_id: int, meta: Dict):
+        """投稿メタデータを1回のリクエストでまとめて更新"""
         # WordPress REST APIのPUTメソッドを使用して投稿を更新
         endpoint = f"{self.api_url}/posts/{post_id}"
         data = {
-            'meta': {
-                meta_key: meta_value
-            }
+            'meta': meta
         }
+        meta_keys = ', '.join(meta.keys())
 
         try:
             # PUTメソッドを使用
-            response = requests.put(
+            response = self._request(
+                'PUT',
                 endpoint,
                 headers=self.headers,
                 json=data
             )
             # 成功した場合のみログ出力
             if response.status_code in [200, 201]:
-                print(f"  ✓ SEOメタフィールド {meta_key} を更新しました")
+                print(f"  ✓ SEOメタフィールド {meta_keys} を更新しました")
             else:
                 # エラーレスポンスの詳細を表示
-                print(f"  ⚠ メタフィールド {meta_key} の更新に失敗: HTTP {response.status_code}")
+                print(f"  ⚠ メタフィールド {meta_keys} の更新に失敗: HTTP {response.status_code}")
                 try:
                     error_detail = response.json()
                     print(f"    詳細: {error_detail.get('message', 'Unknown error')}")
                 except:
                     pass
         except Exception as e:
-            print(f"  ✗ メタフィールド {meta_key} の更新エラー: {e}")
+            print(f"  ✗ メタフィールド {meta_keys} の更新エラー: {e}")
 
     def upload_media(self, image_url: str, filename: str) -> Dict:
         """
         メディアライブラリに画像をアップロード
 
+        同じ画像URL・同じ内容の画像がアップロード済みの場合は、ダウンロードもアップロードも行わず
+        キャッシュ済みのメディア情報（id, source_url）を返す
+        （WordPress側で削除されていた場合はキャッシュから除外してアップロードし直す）
+
         Args:
             image_url: 画像のURL
             filename: ファイル名
@@ -287,36 +411,146 @@ class WordPressClient:
         Returns:
             アップロードされたメディアの情報
         """
-        # 画像をダウンロード
-        img_response = requests.get(image_url)
-        img_response.raise_for_status()
+        cached = self.media_cache.get_by_url(image_url)
+        if cached and self._media_exists(cached['id']):
+            print(f"  ✓ アップロード済みの画像を再利用します (メディアID: {cached['id']})")
+            return dict(cached, cached=True)
+
+        # 画像をチャンク単位でダウンロードし、ハッシュを計算しながら一時ファイルへ書き出す
+        # （画像全体をメモリに保持しない）
+        with tempfile.TemporaryFile() as spool:
+            with self._request('GET', image_url, stream=True) as img_response:
+                img_response.raise_for_status()
+
+                # Content-Typeを適切に設定
+                content_type = img_response.headers.get('Content-Type', 'image/jpeg')
+
+                digest = hashlib.sha256()
+                for chunk in img_response.iter_content(chunk_size=self.MEDIA_CHUNK_SIZE):
+                    digest.update(chunk)
+                    spool.write(chunk)
+
+            content_hash = digest.hexdigest()
+
+            # 別のURLでも内容が同じ画像はアップロード済みのメディアを使い回す
+            cached = self.media_cache.get_by_hash(content_hash)
+            if cached and self._media_exists(cached['id']):
+                self.media_cache.add_url(image_url, content_hash)
+                print(f"  ✓ 同一内容の画像を再利用します (メディアID: {cached['id']})")
+                return dict(cached, cached=True)
+
+            endpoint = f"{self.api_url}/media"
+
+            headers = {
+                'Authorization': self.headers['Authorization'],
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'Content-Type': content_type
+            }
 
-        endpoint = f"{self.api_url}/media"
+            # ファイルオブジェクトを渡すとContent-Length付きでストリーミング送信される
+            spool.seek(0)
+            response = self._request(
+                'POST',
+                endpoint,
+                headers=headers,
+                data=spool
+            )
+            response.raise_for_status()
 
-        # Content-Typeを適切に設定
-        content_type = img_response.headers.get('Content-Type', 'image/jpeg')
+        media = response.json()
+        self.media_cache.add(image_url, content_hash, media)
 
-        headers = {
-            'Authorization': self.headers['Authorization'],
-            'Content-Disposition': f'attachment; filename="{filename}"',
-            'Content-Type': content_type
-        }
+        return media
 
-        response = requests.post(
-            endpoint,
-            headers=headers,
-            data=img_response.content
-        )
-        response.raise_for_status()
+    def upload_media_many(self, images: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[Optional[Dict]]:
+        """
+        複数の画像をスレッドプールで並行してアップロード（アップロード済みの画像はキャッシュを利用）
 
-        return response.json()
+        Args:
+            images: (画像URL, ファイル名) のリスト
+            max_workers: 同時にアップロードする最大数（省略時は MEDIA_UPLOAD_WORKERS）
+
+        Returns:
+            アップロード結果のリスト（入力と同じ順序、失敗した画像はNone）
+        """
+        if not images:
+            return []
+
+        def upload(image: Tuple[str, str]) -> Optional[Dict]:
+            image_url, filename = image
+            try:
+                return self.upload_media(image_url, filename)
+            except Exception as e:
+                print(f"⚠ 画像のアップロードに失敗: {image_url} - {e}")
+                return None
+
+        workers = min(max_workers or self.MEDIA_UPLOAD_WORKERS, len(images))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='wp-media') as executor:
+            return list(executor.map(upload, images))
+
+    def upload_product_images(self, variants: List['GadgetProduct']) -> Dict[str, Optional[Dict]]:
+        """
+        製品の全バリエーション画像を並行してアップロード
+        同じ画像URLを共有するバリエーションは1回だけアップロードする
+
+        Args:
+            variants: 同一製品のバリエーションリスト
+
+        Returns:
+            ASIN -> メディア情報（画像なし・失敗時はNone）
+        """
+        unique_images = {}
+        for variant in variants:
+            if variant.image_url and variant.image_url not in unique_images:
+                unique_images[variant.image_url] = f"{variant.asin}.jpg"
+
+        images = list(unique_images.items())
+        uploaded = self.upload_media_many(images)
+        media_by_url = {image_url: media for (image_url, _), media in zip(images, uploaded)}
+
+        return {variant.asin: media_by_url.get(variant.image_url) for variant in variants}
+
+    def _media_exists(self, media_id: int) -> bool:
+        """
+        キャッシュ済みのメディアがWordPressに残っているか確認（削除されていればキャッシュから除外）
+
+        Returns:
+            メディアが存在する場合True（確認できなかった場合もTrueとして再利用する）
+        """
+        try:
+            response = self._request('GET', f"{self.api_url}/media/{media_id}", params={'_fields': 'id'})
+        except Exception as e:
+            print(f"  メディアの確認に失敗: {e}")
+            return True
+
+        if response.status_code in (404, 410):
+            print(f"  ⚠ メディアID {media_id} は削除されているため、アップロードし直します")
+            self.media_cache.invalidate(media_id)
+            return False
+        return True
+
+    def _get_all_terms(self, taxonomy: str) -> List[Dict]:
+        """タクソノミー（categories / tags）の全ページを取得"""
+        endpoint = f"{self.api_url}/{taxonomy}"
+        terms = []
+        page = 1
+
+        while True:
+            params = {'per_page': 100, 'page': page, 'hide_empty': 'false'}
+            response = self._request('GET', endpoint, headers=self.headers, params=params)
+            response.raise_for_status()
+            terms.extend(response.json())
+
+            total_pages = int(response.headers.get('X-WP-TotalPages', 1) or 1)
+            if page >= total_pages:
+                break
+            page += 1
+
+        return terms
 
     def get_categories(self) -> List[Dict]:
-        """カテゴリー一覧を取得"""
-        endpoint = f"{self.api_url}/categories"
-        response = requests.get(endpoint, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        """カテゴリー一覧を取得（全ページ）"""
+        return self._get_all_terms('categories')
 
     def create_category(self, name: str, description: str = "") -> Dict:
         """
@@ -335,7 +569,8 @@ class WordPressClient:
             'description': description
         }
 
-        response = requests.post(
+        response = self._request(
+            'POST',
             endpoint,
             headers=self.headers,
             json=data
@@ -346,29 +581,27 @@ class WordPressClient:
 
     def get_or_create_category(self, name: str) -> int:
         """カテゴリーを取得または作成してIDを返す"""
-        categories = self.get_categories()
+        index = self._get_taxonomy_index('categories')
 
-        for cat in categories:
-            if cat['name'].lower() == name.lower():
-                return cat['id']
+        term_id = index.get(self._normalize_term_name(name))
+        if term_id:
+            return term_id
 
         # カテゴリーが存在しない場合は作成
-        new_cat = self.create_category(name)
+        new_cat = self._create_term_or_get_existing('categories', self.create_category, name)
         return new_cat['id']
 
     def get_tags(self) -> List[Dict]:
-        """タグ一覧を取得"""
-        endpoint = f"{self.api_url}/tags"
-        response = requests.get(endpoint, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        """タグ一覧を取得（全ページ）"""
+        return self._get_all_terms('tags')
 
     def create_tag(self, name: str) -> Dict:
         """新しいタグを作成"""
         endpoint = f"{self.api_url}/tags"
         data = {'name': name}
 
-        response = requests.post(
+        response = self._request(
+            'POST',
             endpoint,
             headers=self.headers,
             json=data
@@ -379,23 +612,130 @@ class WordPressClient:
 
     def get_or_create_tags(self, tag_names: List[str]) -> List[int]:
         """タグを取得または作成してIDリストを返す"""
-        existing_tags = self.get_tags()
+        index = self._get_taxonomy_index('tags')
         tag_ids = []
 
         for tag_name in tag_names:
-            found = False
-            for tag in existing_tags:
-                if tag['name'].lower() == tag_name.lower():
-                    tag_ids.append(tag['id'])
-                    found = True
-                    break
-
-            if not found:
-                new_tag = self.create_tag(tag_name)
-                tag_ids.append(new_tag['id'])
+            term_id = index.get(self._normalize_term_name(tag_name))
+            if not term_id:
+                new_tag = self._create_term_or_get_existing('tags', self.create_tag, tag_name)
+                term_id = new_tag['id']
+            tag_ids.append(term_id)
 
         return tag_ids
 
+    @staticmethod
+    def _normalize_term_name(name: str) -> str:
+        """ターム名を比較用に正規化（REST APIはHTMLエスケープ済みの名前を返すため復元する）"""
+        return html.unescape(name).strip().lower()
+
+    def _get_taxonomy_index(self, taxonomy: str) -> Dict[str, int]:
+        """
+        タクソノミーの「名前（小文字）→ID」インデックスを取得
+
+        メモリ上のインデックスがTTL内ならそれを使い、なければスナップショット、
+        それもなければREST APIから全ページを取得して構築する
+        """
+        with self._taxonomy_lock:
+            cached = self._taxonomy_cache.get(taxonomy)
+            if cached and time.time() - cached['fetched_at'] < self.taxonomy_ttl:
+                return cached['index']
+
+            snapshot = self._load_taxonomy_snapshot(taxonomy)
+            if snapshot is not None:
+                self._taxonomy_cache[taxonomy] = snapshot
+                return snapshot['index']
+
+        terms = self._get_all_terms(taxonomy)
+        index = {self._normalize_term_name(term['name']): term['id'] for term in terms}
+
+        with self._taxonomy_lock:
+            self._taxonomy_cache[taxonomy] = {'fetched_at': time.time(), 'index': index}
+            print(f"  ✓ {taxonomy} を{len(index)}件取得しました")
+            self._save_taxonomy_snapshot()
+
+        return index
+
+    def _add_to_taxonomy_index(self, taxonomy: str, term: Dict):
+        """作成したタームをインデックスに反映"""
+        with self._taxonomy_lock:
+            cached = self._taxonomy_cache.get(taxonomy)
+            if cached is None:
+                return
+            cached['index'][self._normalize_term_name(term['name'])] = term['id']
+            self._save_taxonomy_snapshot()
+
+    def _create_term_or_get_existing(self, taxonomy: str, create_func, name: str) -> Dict:
+        """タームを作成（既に存在する場合は既存のIDを返す）"""
+        try:
+            term = create_func(name)
+        except requests.exceptions.HTTPError as e:
+            # 他プロセスが先に作成していた場合は term_exists エラーになる
+            try:
+                error_data = e.response.json()
+            except Exception:
+                raise e
+            if error_data.get('code') != 'term_exists':
+                raise
+            term_id = (error_data.get('data') or {}).get('term_id')
+            if not term_id:
+                # 既存タームのIDが分からない場合はインデックスに登録せず失敗として扱う
+                raise
+            term = {'id': term_id, 'name': name}
+
+        self._add_to_taxonomy_index(taxonomy, term)
+        return term
+
+    def _read_taxonomy_snapshot(self) -> Dict[str, Dict]:
+        """ディスク上のスナップショットからこのサイトのタクソノミーを読み込み（ない場合・別サイトの場合は空）"""
+        if not self.taxonomy_cache_file or not os.path.exists(self.taxonomy_cache_file):
+            return {}
+
+        try:
+            with open(self.taxonomy_cache_file, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            print(f"タクソノミーキャッシュの読み込みに失敗: {e}")
+            return {}
+
+        if snapshot.get('site_url') != self.site_url:
+            return {}
+
+        return snapshot.get('taxonomies', {})
+
+    def _load_taxonomy_snapshot(self, taxonomy: str) -> Optional[Dict]:
+        """ディスク上のスナップショットからインデックスを読み込み（TTL切れ・別サイトの場合はNone）"""
+        entry = self._read_taxonomy_snapshot().get(taxonomy)
+        if not entry or time.time() - entry.get('fetched_at', 0) >= self.taxonomy_ttl:
+            return None
+
+        return {'fetched_at': entry['fetched_at'], 'index': dict(entry.get('index', {}))}
+
+    def _save_taxonomy_snapshot(self):
+        """インデックスをディスクに保存（このプロセスで読み込んでいないタクソノミーは既存のファイルの内容を残す）"""
+        if not self.taxonomy_cache_file:
+            return
+
+        # 呼び出し元で _taxonomy_lock を保持していること
+        taxonomies = self._read_taxonomy_snapshot()
+        taxonomies.update(self._taxonomy_cache)
+        snapshot = {
+            'site_url': self.site_url,
+            'taxonomies': taxonomies
+        }
+
+        try:
+            write_json_atomic(self.taxonomy_cache_file, snapshot)
+        except Exception as e:
+            print(f"タクソノミーキャッシュの保存に失敗: {e}")
+
+    def clear_taxonomy_cache(self):
+        """タクソノミーインデックスを破棄（次回参照時に再取得）"""
+        with self._taxonomy_lock:
+            self._taxonomy_cache = {}
+        if self.taxonomy_cache_file and os.path.exists(self.taxonomy_cache_file):
+            os.remove(self.taxonomy_cache_file)
+
     def get_latest_post(self) -> Optional[Dict]:
         """
         最新の投稿を1件取得
@@ -411,7 +751,7 @@ class WordPressClient:
                 'order': 'desc',
                 'status': 'publish'
             }
-            response = requests.get(url, params=params)
+            response = self._request('GET', url, params=params)
             response.raise_for_status()
 
             posts = response.json()
@@ -426,7 +766,7 @@ class WordPressClient:
                 # アイキャッチ画像のURLを取得
                 if result['featured_media'] > 0:
                     media_url = f"{self.api_url}/media/{result['featured_media']}"
-                    media_response = requests.get(media_url)
+                    media_response = self._request('GET', media_url)
                     if media_response.status_code == 200:
                         media_data = media_response.json()
                         result['featured_image_url'] = media_data.get('source_url', '')